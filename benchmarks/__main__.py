@@ -0,0 +1,105 @@
+"""
+Benchmark Command Line Interface
+
+Usage:
+    python -m benchmarks run [--sizes N ...] [-a ALGORITHM ...] [-g GENERATOR ...]
+                             [--seed SEED] [-q QUANTUM] [--repeat N] [--time-budget SECONDS]
+                             [-o PATH]
+    python -m benchmarks compare BASELINE CURRENT [--threshold RATIO]
+
+run writes its results as JSON (to stdout by default) and logs progress to
+stderr. compare prints the time and memory ratios of the cases measured in
+both files and exits with status 1 when any case got slower than the
+threshold.
+"""
+
+import argparse
+import json
+import sys
+
+from scheduling.algorithms import ALGORITHMS
+
+from .generators import GENERATORS
+from .suite import (
+    DEFAULT_SIZES, DEFAULT_TIME_BUDGET, DEFAULT_TIME_QUANTUM, compare_results, load_results, run_benchmarks
+)
+
+
+def _log_result(result):
+    if result["skipped"]:
+        timing = "skipped (projected over time budget)"
+    else:
+        timing = f"{result['seconds']:.4f} s, peak {result['peak_bytes'] / 1024:.0f} KiB"
+    print(f"{result['generator']:<13}{result['algorithm']:<21}{result['processes_count']:>9}  {timing}",
+          file=sys.stderr)
+
+
+def run_command(args):
+    report = run_benchmarks(
+        args.sizes, args.algorithms, args.generators, args.seed,
+        args.time_quantum, args.repeat, args.time_budget, _log_result
+    )
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    return 0
+
+
+def compare_command(args):
+    rows = compare_results(load_results(args.baseline), load_results(args.current))
+    regressions = 0
+    print(f"{'Generator':<13}{'Algorithm':<21}{'N':>9}{'Before':>11}{'After':>11}{'Time':>8}{'Memory':>8}")
+    for generator, algorithm, processes_count, before, after, time_ratio, memory_ratio in rows:
+        flag = ""
+        if time_ratio > args.threshold:
+            flag = "  slower"
+            regressions += 1
+        print(f"{generator:<13}{algorithm:<21}{processes_count:>9}{before:>11.4f}{after:>11.4f}"
+              f"{time_ratio:>7.2f}x{memory_ratio:>7.2f}x{flag}")
+    return 1 if regressions else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the scheduling algorithms.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmark suite")
+    run_parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES, metavar="N",
+                            help="numbers of processes (default: %(default)s)")
+    run_parser.add_argument("-a", "--algorithms", nargs="+", choices=ALGORITHMS, metavar="ALGORITHM",
+                            help="algorithms to benchmark (default: all)")
+    run_parser.add_argument("-g", "--generators", nargs="+", choices=GENERATORS, metavar="GENERATOR",
+                            help=f"workload generators (default: all of {', '.join(GENERATORS)})")
+    run_parser.add_argument("--seed", type=int, default=0, help="seed of the generated workloads")
+    run_parser.add_argument("-q", "--time-quantum", type=int, default=DEFAULT_TIME_QUANTUM,
+                            help="time quantum for rr, cfs and mlfq (default: %(default)s)")
+    run_parser.add_argument("--repeat", type=int, default=3, help="timed runs per case (default: %(default)s)")
+    run_parser.add_argument("--time-budget", type=float, default=DEFAULT_TIME_BUDGET, metavar="SECONDS",
+                            help="skip cases projected to take longer (default: %(default)s)")
+    run_parser.add_argument("-o", "--output", default="-", metavar="PATH", help="JSON results file ('-' for stdout)")
+    run_parser.set_defaults(handler=run_command)
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline", help="results of the baseline commit")
+    compare_parser.add_argument("current", help="results of the commit under test")
+    compare_parser.add_argument("--threshold", type=float, default=1.1,
+                                help="time ratio above which a case counts as slower (default: %(default)s)")
+    compare_parser.set_defaults(handler=compare_command)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return args.handler(args)
+    except (OSError, ValueError) as error:
+        parser.exit(2, f"error: {error}\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
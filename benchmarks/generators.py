@@ -0,0 +1,93 @@
+"""
+Workload Generators
+Seeded synthetic workloads for benchmarking the schedulers.
+
+Every generator takes the number of processes and a seed and returns a
+Workload, so the same (generator, n, seed) always produces the same
+processes. Bursts average MEAN_BURST_TIME and arrivals are spread so the
+CPU is busy about LOAD of the time, which keeps the ready queues at a
+realistic length instead of growing with n.
+"""
+
+import numpy as np
+
+from scheduling.process import Workload
+
+# Average burst time of the generated processes
+MEAN_BURST_TIME = 10
+
+# Fraction of time the CPU would be busy if arrivals were perfectly spread
+LOAD = 0.9
+
+# Average number of processes arriving together in a bursty workload
+CLUSTER_SIZE = 50
+
+# Highest priority level assigned to generated processes
+MAX_PRIORITY = 10
+
+
+def _workload(rng, arrival_times, burst_times):
+    """Pack the generated columns into a Workload, with PIDs in arrival order and random priorities."""
+    processes_count = len(burst_times)
+    order = np.argsort(arrival_times, kind="stable")
+    columns = np.stack([
+        np.arange(1, processes_count + 1),
+        np.asarray(arrival_times)[order],
+        np.asarray(burst_times)[order],
+        rng.integers(1, MAX_PRIORITY + 1, processes_count),
+    ]).astype(np.int64)
+    return Workload.from_buffer(columns.tobytes(), processes_count)
+
+
+def _uniform_bursts(rng, processes_count):
+    return rng.integers(1, 2 * MEAN_BURST_TIME, processes_count)
+
+
+def _poisson_arrivals(rng, processes_count, mean_gap=MEAN_BURST_TIME / LOAD):
+    return np.cumsum(rng.exponential(mean_gap, processes_count)).astype(np.int64)
+
+
+def uniform(processes_count, seed=0):
+    """Arrival times and burst times drawn uniformly."""
+    rng = np.random.default_rng(seed)
+    horizon = int(processes_count * MEAN_BURST_TIME / LOAD)
+    return _workload(rng, rng.integers(0, horizon + 1, processes_count), _uniform_bursts(rng, processes_count))
+
+
+def poisson(processes_count, seed=0):
+    """Poisson arrivals (exponential gaps between arrivals) with uniform burst times."""
+    rng = np.random.default_rng(seed)
+    return _workload(rng, _poisson_arrivals(rng, processes_count), _uniform_bursts(rng, processes_count))
+
+
+def heavy_tailed(processes_count, seed=0):
+    """Poisson arrivals with Pareto burst times: mostly short jobs and a few very long ones."""
+    rng = np.random.default_rng(seed)
+    # Pareto with shape 1.5 has mean 3 * scale, so scale it to MEAN_BURST_TIME
+    burst_times = (rng.pareto(1.5, processes_count) + 1) * (MEAN_BURST_TIME / 3)
+    burst_times = np.clip(burst_times, 1, 1000 * MEAN_BURST_TIME).astype(np.int64)
+    return _workload(rng, _poisson_arrivals(rng, processes_count), burst_times)
+
+
+def bursty(processes_count, seed=0):
+    """Clusters of about CLUSTER_SIZE processes arriving within a few time units of each other."""
+    rng = np.random.default_rng(seed)
+    cluster_count = max(processes_count // CLUSTER_SIZE, 1)
+    cluster_starts = _poisson_arrivals(rng, cluster_count, CLUSTER_SIZE * MEAN_BURST_TIME / LOAD)
+    arrival_times = cluster_starts[rng.integers(0, cluster_count, processes_count)] + rng.integers(0, 3, processes_count)
+    return _workload(rng, arrival_times, _uniform_bursts(rng, processes_count))
+
+
+def all_at_zero(processes_count, seed=0):
+    """Every process arrives at time 0, with uniform burst times."""
+    rng = np.random.default_rng(seed)
+    return _workload(rng, np.zeros(processes_count, dtype=np.int64), _uniform_bursts(rng, processes_count))
+
+
+GENERATORS = {
+    "uniform": uniform,
+    "poisson": poisson,
+    "heavy_tailed": heavy_tailed,
+    "bursty": bursty,
+    "all_at_zero": all_at_zero,
+}
@@ -0,0 +1,156 @@
+"""
+Benchmark Suite
+Times every scheduling algorithm on every generated workload at growing
+sizes and records the peak memory of each run.
+
+Each case is timed best-of-N with time.perf_counter, then run once more
+under tracemalloc for its peak allocation, so tracing never slows the
+timed runs. A case is recorded as skipped instead of run when the time of
+the previous size, scaled linearly to the new size, exceeds the time
+budget, which keeps quadratic algorithms from stalling the suite.
+"""
+
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from scheduling.algorithms import ALGORITHMS, TIME_QUANTUM_ALGORITHMS, schedule
+
+from .generators import GENERATORS
+
+# Numbers of processes benchmarked by default
+DEFAULT_SIZES = (100, 1_000, 10_000, 100_000, 1_000_000)
+
+# Time quantum used for Round Robin
+DEFAULT_TIME_QUANTUM = 4
+
+# Seconds a run is projected to take above which it is skipped
+DEFAULT_TIME_BUDGET = 30.0
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def measure(workload, algorithm, time_quantum=None, repeat=3):
+    """
+    Time one algorithm on one workload and measure its peak memory.
+
+    Returns:
+        tuple: Best wall-clock seconds over repeat runs and the tracemalloc peak in bytes
+    """
+    seconds = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        schedule(workload, algorithm, time_quantum)
+        seconds = min(seconds, time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        schedule(workload, algorithm, time_quantum)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, peak_bytes
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, algorithms=None, generators=None, seed=0,
+                   time_quantum=DEFAULT_TIME_QUANTUM, repeat=3, time_budget=DEFAULT_TIME_BUDGET, log=None):
+    """
+    Run every (generator, algorithm, size) case.
+
+    Args:
+        sizes: Numbers of processes to benchmark
+        algorithms: Algorithm names, all of ALGORITHMS by default
+        generators: Generator names, all of GENERATORS by default
+        seed: Seed passed to every generator
+        time_quantum: Time quantum for Round Robin, CFS and MLFQ
+        repeat: Timed runs per case, the fastest is reported
+        time_budget: Projected seconds above which a case is skipped
+        log: Optional callable receiving each result as it is measured
+
+    Returns:
+        dict: Contains meta (environment and settings) and results, one dict
+        per case with generator, algorithm, processes_count, seconds,
+        peak_bytes and skipped (seconds and peak_bytes are None when skipped)
+    """
+    algorithms = algorithms or list(ALGORITHMS)
+    generators = generators or list(GENERATORS)
+    for name in algorithms:
+        if name not in ALGORITHMS:
+            raise ValueError(f"Unknown scheduling algorithm: {name}")
+    for name in generators:
+        if name not in GENERATORS:
+            raise ValueError(f"Unknown workload generator: {name}")
+
+    results = []
+    for generator in generators:
+        # Seconds per process of each algorithm at the previous size
+        previous_rate = {}
+        for processes_count in sorted(sizes):
+            workload = GENERATORS[generator](processes_count, seed)
+            for algorithm in algorithms:
+                skipped = previous_rate.get(algorithm, 0.0) * processes_count > time_budget
+                result = {"generator": generator, "algorithm": algorithm, "processes_count": processes_count,
+                          "seconds": None, "peak_bytes": None, "skipped": skipped}
+                if skipped:
+                    previous_rate[algorithm] = float("inf")
+                else:
+                    quantum = time_quantum if algorithm in TIME_QUANTUM_ALGORITHMS else None
+                    result["seconds"], result["peak_bytes"] = measure(workload, algorithm, quantum, repeat)
+                    previous_rate[algorithm] = result["seconds"] / processes_count
+                results.append(result)
+                if log:
+                    log(result)
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "seed": seed,
+            "time_quantum": time_quantum,
+            "repeat": repeat,
+            "time_budget": time_budget,
+        },
+        "results": results,
+    }
+
+
+def _case_key(result):
+    return result["generator"], result["algorithm"], result["processes_count"]
+
+
+def compare_results(baseline, current):
+    """
+    Pair up the cases measured in both runs.
+
+    Returns:
+        list: (generator, algorithm, processes_count, baseline seconds,
+        current seconds, time ratio, memory ratio) tuples, ratios above 1
+        meaning the current run is slower or uses more memory
+    """
+    baseline_cases = {_case_key(result): result for result in baseline["results"] if not result["skipped"]}
+    rows = []
+    for result in current["results"]:
+        before = baseline_cases.get(_case_key(result))
+        if before is None or result["skipped"]:
+            continue
+        time_ratio = result["seconds"] / before["seconds"] if before["seconds"] else float("inf")
+        memory_ratio = result["peak_bytes"] / before["peak_bytes"] if before["peak_bytes"] else float("inf")
+        rows.append((*_case_key(result), before["seconds"], result["seconds"], time_ratio, memory_ratio))
+    return rows
+
+
+def load_results(path):
+    with open(path) as file:
+        return json.load(file)
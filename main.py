@@ -1,26 +1,351 @@
 import sys
-from scheduling.process import Process
-from scheduling.algorithms import (
-    first_come_first_serve, shortest_job_first, non_preemptive_priority, highest_response_ratio_next,
-    shortest_remaining_time_first, preemptive_priority, round_robin, calculate_averages
-)
+import math
+import threading
+from bisect import bisect_left, bisect_right
+import numpy as np
+from scheduling.process import ProcessTable, Workload
+from scheduling.algorithms import reschedule, result_cache, schedule
+from scheduling.cache import ScheduleCache, use_cache
+from scheduling.compare import format_sweep_report, sweep_time_quantum
+from scheduling.gantt import IDLE, IDLE_PID
+from scheduling.observers import ProgressReporter, ScheduleCancelled
+from scheduling.workload import parse_text, read_workload
 from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget, QTableWidget,
-    QTableWidgetItem, QLineEdit, QPushButton, QLabel, QScrollArea, QHeaderView
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget, QTableView,
+    QLineEdit, QPushButton, QLabel, QHeaderView, QMessageBox, QGraphicsView, QGraphicsScene, QProgressBar,
+    QFileDialog, QShortcut
+)
+from PyQt5.QtCore import (
+    Qt, QRectF, QLineF, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, pyqtSignal
 )
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont
+from PyQt5.QtGui import QFont, QColor, QPen, QFontMetrics, QKeySequence
+
+class GanttChartView(QGraphicsView):
+    """
+    Gantt chart widget that paints a GanttChart straight from its columns.
+    Only the time window inside the viewport is painted: one bar per visible
+    segment, or one bar per run of pixels when segments are narrower than a
+    pixel, so painting costs the same however long the schedule is.
+    Ctrl+wheel zooms around the cursor, the wheel and dragging pan, and
+    double-click fits the whole chart.
+    """
+
+    BAR_TOP = 6
+    BAR_HEIGHT = 34
+    AXIS_TOP = 46
+    MAX_PIXELS_PER_UNIT = 200.0
+    MAX_SCENE_WIDTH = 2 ** 30
+    MIN_TICK_SPACING = 70
+
+    def __init__(self):
+        super().__init__()
+        self.setScene(QGraphicsScene(self))
+        self.setDragMode(QGraphicsView.ScrollHandDrag)
+        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        self.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setStyleSheet("""
+            QGraphicsView {
+                border: 2px solid #ddd;
+                border-radius: 5px;
+                background-color: white;
+            }
+        """)
+        self.gantt = None
+        self.pixels_per_unit = 1.0
+        self.fitted = True
+        self.colors = {}
+
+    def set_chart(self, gantt):
+        # Show a new chart, fitted to the width of the view
+        self.gantt = gantt
+        self.fit()
+
+    def clear(self):
+        self.gantt = None
+        self.fit()
+
+    def _end_time(self):
+        return self.gantt.end_time if self.gantt is not None else 0
+
+    def _fit_pixels_per_unit(self):
+        end_time = self._end_time()
+        if not end_time:
+            return 1.0
+        return min(self.viewport().width() / end_time, self.MAX_PIXELS_PER_UNIT)
+
+    def _update_scene_rect(self):
+        width = max(self._end_time() * self.pixels_per_unit, self.viewport().width())
+        self.setSceneRect(0, 0, width, self.viewport().height())
+        self.viewport().update()
+
+    def fit(self):
+        self.fitted = True
+        self.pixels_per_unit = self._fit_pixels_per_unit()
+        self._update_scene_rect()
+        self.horizontalScrollBar().setValue(0)
+
+    def zoom(self, factor, anchor_x):
+        # Keep the time under anchor_x (viewport pixels) in place while zooming
+        scroll_bar = self.horizontalScrollBar()
+        anchor_time = (scroll_bar.value() + anchor_x) / self.pixels_per_unit
+        smallest = self._fit_pixels_per_unit()
+        largest = max(min(self.MAX_PIXELS_PER_UNIT, self.MAX_SCENE_WIDTH / max(self._end_time(), 1)), smallest)
+        self.pixels_per_unit = min(max(self.pixels_per_unit * factor, smallest), largest)
+        self.fitted = self.pixels_per_unit == smallest
+        self._update_scene_rect()
+        scroll_bar.setValue(round(anchor_time * self.pixels_per_unit - anchor_x))
+
+    def wheelEvent(self, event):
+        steps = event.angleDelta().y() / 120
+        if event.modifiers() & Qt.ControlModifier:
+            self.zoom(1.25 ** steps, event.pos().x())
+        else:
+            scroll_bar = self.horizontalScrollBar()
+            scroll_bar.setValue(scroll_bar.value() - round(steps * scroll_bar.pageStep() / 4))
+        event.accept()
+
+    def mouseDoubleClickEvent(self, event):
+        self.fit()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.fitted:
+            self.fit()
+        else:
+            self._update_scene_rect()
+
+    def _color(self, pid):
+        if pid == IDLE_PID:
+            return QColor("#eeeeee")
+        color = self.colors.get(pid)
+        if color is None:
+            # Golden angle hue steps keep neighbouring PIDs apart
+            color = QColor.fromHsv(int(pid * 137.508) % 360, 120, 235)
+            self.colors[pid] = color
+        return color
+
+    def _draw_bar(self, painter, metrics, left, right, pid):
+        rect = QRectF(left, self.BAR_TOP, right - left, self.BAR_HEIGHT)
+        painter.fillRect(rect, self._color(pid))
+        if right - left >= 3:
+            painter.setPen(QPen(QColor("#777777")))
+            painter.drawLine(rect.topLeft(), rect.bottomLeft())
+        label = IDLE if pid == IDLE_PID else f"P{pid}"
+        if metrics.horizontalAdvance(label) + 4 <= right - left:
+            painter.setPen(QPen(QColor("#333333")))
+            painter.drawText(rect, Qt.AlignCenter, label)
+
+    def drawBackground(self, painter, rect):
+        painter.fillRect(rect, QColor("white"))
+        gantt = self.gantt
+        if gantt is None or not len(gantt):
+            return
+
+        scale = self.pixels_per_unit
+        left, right = max(rect.left(), 0.0), rect.right()
+        window_start, window_end = left / scale, right / scale
+        first = bisect_right(gantt.end, window_start)
+        last = bisect_left(gantt.start, window_end)
+        metrics = QFontMetrics(painter.font())
+
+        if last - first <= rect.width():
+            # Few enough segments in view to draw each of them
+            for index in range(first, last):
+                self._draw_bar(painter, metrics, gantt.start[index] * scale, gantt.end[index] * scale, gantt.pid[index])
+        else:
+            # More segments than pixels: sample what ran at each pixel column and merge equal neighbours
+            run_start, run_pid = int(left), None
+            for x in range(int(left), int(math.ceil(right)) + 1):
+                pid = gantt.pid_at((x + 0.5) / scale)
+                if pid != run_pid:
+                    if run_pid is not None:
+                        self._draw_bar(painter, metrics, run_start, x, run_pid)
+                    run_start, run_pid = x, pid
+            if run_pid is not None:
+                self._draw_bar(painter, metrics, run_start, int(math.ceil(right)) + 1, run_pid)
+
+        # Time axis with ticks at round intervals at least MIN_TICK_SPACING pixels apart
+        painter.setPen(QPen(QColor("#333333")))
+        painter.drawLine(QLineF(left, self.AXIS_TOP, right, self.AXIS_TOP))
+        raw_step = self.MIN_TICK_SPACING / scale
+        magnitude = 10 ** math.floor(math.log10(raw_step))
+        step = next(multiple * magnitude for multiple in (1, 2, 5, 10) if multiple * magnitude >= raw_step)
+        step = max(step, 1)
+        tick = math.ceil(window_start / step) * step
+        while tick <= min(window_end, gantt.end_time):
+            x = tick * scale
+            painter.drawLine(QLineF(x, self.AXIS_TOP, x, self.AXIS_TOP + 5))
+            painter.drawText(QRectF(x + 2, self.AXIS_TOP + 3, 100, 16), Qt.AlignLeft, f"{int(tick)}")
+            tick += step
+
+class ColumnTableModel(QAbstractTableModel):
+    """
+    Read-only table model over columns of numbers (array('q'), memoryview
+    or NumPy arrays). Cells are formatted only when the view asks for
+    them, so a table costs the same to show whatever its length. Sorting
+    keeps a row order array instead of reordering the columns.
+    """
+
+    def __init__(self, headers, formats=None):
+        super().__init__()
+        self.headers = headers
+        self.formats = formats or {}
+        self.columns = [()] * len(headers)
+        self.order = None
+        self.sort_column = -1
+        self.sort_order = Qt.AscendingOrder
+
+    def set_columns(self, columns):
+        # Show new columns, keeping the current sort
+        self.beginResetModel()
+        self.columns = columns
+        self.order = self._sorted_order()
+        self.endResetModel()
+
+    def rows_appended(self, count):
+        # The columns grew by count rows at the end
+        if self.order is not None:
+            self.set_columns(self.columns)
+            return
+        first = self.rowCount() - count
+        self.beginInsertRows(QModelIndex(), first, first + count - 1)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns[0])
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        row = index.row() if self.order is None else int(self.order[index.row()])
+        value = self.columns[index.column()][row]
+        return self.formats.get(index.column(), "{}").format(value)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.headers[section]
+        return str(section + 1)
+
+    def _sorted_order(self):
+        if self.sort_column < 0 or not self.rowCount():
+            return None
+        column = self.columns[self.sort_column]
+        values = column if isinstance(column, np.ndarray) else np.frombuffer(column, dtype=np.int64)
+        order = np.argsort(values, kind="stable")
+        if self.sort_order == Qt.DescendingOrder:
+            # Reverse within equal values too, so descending is the exact mirror of ascending
+            order = order[::-1]
+        return order
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        self.sort_column, self.sort_order = column, order
+        self.order = self._sorted_order()
+        self.layoutChanged.emit()
+
+class ScheduleWorkerSignals(QObject):
+    # Signals of a ScheduleWorker, delivered on the GUI thread
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(object, object)
+    cancelled = pyqtSignal()
+    failed = pyqtSignal(str)
+
+class ScheduleWorker(QRunnable):
+    """
+    Runs one scheduling algorithm on a thread of the global QThreadPool.
+    Progress is reported as the number of completed processes, and
+    cancel() stops the run when the next process completes. Given the
+    result of the previous run, only the part of the schedule changed by
+    the processes added since is simulated again, and runs already in the
+    result cache are not simulated at all.
+    """
+
+    def __init__(self, workload, scheduling_algo, time_quantum=None, previous=None):
+        super().__init__()
+        self.workload = workload
+        self.scheduling_algo = scheduling_algo
+        self.time_quantum = time_quantum
+        self.previous = previous
+        self.cancel_event = threading.Event()
+        self.signals = ScheduleWorkerSignals()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def run(self):
+        reporter = ProgressReporter(len(self.workload), self.signals.progress.emit, self.cancel_event)
+        try:
+            # Runs with a progress reporter bypass the cache, so look the result up here
+            cache = result_cache()
+            result = None
+            if cache is not None:
+                result = cache.get(self.workload, self.scheduling_algo, self.time_quantum, checkpoints=True)
+            if result is None:
+                if self.previous is not None:
+                    result = reschedule(self.previous, self.workload, reporter)
+                else:
+                    result = schedule(
+                        self.workload, self.scheduling_algo, self.time_quantum, reporter, checkpoints=True
+                    )
+                if cache is not None:
+                    cache.put(self.workload, self.scheduling_algo, self.time_quantum, result)
+            # Derive the metrics here too, so the GUI thread only displays them
+            averages = result.averages()
+        except ScheduleCancelled:
+            self.signals.cancelled.emit()
+        except Exception as error:
+            self.signals.failed.emit(str(error))
+        else:
+            self.signals.finished.emit(result, averages)
+
+class SweepWorkerSignals(QObject):
+    # Signals of a SweepWorker, delivered on the GUI thread
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+class SweepWorker(QRunnable):
+    """
+    Runs a Round Robin time quantum sweep on a thread of the global
+    QThreadPool, so the window stays responsive while the sweep's worker
+    processes run. Those are started by a fork server, never forked from
+    this multi-threaded process.
+    """
+
+    def __init__(self, workload):
+        super().__init__()
+        self.workload = workload
+        self.signals = SweepWorkerSignals()
+
+    def run(self):
+        try:
+            report = sweep_time_quantum(self.workload)
+        except Exception as error:
+            self.signals.failed.emit(str(error))
+        else:
+            self.signals.finished.emit(report)
 
 class SchedulingTab(QWidget):
     def __init__(self, scheduling_algo, with_priority=False, with_time_quantum=False):
         super().__init__()
-        self.processes = []
+        self.processes = ProcessTable()
         self.pid = 0
         self.scheduling_algo = scheduling_algo
         self.with_priority = with_priority
         self.with_time_quantum= with_time_quantum
         self.time_quantum = 0
         self.is_time_quantum_set = False
+        self.worker = None
+        self.sweep_worker = None
+        self.sweep_button = None
+        self.active_workers = set()  # Keeps every started worker alive until it reports back
+        self.last_result = None  # Result of the last run, resumed when processes are added and scheduled again
 
         # Initialize sections
         self.tab_layout = QHBoxLayout()
@@ -107,13 +432,13 @@ class SchedulingTab(QWidget):
 
         # Table styling
         table_style = """
-            QTableWidget {
+            QTableView {
                 border: 2px solid #ddd;
                 border-radius: 5px;
                 background-color: white;
                 gridline-color: #e0e0e0;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
             }
             QHeaderView::section {
@@ -126,23 +451,13 @@ class SchedulingTab(QWidget):
             }
         """
 
-        # Initialize table for processes
+        # Initialize table for processes, read straight from the columns of self.processes
         if self.with_priority:
-            self.input_table_widget = QTableWidget()
-            self.input_table_widget.setEditTriggers(QTableWidget.NoEditTriggers)
-            self.input_table_widget.setColumnCount(4)
-            self.input_table_widget.setHorizontalHeaderLabels(["Process", "Arrival Time", "Burst Time", "Priority Level"])
-            self.input_table_widget.horizontalHeader().setStretchLastSection(True)
-            self.input_table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-            self.input_table_widget.setStyleSheet(table_style)
+            self.input_model = ColumnTableModel(["Process", "Arrival Time", "Burst Time", "Priority Level"], {0: "P{}"})
         else:
-            self.input_table_widget = QTableWidget()
-            self.input_table_widget.setEditTriggers(QTableWidget.NoEditTriggers)
-            self.input_table_widget.setColumnCount(3)
-            self.input_table_widget.setHorizontalHeaderLabels(["Process", "Arrival Time", "Burst Time"])
-            self.input_table_widget.horizontalHeader().setStretchLastSection(True)
-            self.input_table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-            self.input_table_widget.setStyleSheet(table_style)
+            self.input_model = ColumnTableModel(["Process", "Arrival Time", "Burst Time"], {0: "P{}"})
+        self.input_model.set_columns(self._input_columns())
+        self.input_table_view = self._create_table_view(self.input_model, table_style)
         
         # Initialize clear button to reset all input/output
         clear_input_button = QPushButton("Clear")
@@ -166,10 +481,10 @@ class SchedulingTab(QWidget):
         """)
         
         # Initialize schedule button to start CPU scheduling algorithm
-        schedule_button = QPushButton("Schedule")
-        schedule_button.setFixedHeight(40)
-        schedule_button.clicked.connect(self.schedule_input)
-        schedule_button.setStyleSheet("""
+        self.schedule_button = QPushButton("Schedule")
+        self.schedule_button.setFixedHeight(40)
+        self.schedule_button.clicked.connect(self.schedule_input)
+        self.schedule_button.setStyleSheet("""
             QPushButton {
                 background-color: #2196F3;
                 color: white;
@@ -186,69 +501,93 @@ class SchedulingTab(QWidget):
             }
         """)
 
+        # Initialize import and paste buttons to add many processes at once from a file or the clipboard
+        import_layout = QHBoxLayout()
+        import_style = """
+            QPushButton {
+                background-color: #607D8B;
+                color: white;
+                border: none;
+                border-radius: 5px;
+                font-weight: bold;
+                font-size: 13px;
+            }
+            QPushButton:hover {
+                background-color: #546E7A;
+            }
+            QPushButton:pressed {
+                background-color: #455A64;
+            }
+        """
+        import_button = QPushButton("Import...")
+        import_button.setFixedHeight(40)
+        import_button.clicked.connect(self.import_processes)
+        import_button.setStyleSheet(import_style)
+        paste_button = QPushButton("Paste")
+        paste_button.setFixedHeight(40)
+        paste_button.clicked.connect(self.paste_processes)
+        paste_button.setStyleSheet(import_style)
+        import_layout.addWidget(import_button)
+        import_layout.addWidget(paste_button)
+
+        # Ctrl+V on the processes table pastes processes, the input fields keep their own paste
+        paste_shortcut = QShortcut(QKeySequence.Paste, self.input_table_view)
+        paste_shortcut.setContext(Qt.WidgetShortcut)
+        paste_shortcut.activated.connect(self.paste_processes)
+
         # Add clear and schedule buttons to buttons_layout
         buttons_layout.addWidget(clear_input_button)
-        buttons_layout.addWidget(schedule_button)
+        buttons_layout.addWidget(self.schedule_button)
+
+        # Initialize sweep button to try a range of Round Robin time quanta on the same processes
+        if self.scheduling_algo == "rr":
+            self.sweep_button = QPushButton("Sweep Quanta")
+            self.sweep_button.setFixedHeight(40)
+            self.sweep_button.clicked.connect(self.sweep_time_quanta)
+            self.sweep_button.setStyleSheet("""
+                QPushButton {
+                    background-color: #9C27B0;
+                    color: white;
+                    border: none;
+                    border-radius: 5px;
+                    font-weight: bold;
+                    font-size: 13px;
+                }
+                QPushButton:hover {
+                    background-color: #7B1FA2;
+                }
+                QPushButton:pressed {
+                    background-color: #6A1B9A;
+                }
+            """)
+            buttons_layout.addWidget(self.sweep_button)
 
-        # Combine form_layout, input_table_widgets, and buttons_layout into one input_section layout
+        # Initialize progress bar and cancel button, shown while a run is in progress
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setFormat("%v / %m processes completed")
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.cancel_schedule)
+        progress_layout = QHBoxLayout()
+        progress_layout.addWidget(self.progress_bar)
+        progress_layout.addWidget(self.cancel_button)
+        self.progress_bar.hide()
+        self.cancel_button.hide()
+
+        # Combine form_layout, import_layout, input_table_widgets, buttons_layout, and progress_layout into one input_section layout
         self.input_section.addLayout(form_layout)
-        self.input_section.addWidget(self.input_table_widget)
+        self.input_section.addLayout(import_layout)
+        self.input_section.addWidget(self.input_table_view)
         self.input_section.addLayout(buttons_layout)
+        self.input_section.addLayout(progress_layout)
 
-        # Initialize labels for Gantt Chart (process id and time stamps)
-        self.processes_label = QLabel()
-        self.processes_label.setStyleSheet("""
-            QLabel {
-                font-family: 'Courier New', monospace;
-                font-size: 14px;
-                font-weight: bold;
-                color: #333;
-                background-color: #e3f2fd;
-                padding: 5px;
-            }
-        """)
-        
-        self.times_label = QLabel()
-        self.times_label.setStyleSheet("""
-            QLabel {
-                font-family: 'Courier New', monospace;
-                font-size: 13px;
-                color: #333;
-                background-color: #f5f5f5;
-                padding: 5px;
-            }
-        """)
-        
-        # Combine both labels into one widget
-        gantt_chart_widget = QWidget()
-        gantt_chart_layout = QVBoxLayout(gantt_chart_widget)
-        gantt_chart_layout.addWidget(self.processes_label)
-        gantt_chart_layout.addWidget(self.times_label)
-
-        # Turn the widget into a scrollable area
-        scroll_area = QScrollArea()
-        scroll_area.setFixedHeight(100)
-        scroll_area.setWidget(gantt_chart_widget)       
-        scroll_area.setWidgetResizable(True)            
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: 2px solid #ddd;
-                border-radius: 5px;
-                background-color: white;
-            }
-        """)
+        # Initialize Gantt Chart view, which paints only the visible part of the chart
+        self.gantt_chart_view = GanttChartView()
+        self.gantt_chart_view.setFixedHeight(100)
 
         # Initialize output table which will show all processed data of the processes
-        self.output_table_widget = QTableWidget()
-        self.output_table_widget.setFixedHeight(590)
-        self.output_table_widget.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.output_table_widget.setColumnCount(8)
-        self.output_table_widget.setHorizontalHeaderLabels(["PID", "AT", "BT", "ST", "CT", "TAT", "WT", "RT"])
-        self.output_table_widget.horizontalHeader().setStretchLastSection(True)
-        self.output_table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.output_table_widget.setStyleSheet(table_style)
+        self.output_model = ColumnTableModel(["PID", "AT", "BT", "ST", "CT", "TAT", "WT", "RT"], {0: "P{}"})
+        self.output_table_view = self._create_table_view(self.output_model, table_style)
+        self.output_table_view.setFixedHeight(590)
 
         # Initialize label for TAT, WT, and RT averages
         self.averages_label = QLabel()
@@ -265,9 +604,9 @@ class SchedulingTab(QWidget):
         """)
         self.averages_label.setText("Performance Averages:\n")
 
-        # Combine scroll_area, output_table_widget, and averages_label into one output_section layout
-        self.output_section.addWidget(scroll_area)
-        self.output_section.addWidget(self.output_table_widget)
+        # Combine gantt_chart_view, output_table_view, and averages_label into one output_section layout
+        self.output_section.addWidget(self.gantt_chart_view)
+        self.output_section.addWidget(self.output_table_view)
         self.output_section.addWidget(self.averages_label)
 
         # Combine both input section and output section into one layout and set it as the tab's layout
@@ -275,6 +614,24 @@ class SchedulingTab(QWidget):
         self.tab_layout.addLayout(self.output_section, 8)
         self.setLayout(self.tab_layout)
 
+    def _create_table_view(self, model, table_style):
+        # Read-only table view, sorted by clicking a column header
+        table_view = QTableView()
+        table_view.setModel(model)
+        table_view.setEditTriggers(QTableView.NoEditTriggers)
+        table_view.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        table_view.setSortingEnabled(True)
+        table_view.horizontalHeader().setStretchLastSection(True)
+        table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        table_view.setStyleSheet(table_style)
+        return table_view
+
+    def _input_columns(self):
+        columns = [self.processes.pid, self.processes.arrival_time, self.processes.burst_time]
+        if self.with_priority:
+            columns.append(self.processes.priority)
+        return columns
+
     def add_item(self):
         try: 
             arrival_time = int(self.at_input_field.text().strip())
@@ -290,17 +647,7 @@ class SchedulingTab(QWidget):
                 if priority_level <= 0:
                     raise ValueError("Priority must be greater than 0")
             elif self.with_time_quantum and not self.is_time_quantum_set:
-                time_quantum = int(self.time_quantum_input_field.text().strip())
-                # Error: time quantum cannot be negative or zero
-                if time_quantum <= 0:
-                    raise ValueError("Time quantum must be greater than 0")
-                self.time_quantum = time_quantum
-                self.time_quantum_input_field.setEnabled(False)
-                self.time_quantum_input_field.setText(f"Time Quantum: {time_quantum}")
-                self.time_quantum_input_field.setProperty("class", "set")
-                self.time_quantum_input_field.style().unpolish(self.time_quantum_input_field)
-                self.time_quantum_input_field.style().polish(self.time_quantum_input_field)
-                self.is_time_quantum_set = True
+                self.set_time_quantum()
         except ValueError:
             self.at_input_field.clear()
             self.bt_input_field.clear()
@@ -310,18 +657,13 @@ class SchedulingTab(QWidget):
                 self.time_quantum_input_field.clear()
             return
         
-        # Add process to table and processes list
+        # Add process to processes table, the input table model shows the new row
         self.pid += 1
-        row_position = self.input_table_widget.rowCount()
-        self.input_table_widget.insertRow(row_position)
-        self.input_table_widget.setItem(row_position, 0, QTableWidgetItem(f"P{self.pid}"))
-        self.input_table_widget.setItem(row_position, 1, QTableWidgetItem(f"{arrival_time}"))
-        self.input_table_widget.setItem(row_position, 2, QTableWidgetItem(f"{burst_time}"))
         if self.with_priority:
-            self.input_table_widget.setItem(row_position, 3, QTableWidgetItem(f"{priority_level}"))
-            self.processes.append(Process(self.pid, arrival_time, burst_time, priority_level))
+            self.processes.append(self.pid, arrival_time, burst_time, priority_level)
         else:
-            self.processes.append(Process(self.pid, arrival_time, burst_time))
+            self.processes.append(self.pid, arrival_time, burst_time)
+        self.input_model.rows_appended(1)
         
         # Clear input fields after adding process
         self.at_input_field.clear()
@@ -329,14 +671,80 @@ class SchedulingTab(QWidget):
         if self.with_priority:
             self.priority_input_field.clear()
 
+    def set_time_quantum(self):
+        # Reads and locks the time quantum, which is set once with the first processes
+        time_quantum = int(self.time_quantum_input_field.text().strip())
+        # Error: time quantum cannot be negative or zero
+        if time_quantum <= 0:
+            raise ValueError("Time quantum must be greater than 0")
+        self.time_quantum = time_quantum
+        self.time_quantum_input_field.setEnabled(False)
+        self.time_quantum_input_field.setText(f"Time Quantum: {time_quantum}")
+        self.time_quantum_input_field.setProperty("class", "set")
+        self.time_quantum_input_field.style().unpolish(self.time_quantum_input_field)
+        self.time_quantum_input_field.style().polish(self.time_quantum_input_field)
+        self.is_time_quantum_set = True
+
+    def import_processes(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Import Processes", "", "Workloads (*.csv *.json *.tsv *.txt *.bin);;All Files (*)"
+        )
+        if not path:
+            return
+        try:
+            # CSV, JSON and columnar files by extension, anything else is read like pasted text
+            if path.lower().endswith((".csv", ".json", ".bin")):
+                workload = read_workload(path, self.with_priority)
+            else:
+                with open(path) as file:
+                    workload = parse_text(file.read(), self.with_priority)
+        except (OSError, ValueError) as error:
+            QMessageBox.warning(self, "Import Failed", str(error))
+            return
+        self.add_workload(workload)
+
+    def paste_processes(self):
+        try:
+            workload = parse_text(QApplication.clipboard().text(), self.with_priority)
+        except ValueError as error:
+            QMessageBox.warning(self, "Paste Failed", str(error))
+            return
+        self.add_workload(workload)
+
+    def add_workload(self, workload):
+        # Adds every process of an already validated workload in one batch, with new PIDs after the existing ones
+        processes_count = len(workload)
+        if not processes_count:
+            return
+        if self.with_time_quantum and not self.is_time_quantum_set:
+            try:
+                self.set_time_quantum()
+            except ValueError:
+                self.time_quantum_input_field.clear()
+                QMessageBox.warning(self, "Time Quantum Required", "Enter a time quantum greater than 0 before adding processes")
+                return
+
+        pids = range(self.pid + 1, self.pid + processes_count + 1)
+        priorities = workload.priority if self.with_priority else None
+        self.processes.extend(pids, workload.arrival_time, workload.burst_time, priorities)
+        self.pid += processes_count
+        self.input_model.rows_appended(processes_count)
+
     def clear_all(self):
-        # Resets everything (input/output)
-        self.input_table_widget.setRowCount(0)
-        self.processes.clear()
+        # Resets everything (input/output), cancelling a run in progress
+        self.cancel_schedule()
+        self.worker = None
+        self._set_running(False)
+        # A sweep in progress reports on processes that are gone, its report is ignored
+        if self.sweep_button is not None:
+            self.sweep_worker = None
+            self.sweep_button.setEnabled(True)
+        self.processes = ProcessTable()
+        self.input_model.set_columns(self._input_columns())
         self.pid = 0
-        self.output_table_widget.setRowCount(0)
-        self.processes_label.clear()
-        self.times_label.clear()
+        self.last_result = None
+        self.output_model.set_columns([()] * self.output_model.columnCount())
+        self.gantt_chart_view.clear()
         self.averages_label.setText("Performance Averages:\n")
         if self.with_time_quantum:
             self.time_quantum = 0
@@ -348,41 +756,65 @@ class SchedulingTab(QWidget):
             self.time_quantum_input_field.style().polish(self.time_quantum_input_field)
 
     def schedule_input(self):
-        # Return if processes is empty
-        if not self.processes:
+        # Return if processes is empty or a run is already in progress
+        if not len(self.processes) or self.worker is not None:
             return
         
-        # Run the scheduling algorithm and calculate the averages
-        if self.with_time_quantum:
-            gantt_chart = self.scheduling_algo(self.processes, len(self.processes), self.time_quantum)
-        else:
-            gantt_chart = self.scheduling_algo(self.processes, len(self.processes))
-        averages = calculate_averages(self.processes, len(self.processes))
-
-        # Combine the gantt chart data into single strings
-        processes_id_str = ""
-        times_str = ""
-        for time, process_id in gantt_chart:
-            if process_id is not None:
-                processes_id_str += f"{process_id:^10}"
-            times_str += f"{time:<10}"
-
-        # Set processes_label and times_label text
-        self.processes_label.setText(processes_id_str)
-        self.times_label.setText(times_str)
-
-        # Create the output table
-        for process in self.processes:
-            row_position = self.output_table_widget.rowCount()
-            self.output_table_widget.insertRow(row_position)
-            self.output_table_widget.setItem(row_position, 0, QTableWidgetItem(f"P{process.pid}"))
-            self.output_table_widget.setItem(row_position, 1, QTableWidgetItem(f"{process.arrival_time}"))
-            self.output_table_widget.setItem(row_position, 2, QTableWidgetItem(f"{process.burst_time}"))
-            self.output_table_widget.setItem(row_position, 3, QTableWidgetItem(f"{process.starting_time}"))
-            self.output_table_widget.setItem(row_position, 4, QTableWidgetItem(f"{process.completion_time}"))
-            self.output_table_widget.setItem(row_position, 5, QTableWidgetItem(f"{process.turnaround_time}"))
-            self.output_table_widget.setItem(row_position, 6, QTableWidgetItem(f"{process.waiting_time}"))
-            self.output_table_widget.setItem(row_position, 7, QTableWidgetItem(f"{process.response_time}"))
+        # Run the scheduling algorithm on a pool thread, the processes themselves are left untouched
+        workload = Workload.from_processes(self.processes)
+        time_quantum = self.time_quantum if self.with_time_quantum else None
+        worker = ScheduleWorker(workload, self.scheduling_algo, time_quantum, self.last_result)
+        worker.signals.progress.connect(self.show_progress)
+        worker.signals.finished.connect(lambda result, averages: self.show_result(worker, result, averages))
+        worker.signals.cancelled.connect(lambda: self.end_run(worker))
+        worker.signals.failed.connect(lambda message: self.show_error(worker, message))
+        self.worker = worker
+        self.active_workers.add(worker)
+        self.progress_bar.setRange(0, len(workload))
+        self.progress_bar.setValue(0)
+        self._set_running(True)
+        QThreadPool.globalInstance().start(worker)
+
+    def cancel_schedule(self):
+        if self.worker is not None:
+            self.worker.cancel()
+
+    def _set_running(self, running):
+        self.schedule_button.setEnabled(not running)
+        self.progress_bar.setVisible(running)
+        self.cancel_button.setVisible(running)
+
+    def show_progress(self, completed, processes_count):
+        self.progress_bar.setValue(completed)
+
+    def end_run(self, worker):
+        # Forget a worker that reported back, returns whether it is the tab's current run
+        self.active_workers.discard(worker)
+        if worker is not self.worker:
+            return False
+        self.worker = None
+        self._set_running(False)
+        return True
+
+    def show_error(self, worker, message):
+        if self.end_run(worker):
+            QMessageBox.warning(self, "Scheduling Failed", message)
+
+    def show_result(self, worker, result, averages):
+        # Ignore results of runs that were cancelled or cleared in the meantime
+        if not self.end_run(worker):
+            return
+        self.last_result = result
+        workload = result.workload
+
+        # Show the gantt chart, drawn straight from its segment columns
+        self.gantt_chart_view.set_chart(result.gantt)
+
+        # Show the output table, read straight from the columns of the result
+        self.output_model.set_columns([
+            workload.pid, workload.arrival_time, workload.burst_time, result.starting_time,
+            result.completion_time, result.turnaround_time, result.waiting_time, result.response_time
+        ])
 
         # Set averages_label text
         self.averages_label.setText("Performance Averages:\n"
@@ -390,6 +822,42 @@ class SchedulingTab(QWidget):
                                     f"WT: {round(averages["waiting_time_avg"], 2):<10.2f}"
                                     f"RT: {round(averages["response_time_avg"], 2):<10.2f}")
 
+    def sweep_time_quanta(self):
+        # Return if processes is empty or a sweep is already in progress
+        if not len(self.processes) or self.sweep_worker is not None:
+            return
+
+        # Run Round Robin with every quantum up to the longest burst time in parallel, off the GUI thread
+        worker = SweepWorker(Workload.from_processes(self.processes))
+        worker.signals.finished.connect(lambda report: self.show_sweep(worker, report))
+        worker.signals.failed.connect(lambda message: self.show_sweep_error(worker, message))
+        self.sweep_worker = worker
+        self.active_workers.add(worker)
+        self.sweep_button.setEnabled(False)
+        QThreadPool.globalInstance().start(worker)
+
+    def end_sweep(self, worker):
+        # Forget a sweep that reported back, returns whether it is the tab's current sweep
+        self.active_workers.discard(worker)
+        if worker is not self.sweep_worker:
+            return False
+        self.sweep_worker = None
+        self.sweep_button.setEnabled(True)
+        return True
+
+    def show_sweep_error(self, worker, message):
+        if self.end_sweep(worker):
+            QMessageBox.warning(self, "Sweep Failed", message)
+
+    def show_sweep(self, worker, report):
+        # Ignore sweeps of processes that were cleared in the meantime
+        if not self.end_sweep(worker):
+            return
+        message_box = QMessageBox(self)
+        message_box.setWindowTitle("Time Quantum Sweep")
+        message_box.setText(f"<pre>{format_sweep_report(report)}</pre>")
+        message_box.exec_()
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -439,13 +907,15 @@ class MainWindow(QMainWindow):
         """)
         
         # Initialize tabs
-        self.tabs.addTab(SchedulingTab(first_come_first_serve), "FCFS")
-        self.tabs.addTab(SchedulingTab(shortest_job_first), "SJF")
-        self.tabs.addTab(SchedulingTab(non_preemptive_priority, with_priority=True), "Priority")
-        self.tabs.addTab(SchedulingTab(highest_response_ratio_next), "HRRN")
-        self.tabs.addTab(SchedulingTab(shortest_remaining_time_first), "SRTF")
-        self.tabs.addTab(SchedulingTab(preemptive_priority, with_priority=True), "Preemptive Priority")
-        self.tabs.addTab(SchedulingTab(round_robin, with_time_quantum=True), "Round Robin")
+        self.tabs.addTab(SchedulingTab("fcfs"), "FCFS")
+        self.tabs.addTab(SchedulingTab("sjf"), "SJF")
+        self.tabs.addTab(SchedulingTab("priority", with_priority=True), "Priority")
+        self.tabs.addTab(SchedulingTab("hrrn"), "HRRN")
+        self.tabs.addTab(SchedulingTab("srtf"), "SRTF")
+        self.tabs.addTab(SchedulingTab("preemptive_priority", with_priority=True), "Preemptive Priority")
+        self.tabs.addTab(SchedulingTab("rr", with_time_quantum=True), "Round Robin")
+        self.tabs.addTab(SchedulingTab("cfs", with_priority=True), "CFS")
+        self.tabs.addTab(SchedulingTab("mlfq", with_time_quantum=True), "MLFQ")
 
         self.setCentralWidget(self.tabs)
 
@@ -455,6 +925,9 @@ def main():
     # Set application-wide font
     font = QFont("Segoe UI", 10)
     app.setFont(font)
+
+    # Keep recent results in memory, so scheduling the same processes again is instant
+    use_cache(ScheduleCache())
     
     window = MainWindow()
     window.show()
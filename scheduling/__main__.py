@@ -0,0 +1,7 @@
+import sys
+
+from .cli import main
+
+# Worker processes started by spawn or a fork server import this module too
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,410 +1,960 @@
 """
 CPU Scheduling Algorithms Implementation
-Includes: FCFS, SJF, Priority, HRRN, SRTF, Preemptive Priority, and RR Scheduling
+Includes: FCFS, SJF, Priority, HRRN, SRTF, Preemptive Priority, and RR Scheduling,
+plus CFS and MLFQ through schedule() (see policies.py)
 
 Args of each algorithm:
-    processes: List of process objects
+    processes: List of process objects, or a ProcessTable
     processes_count: Number of processes
+
+Returns of each algorithm:
+    gantt_chart: List of (start time, "P<pid>") entries, with idle CPU time
+    recorded as (start time, gantt.IDLE) and a final (end time, None) entry
+
+The algorithms above store their results in the processes they are given.
+schedule() runs the same algorithms on an immutable Workload instead and
+returns a ScheduleResult, leaving its input untouched. Its Gantt chart is
+a compact gantt.GanttChart, converted to the list above only on request.
+reschedule() reschedules a workload with processes appended to one that
+was already scheduled, resuming the earlier run from its last checkpoint
+before the first new arrival. With a cache.ScheduleCache installed,
+schedule() returns cached results of identical runs. With cpus greater
+than 1, schedule() simulates several cores (see multicore.py).
 """
 
-def execute_process(process, current_time):
-    """Execute a process and calculate its timing metrics."""
-    process.starting_time = current_time
-    current_time += process.burst_time
-    process.completion_time = current_time
-    process.turnaround_time = process.completion_time - process.arrival_time
-    process.waiting_time = process.turnaround_time - process.burst_time
-    process.response_time = process.starting_time - process.arrival_time
-    process.completed = True
-    return current_time
+import heapq
+from array import array
+from bisect import bisect_left
+from collections import deque
+from itertools import chain
 
+from . import summaries
+from .gantt import IDLE_PID, GanttChart
+from .process import ProcessTable, Workload
 
-def first_come_first_serve(processes, processes_count):
-    """
-    First Come First Serve (FCFS) Scheduling Algorithm.
-    Non-preemptive scheduling based on arrival time.
-    """
-    completed_count = 0
-    current_time = 0
-    gantt_chart = []
 
-    while completed_count < processes_count:
-        # Find earliest arrived process that hasn't completed
-        selected_index = -1
-        earliest_arrival = float('inf')
-
-        for i, process in enumerate(processes):
-            if process.arrival_time <= current_time and not process.completed:
-                if process.arrival_time < earliest_arrival:
-                    selected_index = i
-                    earliest_arrival = process.arrival_time
-                elif process.arrival_time == earliest_arrival:
-                    # Tie-breaker: lower PID
-                    if process.pid < processes[selected_index].pid:
-                        selected_index = i
-
-        # No process available, advance time
-        if selected_index == -1:
-            current_time += 1
-            continue
-        
-        # Execute selected process
-        process = processes[selected_index]
-        gantt_chart.append((current_time, f"P{process.pid}"))
-        current_time = execute_process(process, current_time)
-        completed_count += 1
+def _metrics():
+    # NumPy is only imported once metrics are needed, so plain scheduling runs start quickly
+    from . import metrics
+    return metrics
 
-    gantt_chart.append((current_time, None))
-    return gantt_chart
 
+def _summarize(arrival_time, burst_time, starting_time, completion_time, cpus=1):
+    """Return the metrics.summarize statistics, computed without NumPy for small schedules."""
+    if len(arrival_time) <= summaries.PLAIN_PROCESSES:
+        return summaries.summarize(arrival_time, burst_time, starting_time, completion_time, cpus)
+    return _metrics().summarize(arrival_time, burst_time, starting_time, completion_time, cpus)
 
-def shortest_job_first(processes, processes_count):
-    """
-    Shortest Job First (SJF) Scheduling Algorithm.
-    Non-preemptive scheduling based on burst time.
-    """
-    completed_count = 0
-    current_time = 0
-    gantt_chart = []
 
-    while completed_count < processes_count:
-        # Find process with shortest burst time
-        selected_index = -1
-        shortest_burst = float('inf')
-
-        for i, process in enumerate(processes):
-            if process.arrival_time <= current_time and not process.completed:
-                if process.burst_time < shortest_burst:
-                    selected_index = i
-                    shortest_burst = process.burst_time
-                elif process.burst_time == shortest_burst:
-                    # Tie-breaker 1: earlier arrival time
-                    if process.arrival_time < processes[selected_index].arrival_time:
-                        selected_index = i
-                    # Tie-breaker 2: lower PID
-                    elif process.arrival_time == processes[selected_index].arrival_time:
-                        if process.pid < processes[selected_index].pid:
-                            selected_index = i
-
-        # No process available, advance time
-        if selected_index == -1:
-            current_time += 1
-            continue
+def _multicore():
+    # Imported on first use, the multi-core engine builds on this module
+    from . import multicore
+    return multicore
 
-        # Execute selected process
-        process = processes[selected_index]
-        gantt_chart.append((current_time, f"P{process.pid}"))
-        current_time = execute_process(process, current_time)
-        completed_count += 1
 
-    gantt_chart.append((current_time, None))
-    return gantt_chart
+def _policies():
+    # Imported on first use, CFS and MLFQ build on this module
+    from . import policies
+    return policies
 
-def non_preemptive_priority(processes, processes_count):
+
+class ScheduleResult:
     """
-    Non-Preemptive Priority Scheduling Algorithm.
-    Non-preemptive scheduling based on priority level.
+    Outcome of one scheduling run.
+    Holds the GanttChart and the starting and completion time of every
+    process, indexed like the columns of the workload that was scheduled.
+    Turnaround, waiting and response times are derived from them in one
+    vectorized pass the first time they are needed.
     """
-    completed_count = 0
-    current_time = 0
-    gantt_chart = []
 
-    while completed_count < processes_count:
-        # Find process with shortest burst time
-        selected_index = -1
-        highest_priority = float('inf')
-
-        for i, process in enumerate(processes):
-            if process.arrival_time <= current_time and not process.completed:
-                if process.priority < highest_priority:
-                    selected_index = i
-                    highest_priority = process.priority
-                elif process.priority == highest_priority:
-                    # Tie-breaker 1: earlier arrival time
-                    if process.arrival_time < processes[selected_index].arrival_time:
-                        selected_index = i
-                    elif process.arrival_time == processes[selected_index].arrival_time:
-                        if process.burst_time < processes[selected_index].burst_time:
-                            selected_index = i
-                        # Tie-breaker 2: lower PID
-                        elif process.burst_time == processes[selected_index].burst_time:
-                            if process.pid < processes[selected_index].pid:
-                                selected_index = i
-
-        # No process available, advance time
-        if selected_index == -1:
-            current_time += 1
-            continue
+    __slots__ = ("workload", "gantt", "starting_time", "completion_time", "checkpoints", "_process_metrics")
 
-        # Execute selected process
-        process = processes[selected_index]
-        gantt_chart.append((current_time, f"P{process.pid}"))
-        current_time = execute_process(process, current_time)
-        completed_count += 1
+    def __init__(self, workload, gantt, starting_time, completion_time, checkpoints=None):
+        self.workload = workload
+        self.gantt = gantt
+        self.starting_time = starting_time
+        self.completion_time = completion_time
+        self.checkpoints = checkpoints
+        self._process_metrics = None
 
-    gantt_chart.append((current_time, None))
-    return gantt_chart    
+    def __len__(self):
+        return len(self.completion_time)
 
-def highest_response_ratio_next(processes, processes_count):
-    """
-    Highest Response Ratio Next (HRRN) Scheduling Algorithm.
-    Non-preemptive scheduling that favors both short jobs and long-waiting jobs.
-    """
-    completed_count = 0
-    current_time = 0
-    gantt_chart = []
+    @property
+    def gantt_chart(self):
+        """The Gantt chart as the legacy list of (time, label) tuples."""
+        return self.gantt.to_list()
 
-    while completed_count < processes_count:
-        highest_ratio = -1
-        selected_index = -1
-        
-        for i, process in enumerate(processes):
-            if not process.completed and process.arrival_time <= current_time:
-                # Calculate response ratio
-                waiting_time = current_time - process.arrival_time
-                ratio = (waiting_time + process.burst_time) / process.burst_time
-
-                if ratio > highest_ratio:
-                    highest_ratio = ratio
-                    selected_index = i
-                elif ratio == highest_ratio:
-                    # Tie-breaker 1: earlier arrival time
-                    if process.arrival_time < processes[selected_index].arrival_time:
-                        selected_index = i
-                    elif process.arrival_time == processes[selected_index].arrival_time:
-                        # Tie-breaker 2: shorter burst time
-                        if process.burst_time < processes[selected_index].burst_time:
-                            selected_index = i
-                        # Tie-breaker 3: lower PID
-                        elif process.burst_time == processes[selected_index].burst_time:
-                            if process.pid < processes[selected_index].pid:
-                                selected_index = i
-
-        # No process available, advance time
-        if selected_index == -1:
-            current_time += 1
-            continue
-        
-        # Execute selected process
-        process = processes[selected_index]
-        gantt_chart.append((current_time, f"P{process.pid}"))
-        current_time = execute_process(process, current_time)
-        completed_count += 1
+    @property
+    def lanes(self):
+        """The Gantt chart of every CPU, only one for a single CPU run."""
+        return (self.gantt,)
 
-    gantt_chart.append((current_time, None))
-    return gantt_chart
+    def _columns(self):
+        workload = self.workload
+        return workload.arrival_time, workload.burst_time, self.starting_time, self.completion_time
 
-def shortest_remaining_time_first(processes, processes_count):
+    def _metric(self, position):
+        if self._process_metrics is None:
+            self._process_metrics = _metrics().process_metrics(*self._columns())
+        return self._process_metrics[position]
+
+    @property
+    def turnaround_time(self):
+        return self._metric(0)
+
+    @property
+    def waiting_time(self):
+        return self._metric(1)
+
+    @property
+    def response_time(self):
+        return self._metric(2)
+
+    def summary(self):
+        """Return the schedule statistics described in metrics.summarize."""
+        return _summarize(*self._columns())
+
+    def averages(self):
+        """Return the same averages as calculate_averages."""
+        return _metrics().averages(self.turnaround_time, self.waiting_time, self.response_time)
+
+    def context_switches(self):
+        """
+        Count the times the CPU was handed to a different process, i.e. the
+        process segments of the Gantt chart after the first one.
+        """
+        return max(self.gantt.process_segments() - 1, 0)
+
+
+# Fewest dispatch steps between two checkpoints
+CHECKPOINT_INTERVAL = 64
+
+# Most rows of the ready queue a checkpoint may copy per dispatch step since the previous one
+CHECKPOINT_ROWS_PER_STEP = 4
+
+
+class Checkpoints:
     """
-    Shortest Remaining Time First (SRTF) Scheduling Algorithm.
-    Executes shortest remaining time process at each time unit.
-    Supports process preemption when shorter remaining time process arrives.
+    Engine states saved during a run, so that reschedule() can resume it.
+    A state is saved at the start of a dispatch step, before the arrivals
+    of the step are admitted, and holds the time, the position in arrival
+    order, the number of completed processes, the rows in the ready queue
+    and their remaining times. A state is only saved once the rows in the
+    ready queue are at most CHECKPOINT_ROWS_PER_STEP per step since the
+    previous state, so the saved states grow linearly with the run.
     """
-    current_time = 0
-    completed_count = 0
-    gantt_chart = []
-    last_pid = -1
-    current_process_index = -1
 
-    while completed_count < processes_count:
-        # Find process with shortest remaining time
-        selected_index = -1
-        shortest_remaining_time = float('inf')
-        
-        for i, process in enumerate(processes):
-            if process.arrival_time <= current_time and not process.completed:
-                if process.remaining_time < shortest_remaining_time:
-                    selected_index = i
-                    shortest_remaining_time = process.remaining_time
-                elif process.remaining_time == shortest_remaining_time:
-                    # Tie-breaker 1: earlier arrival time
-                    if process.arrival_time < processes[selected_index].arrival_time:
-                        selected_index = i
-                    # Tie-breaker 2: lower PID
-                    elif process.arrival_time == processes[selected_index].arrival_time:
-                        if process.pid < processes[selected_index].pid:
-                            selected_index = i
-
-        # No process available, advance time
-        if selected_index == -1:
-            current_time += 1
-            current_process_index = -1
-            continue
-        
-        process = processes[selected_index]
-        current_process_index = selected_index
-        
-        # Set starting time on first execution
-        if process.starting_time == -1:
-            process.starting_time = current_time
-            process.response_time = current_time - process.arrival_time
+    __slots__ = ("algorithm", "time_quantum", "arrivals", "time", "states", "_steps")
+
+    def __init__(self, algorithm, time_quantum=None):
+        self.algorithm = algorithm
+        self.time_quantum = time_quantum
+        self.arrivals = None  # Row indices in arrival order, set by the engine
+        self.time = array("q")
+        self.states = []
+        self._steps = 0
+
+    def __len__(self):
+        return len(self.states)
+
+    def due(self, queued):
+        """Count a dispatch step and tell whether to save a state with queued rows in the ready queue."""
+        self._steps += 1
+        return self._steps >= CHECKPOINT_INTERVAL and self._steps * CHECKPOINT_ROWS_PER_STEP >= queued
+
+    def save(self, time, next_arrival, completed_count, last_pid, preempted, rows, remaining=None):
+        self._steps = 0
+        self.time.append(time)
+        self.states.append((time, next_arrival, completed_count, last_pid, preempted, rows, remaining))
+
+    def last_before(self, time):
+        """Index of the last state saved strictly before time, -1 if there is none."""
+        return bisect_left(self.time, time) - 1
+
+    def prefix(self, count, arrivals):
+        """Return new Checkpoints holding the first count states, for a run resumed from the last of them."""
+        checkpoints = Checkpoints(self.algorithm, self.time_quantum)
+        checkpoints.arrivals = arrivals
+        checkpoints.time = self.time[:count]
+        checkpoints.states = self.states[:count]
+        return checkpoints
+
+
+def _arrival_order(workload):
+    """Return the row indices of the workload sorted by arrival time, then PID."""
+    order = sorted(range(len(workload)), key=workload.pid.__getitem__)
+    order.sort(key=workload.arrival_time.__getitem__)  # Stable, so PID order is kept within equal arrivals
+    return order
+
+
+def _store_results(processes, result):
+    """Copy the results of a run into the Process objects or ProcessTable that were scheduled."""
+    processes_count = len(result)
+    if isinstance(processes, ProcessTable):
+        processes.remaining_time[:] = array("q", bytes(8 * processes_count))
+        processes.starting_time[:] = result.starting_time
+        processes.completion_time[:] = result.completion_time
+        processes.turnaround_time[:] = array("q", result.turnaround_time.tobytes())
+        processes.waiting_time[:] = array("q", result.waiting_time.tobytes())
+        processes.response_time[:] = array("q", result.response_time.tobytes())
+        processes.completed[:] = b"\x01" * processes_count
+        return
+
+    columns = zip(
+        result.starting_time, result.completion_time, result.turnaround_time.tolist(),
+        result.waiting_time.tolist(), result.response_time.tolist()
+    )
+    for process, (starting, completion, turnaround, waiting, response) in zip(processes, columns):
+        process.remaining_time = 0
+        process.starting_time = starting
+        process.completion_time = completion
+        process.turnaround_time = turnaround
+        process.waiting_time = waiting
+        process.response_time = response
+        process.completed = True
+
+
+class _HeapReadyQueue:
+    """
+    Ready queue of row indices ordered by a tie-break key built from the
+    given columns. Each push and pop costs O(log n).
+    """
 
-        # Add to gantt chart only when process changes
-        if process.pid != last_pid:
-            gantt_chart.append((current_time, f"P{process.pid}"))
-            last_pid = process.pid
+    def __init__(self, *key_columns):
+        self.key_columns = key_columns
+        self.heap = []
 
-        # Execute for one time unit
-        process.remaining_time -= 1
-        current_time += 1
+    def __len__(self):
+        return len(self.heap)
 
-        # Check if process completed
-        if process.remaining_time == 0:
-            process.completed = True
-            process.completion_time = current_time
-            process.turnaround_time = process.completion_time - process.arrival_time
-            process.waiting_time = process.turnaround_time - process.burst_time
-            completed_count += 1
-            current_process_index = -1
+    def push(self, index):
+        # Flat [key..., index] entries keep heap comparisons to a single level
+        entry = [column[index] for column in self.key_columns]
+        entry.append(index)
+        heapq.heappush(self.heap, entry)
 
-    gantt_chart.append((current_time, None))
-    return gantt_chart
+    def pop(self, current_time):
+        return heapq.heappop(self.heap)[-1]
 
-def preemptive_priority(processes, processes_count):
+    def rows(self):
+        return array("q", [entry[-1] for entry in self.heap])
+
+    def restore(self, rows):
+        # Keys are unique thanks to the index, so the rebuilt heap pops in the same order
+        key_columns = self.key_columns
+        self.heap = [[column[index] for column in key_columns] + [index] for index in rows]
+        heapq.heapify(self.heap)
+
+
+# Certificate time of tournament nodes whose winner never changes
+_NEVER = float("inf")
+
+
+class _ResponseRatioReadyQueue:
     """
-    Preemptive Priority Scheduling Algorithm.
-    Executes highest priority (lowest priority number) process at each time unit.
-    Supports process preemption when higher priority process arrives.
+    Ready queue for HRRN. The response ratio (t - arrival + burst) / burst
+    of a process grows linearly with time t, with slope 1 / burst.
+    Processes with the same burst time keep their order as time passes,
+    so each burst time has a heap ordered by arrival time, then PID, and
+    the heads of these heaps meet in a kinetic tournament tree. Every
+    node of the tree holds the winner of its subtree and the time when
+    the loser overtakes it, and only nodes whose time has come are
+    compared again, so a push or pop costs O(log n) plus the overtakes
+    since the previous pop. Ratios are compared exactly, in integers.
+    """
+
+    def __init__(self, workload):
+        self.arrival_time = workload.arrival_time
+        self.burst_time = workload.burst_time
+        self.pid = workload.pid
+        self.count = 0
+        self.time = 0  # Time the tree is valid at
+        self.groups = []  # Heap of [arrival time, PID, row] entries of every burst time, by leaf
+        self.leaves = {}  # Leaf of every burst time with processes in the queue
+        self.free_leaves = []  # Leaves whose heap ran empty, reused before adding leaves
+        self.capacity = 1
+        self.winner = [-1, -1]  # Row leading every node, -1 for none, the leaves start at capacity
+        self.event = [_NEVER, _NEVER]  # Earliest time a winner in the subtree of every node is overtaken
+        self.stale = False  # Restored rows, the tree is rebuilt on the next pop
+
+    def __len__(self):
+        return self.count
+
+    def push(self, index):
+        burst = self.burst_time[index]
+        leaf = self.leaves.get(burst)
+        if leaf is None:
+            if self.free_leaves:
+                leaf = self.free_leaves.pop()
+            else:
+                leaf = len(self.groups)
+                if leaf == self.capacity:
+                    self._grow()
+                self.groups.append([])
+            self.leaves[burst] = leaf
+        group = self.groups[leaf]
+        heapq.heappush(group, [self.arrival_time[index], self.pid[index], index])
+        self.count += 1
+        # Processes are mostly admitted in arrival order, behind the head of their heap
+        if group[0][-1] == index and not self.stale:
+            self._replay(self.capacity + leaf, index)
+
+    def rows(self):
+        return array("q", [entry[-1] for group in self.groups for entry in group])
+
+    def restore(self, rows):
+        self.count = 0
+        self.groups = []
+        self.leaves = {}
+        self.free_leaves = []
+        self.stale = True
+        for index in rows:
+            self.push(index)
+
+    def pop(self, current_time):
+        if self.stale:
+            self._rebuild(current_time)
+        else:
+            self._advance(current_time)
+        selected = self.winner[1]
+        burst = self.burst_time[selected]
+        leaf = self.leaves[burst]
+        group = self.groups[leaf]
+        heapq.heappop(group)
+        self.count -= 1
+        if not group:
+            del self.leaves[burst]
+            self.free_leaves.append(leaf)
+        self._replay(self.capacity + leaf, group[0][-1] if group else -1)
+        return selected
+
+    def _match(self, node, current_time):
+        """Play the match of a node at current_time, returns whether its winner or event changed."""
+        winner, event = self.winner, self.event
+        left, right = winner[2 * node], winner[2 * node + 1]
+        overtake = _NEVER
+        if left == -1 or right == -1:
+            first = left if right == -1 else right
+        else:
+            arrival_time, burst_time = self.arrival_time, self.burst_time
+            ratio_left = (current_time - arrival_time[left] + burst_time[left]) * burst_time[right]
+            ratio_right = (current_time - arrival_time[right] + burst_time[right]) * burst_time[left]
+            if ratio_left != ratio_right:
+                left_first = ratio_left > ratio_right
+            else:
+                # Tie-breaker: earlier arrival time, then shorter burst time, then lower PID
+                left_first = ((arrival_time[left], burst_time[left], self.pid[left])
+                              < (arrival_time[right], burst_time[right], self.pid[right]))
+            first, second = (left, right) if left_first else (right, left)
+            # Only a shorter burst time, i.e. a steeper ratio, catches up, once ratios are equal at
+            # (a_s * b_f - a_f * b_s) / (b_f - b_s), where the earlier arrival wins the tie
+            if burst_time[second] < burst_time[first]:
+                crossing, rest = divmod(
+                    arrival_time[second] * burst_time[first] - arrival_time[first] * burst_time[second],
+                    burst_time[first] - burst_time[second]
+                )
+                overtake = crossing + 1 if rest or arrival_time[second] > arrival_time[first] else crossing
+        left_event, right_event = event[2 * node], event[2 * node + 1]
+        if left_event < overtake:
+            overtake = left_event
+        if right_event < overtake:
+            overtake = right_event
+        if winner[node] == first and event[node] == overtake:
+            return False
+        winner[node] = first
+        event[node] = overtake
+        return True
+
+    def _replay(self, node, index):
+        # Set the head of a leaf and play its matches again, up to the first one that does not change
+        self.winner[node] = index
+        node //= 2
+        while node and self._match(node, self.time):
+            node //= 2
+
+    def _advance(self, current_time):
+        # Play again every match whose loser overtook the winner by current_time, children first
+        self.time = current_time
+        event = self.event
+        if event[1] > current_time:
+            return
+        capacity = self.capacity
+        due = []
+        stack = [1]
+        while stack:
+            node = stack.pop()
+            if node < capacity and event[node] <= current_time:
+                due.append(node)
+                stack.append(2 * node)
+                stack.append(2 * node + 1)
+        for node in reversed(due):
+            self._match(node, current_time)
+
+    def _rebuild(self, current_time):
+        self.time = current_time
+        self.stale = False
+        capacity = self.capacity
+        self.winner = [-1] * (2 * capacity)
+        self.event = [_NEVER] * (2 * capacity)
+        for leaf, group in enumerate(self.groups):
+            if group:
+                self.winner[capacity + leaf] = group[0][-1]
+        for node in range(capacity - 1, 0, -1):
+            self._match(node, current_time)
+
+    def _grow(self):
+        # Twice as many leaves, the tree is rebuilt at the time it is valid at
+        self.capacity *= 2
+        if not self.stale:
+            self._rebuild(self.time)
+
+
+def _run_non_preemptive(workload, ready_queue, observer=None, checkpoints=None, resume=None):
+    """
+    Shared dispatch loop of the non-preemptive algorithms.
+    Processes are admitted into the ready queue in arrival order and
+    the queue decides which one runs next.
+    """
+    pid, arrival_time, burst_time = workload.pid, workload.arrival_time, workload.burst_time
+    processes_count = len(workload)
+    if resume is None:
+        starting_time = array("q", bytes(8 * processes_count))
+        completion_time = array("q", bytes(8 * processes_count))
+        arrivals = _arrival_order(workload)
+        gantt_chart = GanttChart()
+        current_time, next_arrival, completed_start = 0, 0, 0
+    else:
+        state, arrivals, gantt_chart, starting_time, completion_time = resume
+        current_time, next_arrival, completed_start, _, _, rows, _ = state
+        ready_queue.restore(rows)
+    if checkpoints is not None:
+        checkpoints.arrivals = arrivals
+    if observer is not None:
+        observer.phase("simulation")
+
+    for completed_count in range(completed_start, processes_count):
+        # Save the state for reschedule() before admitting the arrivals of this step
+        if checkpoints is not None and checkpoints.due(len(ready_queue)):
+            checkpoints.save(current_time, next_arrival, completed_count, -1, -1, ready_queue.rows())
+
+        # No process available, CPU stays idle until the next arrival
+        if not ready_queue and arrival_time[arrivals[next_arrival]] > current_time:
+            gantt_chart.append(current_time, arrival_time[arrivals[next_arrival]], IDLE_PID)
+            if observer is not None:
+                observer.idle(current_time, arrival_time[arrivals[next_arrival]])
+            current_time = arrival_time[arrivals[next_arrival]]
+
+        # Add newly arrived processes to ready queue
+        while next_arrival < processes_count and arrival_time[arrivals[next_arrival]] <= current_time:
+            ready_queue.push(arrivals[next_arrival])
+            if observer is not None:
+                observer.arrival(arrival_time[arrivals[next_arrival]], pid[arrivals[next_arrival]])
+            next_arrival += 1
+
+        # Execute selected process
+        i = ready_queue.pop(current_time)
+        starting_time[i] = current_time
+        if observer is not None:
+            observer.dispatch(current_time, pid[i])
+        gantt_chart.append(current_time, current_time + burst_time[i], pid[i])
+        current_time += burst_time[i]
+        completion_time[i] = current_time
+        if observer is not None:
+            observer.completion(current_time, pid[i])
+
+    if observer is not None:
+        observer.finished(current_time)
+    return ScheduleResult(workload, gantt_chart, starting_time, completion_time, checkpoints)
+
+
+def _run_preemptive(workload, remaining_time, ready_queue, observer=None, checkpoints=None, resume=None):
+    """
+    Shared dispatch loop of the preemptive algorithms.
+    A preemption can only happen when a process arrives, so the selected
+    process runs until it completes or the next arrival, whichever comes
+    first, and then goes back to the ready queue.
     """
-    current_time = 0
-    completed_count = 0
-    gantt_chart = []
-    last_pid = -1
-    current_process_index = -1
+    pid, arrival_time = workload.pid, workload.arrival_time
+    processes_count = len(workload)
+    if resume is None:
+        starting_time = array("q", [-1]) * processes_count
+        completion_time = array("q", bytes(8 * processes_count))
+        arrivals = _arrival_order(workload)
+        gantt_chart = GanttChart()
+        current_time, next_arrival, completed_count = 0, 0, 0
+        last_pid = -1
+        preempted = -1  # Row of the process that went back to the ready queue unfinished
+    else:
+        state, arrivals, gantt_chart, starting_time, completion_time = resume
+        current_time, next_arrival, completed_count, last_pid, preempted, rows, remaining = state
+        for i, remaining_row in zip(rows, remaining):
+            remaining_time[i] = remaining_row
+        ready_queue.restore(rows)
+    if checkpoints is not None:
+        checkpoints.arrivals = arrivals
+    if observer is not None:
+        observer.phase("simulation")
 
     while completed_count < processes_count:
-        # Find process with highest priority (lowest priority number)
-        selected_index = -1
-        highest_priority = float('inf')
-        
-        for i, process in enumerate(processes):
-            if process.arrival_time <= current_time and not process.completed:
-                if process.priority < highest_priority:
-                    selected_index = i
-                    highest_priority = process.priority
-                elif process.priority == highest_priority:
-                    # Tie-breaker 1: earlier arrival time
-                    if process.arrival_time < processes[selected_index].arrival_time:
-                        selected_index = i
-                    # Tie-breaker 2: shorter burst time
-                    elif process.arrival_time == processes[selected_index].arrival_time:
-                        if process.burst_time < processes[selected_index].burst_time:
-                            selected_index = i
-                        # Tie-breaker 3: lower PID
-                        elif process.burst_time == processes[selected_index].burst_time:
-                            if process.pid < processes[selected_index].pid:
-                                selected_index = i
-
-        # No process available, advance time
-        if selected_index == -1:
-            current_time += 1
-            current_process_index = -1
-            continue
-        
-        process = processes[selected_index]
-        current_process_index = selected_index
-        
-        # Set starting time on first execution
-        if process.starting_time == -1:
-            process.starting_time = current_time
-            process.response_time = current_time - process.arrival_time
+        # Save the state for reschedule() before admitting the arrivals of this step
+        if checkpoints is not None and checkpoints.due(len(ready_queue)):
+            rows = ready_queue.rows()
+            remaining = array("q", [remaining_time[i] for i in rows])
+            checkpoints.save(current_time, next_arrival, completed_count, last_pid, preempted, rows, remaining)
+
+        # No process available, CPU stays idle until the next arrival
+        if not ready_queue and arrival_time[arrivals[next_arrival]] > current_time:
+            gantt_chart.append(current_time, arrival_time[arrivals[next_arrival]], IDLE_PID)
+            if observer is not None:
+                observer.idle(current_time, arrival_time[arrivals[next_arrival]])
+            current_time = arrival_time[arrivals[next_arrival]]
+            last_pid = -1
+
+        # Add newly arrived processes to ready queue
+        while next_arrival < processes_count and arrival_time[arrivals[next_arrival]] <= current_time:
+            ready_queue.push(arrivals[next_arrival])
+            if observer is not None:
+                observer.arrival(arrival_time[arrivals[next_arrival]], pid[arrivals[next_arrival]])
+            next_arrival += 1
 
-        # Add to gantt chart only when process changes
-        if process.pid != last_pid:
-            gantt_chart.append((current_time, f"P{process.pid}"))
-            last_pid = process.pid
+        i = ready_queue.pop(current_time)
 
-        # Execute for one time unit
-        process.remaining_time -= 1
-        current_time += 1
+        # Set starting time on first execution
+        if starting_time[i] == -1:
+            starting_time[i] = current_time
+
+        # Report a dispatch only when the process changes, last_pid is kept without an observer too for checkpoints
+        if pid[i] != last_pid:
+            last_pid = pid[i]
+            if observer is not None:
+                if preempted != -1:
+                    observer.preemption(current_time, pid[preempted])
+                observer.dispatch(current_time, pid[i])
+
+        # Execute until completion or the next arrival, the chart merges consecutive runs of a process
+        run_until = current_time + remaining_time[i]
+        if next_arrival < processes_count and arrival_time[arrivals[next_arrival]] < run_until:
+            run_until = arrival_time[arrivals[next_arrival]]
+        gantt_chart.append(current_time, run_until, pid[i])
+        remaining_time[i] -= run_until - current_time
+        current_time = run_until
 
         # Check if process completed
-        if process.remaining_time == 0:
-            process.completed = True
-            process.completion_time = current_time
-            process.turnaround_time = process.completion_time - process.arrival_time
-            process.waiting_time = process.turnaround_time - process.burst_time
+        if remaining_time[i] == 0:
+            completion_time[i] = current_time
             completed_count += 1
-            current_process_index = -1
+            preempted = -1
+            if observer is not None:
+                observer.completion(current_time, pid[i])
+        else:
+            ready_queue.push(i)
+            preempted = i
 
-    gantt_chart.append((current_time, None))
-    return gantt_chart
+    if observer is not None:
+        observer.finished(current_time)
+    return ScheduleResult(workload, gantt_chart, starting_time, completion_time, checkpoints)
 
-def round_robin(processes, processes_count, time_quantum):
+
+def _run_round_robin(workload, time_quantum, observer=None, checkpoints=None, resume=None):
     """
-    Round Robin (RR) Scheduling Algorithm.
-    Preemptive scheduling where each process gets a fixed time quantum in circular order.
-    
-    Added Args:
-        time_quantum: Time slice allocated to each process
+    Dispatch loop of Round Robin.
+    Processes that arrive during a quantum are queued ahead of the process
+    that was just preempted.
     """
-    current_time = 0
-    completed_count = 0
-    gantt_chart = []
-    last_pid = -1
-    
-    # Create ready queue - processes ordered by arrival, then PID
-    ready_queue = []
-    processes_copy = sorted(enumerate(processes), key=lambda x: (x[1].arrival_time, x[1].pid))
-    next_process_idx = 0
+    pid, arrival_time = workload.pid, workload.arrival_time
+    processes_count = len(workload)
+    remaining_time = array("q", workload.burst_time)
+    ready_queue = deque()
+    in_queue = bytearray(processes_count)
+    if resume is None:
+        starting_time = array("q", [-1]) * processes_count
+        completion_time = array("q", bytes(8 * processes_count))
+        # Ready queue holds row indices, admitted in arrival order - ordered by arrival, then PID
+        arrivals = _arrival_order(workload)
+        gantt_chart = GanttChart()
+        current_time, next_process_idx, completed_count = 0, 0, 0
+        last_pid = -1
+        preempted = -1  # Row of the process that went back to the ready queue unfinished
+    else:
+        state, arrivals, gantt_chart, starting_time, completion_time = resume
+        current_time, next_process_idx, completed_count, last_pid, preempted, rows, remaining = state
+        for i, remaining_row in zip(rows, remaining):
+            remaining_time[i] = remaining_row
+            in_queue[i] = 1
+        ready_queue.extend(rows)
+    if checkpoints is not None:
+        checkpoints.arrivals = arrivals
+    if observer is not None:
+        observer.phase("simulation")
     
     while completed_count < processes_count:
+        # Save the state for reschedule() before admitting the arrivals of this step
+        if checkpoints is not None and checkpoints.due(len(ready_queue)):
+            rows = array("q", ready_queue)
+            remaining = array("q", [remaining_time[i] for i in rows])
+            checkpoints.save(current_time, next_process_idx, completed_count, last_pid, preempted, rows, remaining)
+
         # Add newly arrived processes to ready queue
-        while next_process_idx < processes_count:
-            idx, process = processes_copy[next_process_idx]
-            if process.arrival_time <= current_time and not process.completed:
-                if idx not in [p[0] for p in ready_queue]:
-                    ready_queue.append((idx, process))
-                    next_process_idx += 1
-            else:
-                break
+        while next_process_idx < processes_count and arrival_time[arrivals[next_process_idx]] <= current_time:
+            idx = arrivals[next_process_idx]
+            if not in_queue[idx]:
+                ready_queue.append(idx)
+                in_queue[idx] = 1
+            if observer is not None:
+                observer.arrival(arrival_time[idx], pid[idx])
+            next_process_idx += 1
         
-        # No process in ready queue, advance time
+        # No process in ready queue, CPU stays idle until the next arrival
         if not ready_queue:
-            current_time += 1
+            gantt_chart.append(current_time, arrival_time[arrivals[next_process_idx]], IDLE_PID)
+            if observer is not None:
+                observer.idle(current_time, arrival_time[arrivals[next_process_idx]])
+            current_time = arrival_time[arrivals[next_process_idx]]
+            last_pid = -1
             continue
         
         # Get process from front of queue
-        selected_index, process = ready_queue.pop(0)
+        selected_index = ready_queue.popleft()
+        in_queue[selected_index] = 0
         
         # Set starting time on first execution
-        if process.starting_time == -1:
-            process.starting_time = current_time
-            process.response_time = current_time - process.arrival_time
+        if starting_time[selected_index] == -1:
+            starting_time[selected_index] = current_time
         
-        # Add to gantt chart when process changes
-        if process.pid != last_pid:
-            gantt_chart.append((current_time, f"P{process.pid}"))
-            last_pid = process.pid
+        # Report a dispatch only when the process changes, last_pid is kept without an observer too for checkpoints
+        if pid[selected_index] != last_pid:
+            last_pid = pid[selected_index]
+            if observer is not None:
+                if preempted != -1:
+                    observer.preemption(current_time, pid[preempted])
+                observer.dispatch(current_time, pid[selected_index])
         
-        # Execute for time quantum or until completion
-        execution_time = min(time_quantum, process.remaining_time)
-        process.remaining_time -= execution_time
+        # Execute for time quantum or until completion, the chart merges consecutive quanta of a process
+        execution_time = min(time_quantum, remaining_time[selected_index])
+        remaining_time[selected_index] -= execution_time
+        gantt_chart.append(current_time, current_time + execution_time, pid[selected_index])
         current_time += execution_time
         
-        # Add newly arrived processes to ready queue during execution
-        while next_process_idx < processes_count:
-            idx, proc = processes_copy[next_process_idx]
-            if proc.arrival_time <= current_time and not proc.completed:
-                if idx not in [p[0] for p in ready_queue] and idx != selected_index:
-                    ready_queue.append((idx, proc))
-                    next_process_idx += 1
-            else:
-                break
+        # Add newly arrived processes to ready queue during execution,
+        # ahead of the process that was just preempted
+        while next_process_idx < processes_count and arrival_time[arrivals[next_process_idx]] <= current_time:
+            idx = arrivals[next_process_idx]
+            if not in_queue[idx]:
+                ready_queue.append(idx)
+                in_queue[idx] = 1
+            if observer is not None:
+                observer.arrival(arrival_time[idx], pid[idx])
+            next_process_idx += 1
         
         # Check if process completed
-        if process.remaining_time == 0:
-            process.completed = True
-            process.completion_time = current_time
-            process.turnaround_time = process.completion_time - process.arrival_time
-            process.waiting_time = process.turnaround_time - process.burst_time
+        if remaining_time[selected_index] == 0:
+            completion_time[selected_index] = current_time
             completed_count += 1
+            preempted = -1
+            if observer is not None:
+                observer.completion(current_time, pid[selected_index])
         else:
             # Process not completed, add back to end of ready queue
-            ready_queue.append((selected_index, process))
+            ready_queue.append(selected_index)
+            in_queue[selected_index] = 1
+            preempted = selected_index
     
-    gantt_chart.append((current_time, None))
-    return gantt_chart
+    if observer is not None:
+        observer.finished(current_time)
+    return ScheduleResult(workload, gantt_chart, starting_time, completion_time, checkpoints)
+
+
+def _ready_queue(workload, algorithm, remaining_time=None):
+    """
+    Return an empty ready queue ordered like the algorithm picks processes.
+    SRTF orders by remaining_time, which the dispatch loop keeps up to date.
+    """
+    if algorithm == "fcfs":
+        # Tie-breaker: earlier arrival time, then lower PID
+        return _HeapReadyQueue(workload.arrival_time, workload.pid)
+    if algorithm == "sjf":
+        # Tie-breaker: shorter burst time, then earlier arrival time, then lower PID
+        return _HeapReadyQueue(workload.burst_time, workload.arrival_time, workload.pid)
+    if algorithm in ("priority", "preemptive_priority"):
+        # Tie-breaker: higher priority, then earlier arrival time, then shorter burst time, then lower PID
+        return _HeapReadyQueue(workload.priority, workload.arrival_time, workload.burst_time, workload.pid)
+    if algorithm == "hrrn":
+        return _ResponseRatioReadyQueue(workload)
+    if algorithm == "srtf":
+        # Tie-breaker: shorter remaining time, then earlier arrival time, then lower PID
+        return _HeapReadyQueue(remaining_time, workload.arrival_time, workload.pid)
+    raise ValueError(f"No ready queue for {algorithm}")
+
+
+def _fcfs(workload, time_quantum=None, observer=None, checkpoints=None, resume=None):
+    return _run_non_preemptive(workload, _ready_queue(workload, "fcfs"), observer, checkpoints, resume)
+
+
+def _sjf(workload, time_quantum=None, observer=None, checkpoints=None, resume=None):
+    return _run_non_preemptive(workload, _ready_queue(workload, "sjf"), observer, checkpoints, resume)
+
+
+def _priority(workload, time_quantum=None, observer=None, checkpoints=None, resume=None):
+    return _run_non_preemptive(workload, _ready_queue(workload, "priority"), observer, checkpoints, resume)
+
+
+def _hrrn(workload, time_quantum=None, observer=None, checkpoints=None, resume=None):
+    return _run_non_preemptive(workload, _ready_queue(workload, "hrrn"), observer, checkpoints, resume)
+
+
+def _srtf(workload, time_quantum=None, observer=None, checkpoints=None, resume=None):
+    remaining_time = array("q", workload.burst_time)
+    ready_queue = _ready_queue(workload, "srtf", remaining_time)
+    return _run_preemptive(workload, remaining_time, ready_queue, observer, checkpoints, resume)
+
+
+def _preemptive_priority(workload, time_quantum=None, observer=None, checkpoints=None, resume=None):
+    remaining_time = array("q", workload.burst_time)
+    ready_queue = _ready_queue(workload, "preemptive_priority")
+    return _run_preemptive(workload, remaining_time, ready_queue, observer, checkpoints, resume)
+
+
+def _rr(workload, time_quantum=None, observer=None, checkpoints=None, resume=None):
+    if time_quantum is None or time_quantum <= 0:
+        raise ValueError("Time quantum must be greater than 0")
+    return _run_round_robin(workload, time_quantum, observer, checkpoints, resume)
+
+
+def _cfs(workload, time_quantum=None, observer=None, checkpoints=None, resume=None):
+    # Saves no checkpoints, so there is never a state to resume
+    return _policies().run_cfs(workload, time_quantum, observer, checkpoints)
+
+
+def _mlfq(workload, time_quantum=None, observer=None, checkpoints=None, resume=None):
+    return _policies().run_mlfq(workload, time_quantum, observer, checkpoints)
+
+
+# Cache schedule() looks runs up in, set with cache.use_cache()
+_result_cache = None
+
+
+def set_result_cache(cache):
+    """Set the cache schedule() looks runs up in (None for none) and return the previous one."""
+    global _result_cache
+    previous, _result_cache = _result_cache, cache
+    return previous
+
+
+def result_cache():
+    """Return the cache schedule() looks runs up in, or None."""
+    return _result_cache
+
+
+# Algorithms available through schedule(), by name
+ALGORITHMS = {
+    "fcfs": _fcfs,
+    "sjf": _sjf,
+    "priority": _priority,
+    "hrrn": _hrrn,
+    "srtf": _srtf,
+    "preemptive_priority": _preemptive_priority,
+    "rr": _rr,
+    "cfs": _cfs,
+    "mlfq": _mlfq,
+}
+
+# Algorithms whose schedule depends on the time quantum (the granularity for cfs, the top level quantum for mlfq)
+TIME_QUANTUM_ALGORITHMS = ("rr", "cfs", "mlfq")
+
+# Algorithms that take the CPU from a running process when a process arrives
+PREEMPTIVE_ALGORITHMS = ("srtf", "preemptive_priority")
+
+
+def schedule(workload, algorithm, time_quantum=None, observer=None, checkpoints=False,
+             cpus=1, balancing="steal", balance_interval=None):
+    """
+    Run a scheduling algorithm without modifying its input.
+    The same workload can be passed to any number of runs, including
+    concurrent ones.
+
+    Args:
+        workload: Workload to schedule (Process objects or a ProcessTable are converted)
+        algorithm: Name of the algorithm, one of ALGORITHMS
+        time_quantum: Time slice for Round Robin, smallest slice for CFS, top level
+            quantum or policies.MLFQParameters for MLFQ
+        observer: Optional observers.SchedulerObserver notified of every event of the run
+        checkpoints: Save Checkpoints in the result, so reschedule() can resume the run (single CPU only)
+        cpus: Number of CPUs, each with its own ready queue
+        balancing: How waiting processes move between CPUs, one of multicore.BALANCING_MODES
+        balance_interval: Time between two periodic balancing passes
+
+    Returns:
+        ScheduleResult: Gantt chart and per-process metrics of the run,
+        a multicore.MultiCoreResult with a Gantt chart lane per CPU when cpus > 1
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown scheduling algorithm: {algorithm}")
+    if checkpoints and cpus != 1:
+        raise ValueError("Checkpoints are only saved for single CPU runs")
+    if observer is not None:
+        observer.phase("setup")
+    if not isinstance(workload, Workload):
+        workload = Workload.from_processes(workload)
+    options = (cpus, balancing, balance_interval)
+    cache = _result_cache
+    if cache is not None and observer is None:
+        result = cache.get(workload, algorithm, time_quantum, checkpoints, *options)
+        if result is None:
+            result = _run_algorithm(workload, algorithm, time_quantum, None, checkpoints, *options)
+            cache.put(workload, algorithm, time_quantum, result, *options)
+        return result
+    return _run_algorithm(workload, algorithm, time_quantum, observer, checkpoints, *options)
+
+
+def _run_algorithm(workload, algorithm, time_quantum=None, observer=None, checkpoints=False,
+                   cpus=1, balancing="steal", balance_interval=None):
+    if cpus != 1:
+        return _multicore().schedule_multi_core(
+            workload, algorithm, time_quantum, cpus, balancing, balance_interval, observer
+        )
+    if checkpoints:
+        return ALGORITHMS[algorithm](workload, time_quantum, observer, Checkpoints(algorithm, time_quantum))
+    return ALGORITHMS[algorithm](workload, time_quantum, observer)
+
+
+def _extends(workload, previous_workload):
+    """Tell whether workload holds the processes of previous_workload, in the same rows, followed by new ones."""
+    previous_count = len(previous_workload)
+    if len(workload) < previous_count:
+        return False
+    return all(
+        getattr(workload, column)[:previous_count] == getattr(previous_workload, column)
+        for column in ("pid", "arrival_time", "burst_time", "priority")
+    )
+
+
+def reschedule(previous, workload, observer=None):
+    """
+    Schedule a workload made of the workload of an earlier run with
+    processes appended, with the same algorithm. The run is resumed from
+    its last checkpoint before the first new arrival, so the cost is
+    proportional to the part of the schedule that changes. Falls back to
+    a full run when previous has no checkpoints or workload does not
+    extend its workload.
+
+    Args:
+        previous: ScheduleResult of a run with checkpoints
+        workload: Workload to schedule (Process objects or a ProcessTable are converted)
+        observer: Optional observers.SchedulerObserver, told where the run resumes, then notified of the events after the checkpoint
+
+    Returns:
+        ScheduleResult: Gantt chart and per-process metrics of the run, with checkpoints
+    """
+    checkpoints = previous.checkpoints
+    if checkpoints is None:
+        raise ValueError("The previous run has no checkpoints")
+    if not isinstance(workload, Workload):
+        workload = Workload.from_processes(workload)
+
+    previous_count = len(previous.workload)
+    processes_count = len(workload)
+    if not _extends(workload, previous.workload):
+        return schedule(workload, checkpoints.algorithm, checkpoints.time_quantum, observer, checkpoints=True)
+    if processes_count == previous_count:
+        return previous
+
+    # Resume from the last state saved before the first new process arrives
+    arrival_time, pid = workload.arrival_time, workload.pid
+    position = checkpoints.last_before(min(arrival_time[previous_count:]))
+    if position == -1:
+        return schedule(workload, checkpoints.algorithm, checkpoints.time_quantum, observer, checkpoints=True)
+    if observer is not None:
+        observer.phase("setup")
+    state = checkpoints.states[position]
+    time, next_arrival, completed_count, _, _, rows, _ = state
+
+    # Every process admitted by then arrived before the new ones, so only the rest of the arrival order changes
+    pending = checkpoints.arrivals[next_arrival:]
+    pending.extend(range(previous_count, processes_count))
+    pending.sort(key=lambda i: (arrival_time[i], pid[i]))
+    arrivals = checkpoints.arrivals[:next_arrival]
+    arrivals.extend(pending)
+
+    # Times of the processes that completed before the checkpoint stay, the others are simulated again
+    added_count = processes_count - previous_count
+    starting_time = array("q", previous.starting_time)
+    starting_time.extend(array("q", [-1]) * added_count)
+    completion_time = array("q", previous.completion_time)
+    completion_time.frombytes(bytes(8 * added_count))
+    for i in chain(rows, pending):
+        if starting_time[i] >= time:
+            starting_time[i] = -1
+
+    resume = (state, arrivals, previous.gantt.until(time), starting_time, completion_time)
+    if observer is not None:
+        observer.resumed(time, completed_count)
+    return ALGORITHMS[checkpoints.algorithm](
+        workload, checkpoints.time_quantum, observer, checkpoints.prefix(position + 1, arrivals), resume
+    )
+
+
+def _schedule_in_place(processes, algorithm, time_quantum=None):
+    """Run an algorithm on Process objects or a ProcessTable and store the results in them."""
+    result = schedule(Workload.from_processes(processes), algorithm, time_quantum)
+    _store_results(processes, result)
+    return result.gantt_chart
+
+
+def first_come_first_serve(processes, processes_count):
+    """
+    First Come First Serve (FCFS) Scheduling Algorithm.
+    Non-preemptive scheduling based on arrival time.
+    """
+    return _schedule_in_place(processes, "fcfs")
+
+
+def shortest_job_first(processes, processes_count):
+    """
+    Shortest Job First (SJF) Scheduling Algorithm.
+    Non-preemptive scheduling based on burst time.
+    """
+    return _schedule_in_place(processes, "sjf")
+
+def non_preemptive_priority(processes, processes_count):
+    """
+    Non-Preemptive Priority Scheduling Algorithm.
+    Non-preemptive scheduling based on priority level.
+    """
+    return _schedule_in_place(processes, "priority")
+
+def highest_response_ratio_next(processes, processes_count):
+    """
+    Highest Response Ratio Next (HRRN) Scheduling Algorithm.
+    Non-preemptive scheduling that favors both short jobs and long-waiting jobs.
+    """
+    return _schedule_in_place(processes, "hrrn")
+
+def shortest_remaining_time_first(processes, processes_count):
+    """
+    Shortest Remaining Time First (SRTF) Scheduling Algorithm.
+    Executes shortest remaining time process until it completes or the next process arrives.
+    Supports process preemption when shorter remaining time process arrives.
+    """
+    return _schedule_in_place(processes, "srtf")
+
+def preemptive_priority(processes, processes_count):
+    """
+    Preemptive Priority Scheduling Algorithm.
+    Executes highest priority (lowest priority number) process until it completes or the next process arrives.
+    Supports process preemption when higher priority process arrives.
+    """
+    return _schedule_in_place(processes, "preemptive_priority")
+
+def round_robin(processes, processes_count, time_quantum):
+    """
+    Round Robin (RR) Scheduling Algorithm.
+    Preemptive scheduling where each process gets a fixed time quantum in circular order.
+    
+    Added Args:
+        time_quantum: Time slice allocated to each process
+    """
+    return _schedule_in_place(processes, "rr", time_quantum)
 
 def calculate_averages(processes, processes_count):
     """
@@ -413,17 +963,13 @@ def calculate_averages(processes, processes_count):
     Returns:
         dict: Contains turnaround_time_avg, waiting_time_avg, response_time_avg
     """
-    turnaround_time_total = 0
-    waiting_time_total = 0
-    response_time_total = 0
-
-    for process in processes:
-        turnaround_time_total += process.turnaround_time
-        waiting_time_total += process.waiting_time
-        response_time_total += process.response_time
-
-    return {
-        "turnaround_time_avg": turnaround_time_total / processes_count,
-        "waiting_time_avg": waiting_time_total / processes_count,
-        "response_time_avg": response_time_total / processes_count
-    }
\ No newline at end of file
+    if isinstance(processes, ProcessTable):
+        return _metrics().averages(
+            processes.turnaround_time, processes.waiting_time, processes.response_time, processes_count
+        )
+    return _metrics().averages(
+        [process.turnaround_time for process in processes],
+        [process.waiting_time for process in processes],
+        [process.response_time for process in processes],
+        processes_count
+    )
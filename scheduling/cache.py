@@ -0,0 +1,220 @@
+"""
+Result Cache
+Memoizes scheduling runs by workload content and algorithm parameters.
+
+A ScheduleCache keeps the most recently used ScheduleResults in memory,
+evicting the least recently used ones beyond maxsize results or
+max_bytes of result columns, and optionally stores every result in a
+directory so that later processes (batch jobs, CLI runs) find them too.
+
+Results are keyed by a BLAKE2 hash of the pid, arrival time, burst time
+and priority columns plus the algorithm name and, for Round Robin, CFS
+and MLFQ, the time quantum, and for multi-core runs the number of CPUs and balancing
+options. The PIDs are part of the key because they appear in the Gantt
+chart and break ties. Multi-core results are only kept in memory.
+
+Once installed with use_cache(), algorithms.schedule() looks every run up
+in the cache, and with it every algorithm function built on schedule().
+Runs with an observer always run, since their events are the point.
+Cached results are shared, so they must not be modified.
+"""
+
+import hashlib
+import os
+import threading
+from array import array
+from collections import OrderedDict
+
+from . import algorithms
+from .gantt import GanttChart
+from .policies import DEFAULT_GRANULARITY, mlfq_parameters
+
+# Results kept in memory by default
+DEFAULT_MAXSIZE = 128
+
+# Bytes of result columns kept in memory by default
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# First header value of a stored result, followed by the format version
+STORE_MAGIC = 0x53434845445253  # "SCHEDRS"
+# Raised whenever the results of a run change, so older stored results are scheduled again
+STORE_VERSION = 2  # 2: CFS reads priorities 1 to 40 as nice values -20 to 19
+
+
+def workload_fingerprint(workload):
+    """Return the BLAKE2 digest of the pid, arrival, burst and priority columns of a workload."""
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(len(workload).to_bytes(8, "little"))
+    for column in (workload.pid, workload.arrival_time, workload.burst_time, workload.priority):
+        digest.update(column)
+    return digest.digest()
+
+
+def cache_key(workload, algorithm, time_quantum=None, cpus=1, balancing="steal", balance_interval=None):
+    """Return the key of a run, the time quantum only counting for the algorithms that use one."""
+    if algorithm not in algorithms.TIME_QUANTUM_ALGORITHMS:
+        time_quantum = None
+    elif algorithm == "mlfq":
+        # A top level quantum and the parameters it stands for schedule the same
+        time_quantum = mlfq_parameters(time_quantum)
+    elif algorithm == "cfs" and time_quantum is None:
+        time_quantum = DEFAULT_GRANULARITY
+    if cpus != 1:
+        return workload_fingerprint(workload), algorithm, time_quantum, cpus, balancing, balance_interval
+    return workload_fingerprint(workload), algorithm, time_quantum
+
+
+def _result_nbytes(result):
+    nbytes = 8 * (len(result.starting_time) + len(result.completion_time))
+    nbytes += 24 * sum(len(lane) for lane in result.lanes)
+    if result.checkpoints is not None:
+        for state in result.checkpoints.states:
+            rows, remaining = state[5], state[6]
+            nbytes += 8 * (len(rows) + (len(remaining) if remaining is not None else 0))
+    return nbytes
+
+
+class ScheduleCache:
+    """
+    LRU cache of ScheduleResults with hit and miss counters.
+    With maxsize 0 results are only kept in the directory.
+    Safe to use from several threads, e.g. the GUI's scheduling workers.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, max_bytes=DEFAULT_MAX_BYTES, directory=None):
+        if maxsize < 0:
+            raise ValueError("Cache size cannot be negative")
+        if maxsize == 0 and directory is None:
+            raise ValueError("A cache without memory needs a directory")
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._results)
+
+    def clear(self):
+        """Forget every result kept in memory, the directory is left as it is."""
+        with self._lock:
+            self._results.clear()
+            self.nbytes = 0
+
+    def get(self, workload, algorithm, time_quantum=None, checkpoints=False,
+            cpus=1, balancing="steal", balance_interval=None):
+        """Return the cached result of a run, or None. With checkpoints, only results that have them count."""
+        key = cache_key(workload, algorithm, time_quantum, cpus, balancing, balance_interval)
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None and (result.checkpoints is not None or not checkpoints):
+                self._results.move_to_end(key)
+                self.hits += 1
+                return result
+        # Stored results are single CPU runs without checkpoints
+        if self.directory is not None and not checkpoints and cpus == 1:
+            result = self._load(key, workload)
+            if result is not None:
+                self._remember(key, result)
+                with self._lock:
+                    self.disk_hits += 1
+                return result
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, workload, algorithm, time_quantum, result, cpus=1, balancing="steal", balance_interval=None):
+        """Cache the result of a run, in memory and in the directory if there is one."""
+        key = cache_key(workload, algorithm, time_quantum, cpus, balancing, balance_interval)
+        self._remember(key, result)
+        if self.directory is not None and cpus == 1:
+            self._store(key, result)
+
+    def as_dict(self):
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "results": len(self._results),
+            "bytes": self.nbytes,
+        }
+
+    def _remember(self, key, result):
+        if not self.maxsize:
+            return
+        nbytes = _result_nbytes(result)
+        with self._lock:
+            previous = self._results.pop(key, None)
+            if previous is not None:
+                self.nbytes -= _result_nbytes(previous)
+            self._results[key] = result
+            self.nbytes += nbytes
+            # Evict least recently used results, always keeping the newest one
+            while len(self._results) > 1 and (
+                len(self._results) > self.maxsize
+                or (self.max_bytes is not None and self.nbytes > self.max_bytes)
+            ):
+                _, evicted = self._results.popitem(last=False)
+                self.nbytes -= _result_nbytes(evicted)
+                self.evictions += 1
+
+    def _path(self, key):
+        fingerprint, algorithm, time_quantum = key
+        name = f"{fingerprint.hex()}-{algorithm}"
+        if time_quantum is not None:
+            name += f"-{time_quantum}"
+        return os.path.join(self.directory, name + ".bin")
+
+    def _store(self, key, result):
+        # Header, then the starting and completion time columns and the Gantt chart columns, all int64
+        path = self._path(key)
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        header = array("q", [STORE_MAGIC, STORE_VERSION, len(result), len(result.gantt)])
+        with open(temporary, "wb") as file:
+            for column in (header, result.starting_time, result.completion_time):
+                file.write(column)
+            for column in (result.gantt.start, result.gantt.end, result.gantt.pid):
+                file.write(column)
+        # Readers only ever see complete files
+        os.replace(temporary, path)
+
+    def _load(self, key, workload):
+        try:
+            with open(self._path(key), "rb") as file:
+                header = array("q")
+                header.fromfile(file, 4)
+                magic, version, processes_count, segments_count = header
+                if magic != STORE_MAGIC or version != STORE_VERSION or processes_count != len(workload):
+                    return None
+                columns = []
+                for count in (processes_count, processes_count, segments_count, segments_count, segments_count):
+                    column = array("q")
+                    column.fromfile(file, count)
+                    columns.append(column)
+        except (OSError, EOFError, ValueError):
+            # Missing, partly written by an older version or unreadable: schedule again
+            return None
+        starting_time, completion_time, start, end, pid = columns
+        gantt = GanttChart()
+        gantt.start, gantt.end, gantt.pid = start, end, pid
+        return algorithms.ScheduleResult(workload, gantt, starting_time, completion_time)
+
+
+def use_cache(cache):
+    """
+    Make algorithms.schedule() look runs up in cache (None to stop caching).
+
+    Returns:
+        ScheduleCache: The cache used before, or None
+    """
+    return algorithms.set_result_cache(cache)
@@ -0,0 +1,359 @@
+"""
+Command Line Interface
+Runs the scheduling algorithms on workload files without the GUI.
+
+Usage:
+    python -m scheduling run ALGORITHM WORKLOAD [-q QUANTUM] [--json PATH]
+                         [--gantt-csv PATH] [--processes-csv PATH] [--stats] [--cache DIR]
+                         [--cpus N] [--balancing MODE] [--balance-interval T]
+                         [--levels N] [--boost-period T] [--binary PATH]
+    python -m scheduling stream ALGORITHM TRACE [-q QUANTUM]
+                         [--gantt-csv PATH] [--processes-csv PATH]
+    python -m scheduling compare WORKLOAD [-a ALGORITHM ...] [-q QUANTUM ...]
+                         [--workers N] [--json PATH] [--cache DIR]
+    python -m scheduling sweep WORKLOAD [-q QUANTUM ... | --range START STOP [STEP]]
+                         [--objective NAME] [--workers N] [--json PATH] [--cache DIR]
+    python -m scheduling convert WORKLOAD OUTPUT
+    python -m scheduling serve [--host HOST] [--port PORT | --unix PATH] [--workers N]
+                         [--batch-size N] [--batch-window MS] [--cache DIR]
+
+Without any output option, run writes the full JSON report to stdout and
+stream writes one JSON object per Gantt segment or completed process.
+With --cache, results are stored in DIR and reused by later commands
+that schedule the same workload with the same algorithm (runs with
+--stats are always simulated, so that there are events to count).
+With --cpus N, run simulates N cores: the report holds one Gantt chart
+lane per core and the Gantt chart CSV gets a core column. For mlfq, -q is
+the quantum of the top level (1 by default), doubled on every one of the
+--levels levels.
+Workloads ending in .bin are columnar binary files (see columnar), which
+are memory-mapped instead of parsed: convert writes one from a CSV or
+JSON workload and run --binary saves the result in the same format.
+serve answers POST /schedule requests with the report of run, see service.
+This module must never import PyQt5, so it can run on headless machines.
+Modules only some commands need (multiprocessing for compare, sweep and
+serve, hashlib for --cache, NumPy for the summary) are imported by those
+commands, so that a plain run starts quickly.
+"""
+
+import argparse
+import csv
+import json
+import sys
+
+from .algorithms import ALGORITHMS, schedule
+from .compare import DEFAULT_TIME_QUANTA, SWEEP_OBJECTIVES
+from .multicore import BALANCING_MODES
+from .policies import DEFAULT_LEVELS, mlfq_parameters
+from .streaming import STREAM_ALGORITHMS, CompletedProcess
+from .workload import iter_trace, read_workload
+
+PROCESS_FIELDS = CompletedProcess._fields
+
+
+def process_rows(result):
+    """Yield one tuple per process with the values of PROCESS_FIELDS."""
+    # Derived here rather than with NumPy, so that writing the CSV does not import it
+    workload = result.workload
+    for pid, arrival_time, burst_time, priority, starting_time, completion_time in zip(
+        workload.pid, workload.arrival_time, workload.burst_time, workload.priority,
+        result.starting_time, result.completion_time
+    ):
+        turnaround_time = completion_time - arrival_time
+        yield (
+            pid, arrival_time, burst_time, priority, starting_time, completion_time,
+            turnaround_time, turnaround_time - burst_time, starting_time - arrival_time
+        )
+
+
+def gantt_rows(result):
+    """Yield (start, end, label) segments, prefixed with the core for multi-core runs."""
+    if result.gantt is not None:
+        return result.gantt.labelled()
+    return (
+        (core, *segment) for core, lane in enumerate(result.lanes) for segment in lane.labelled()
+    )
+
+
+def _segments(chart):
+    return [{"start": start, "end": end, "process": label} for start, end, label in chart.labelled()]
+
+
+def build_report(algorithm, time_quantum, result):
+    """Build the JSON-serializable report of one run, with one Gantt chart lane per core for multi-core runs."""
+    report = {"algorithm": algorithm, "time_quantum": time_quantum, "summary": result.summary()}
+    if result.gantt is not None:
+        report["gantt_chart"] = _segments(result.gantt)
+    else:
+        report["cpus"] = result.cpus
+        report["lanes"] = [_segments(lane) for lane in result.lanes]
+    report["processes"] = [dict(zip(PROCESS_FIELDS, row)) for row in process_rows(result)]
+    return report
+
+
+def _open_output(path):
+    if path == "-":
+        return sys.stdout
+    return open(path, "w", newline="")
+
+
+def _write_json(path, report):
+    file = _open_output(path)
+    try:
+        json.dump(report, file)
+        file.write("\n")
+    finally:
+        if file is not sys.stdout:
+            file.close()
+
+
+def _write_csv(path, header, rows):
+    file = _open_output(path)
+    try:
+        writer = csv.writer(file)
+        writer.writerow(header)
+        writer.writerows(rows)
+    finally:
+        if file is not sys.stdout:
+            file.close()
+
+
+def run_command(args):
+    workload = read_workload(args.workload, with_priority="priority" in args.algorithm)
+    if not len(workload):
+        raise ValueError("Workload has no processes")
+    counters = profiler = observer = None
+    if args.stats:
+        from .observers import Counters, ObserverGroup, WallClockProfiler
+
+        counters, profiler = Counters(), WallClockProfiler()
+        observer = ObserverGroup(counters, profiler)
+    time_quantum = args.time_quantum
+    if args.algorithm == "mlfq":
+        time_quantum = mlfq_parameters(time_quantum, args.levels, args.boost_period)
+    result = schedule(
+        workload, args.algorithm, time_quantum, observer,
+        cpus=args.cpus, balancing=args.balancing, balance_interval=args.balance_interval
+    )
+
+    if args.gantt_csv:
+        header = ("start", "end", "process") if args.cpus == 1 else ("core", "start", "end", "process")
+        _write_csv(args.gantt_csv, header, gantt_rows(result))
+    if args.processes_csv:
+        _write_csv(args.processes_csv, PROCESS_FIELDS, process_rows(result))
+    if args.binary:
+        from .columnar import save_result
+
+        save_result(result, args.binary)
+    if args.json or not (args.gantt_csv or args.processes_csv or args.binary):
+        report = build_report(args.algorithm, args.time_quantum, result)
+        if args.algorithm == "mlfq":
+            report["mlfq"] = time_quantum._asdict()
+        if args.stats:
+            report["counters"] = counters.as_dict()
+            report["profile"] = profiler.as_dict()
+        _write_json(args.json or "-", report)
+
+
+def stream_command(args):
+    from .streaming import Segment, stream_schedule
+
+    trace = iter_trace(args.trace, with_priority="priority" in args.algorithm)
+    events = stream_schedule(trace, args.algorithm, args.time_quantum)
+
+    outputs = []
+    try:
+        gantt_writer = processes_writer = None
+        if args.gantt_csv:
+            outputs.append(_open_output(args.gantt_csv))
+            gantt_writer = csv.writer(outputs[-1])
+            gantt_writer.writerow(Segment._fields)
+        if args.processes_csv:
+            outputs.append(_open_output(args.processes_csv))
+            processes_writer = csv.writer(outputs[-1])
+            processes_writer.writerow(PROCESS_FIELDS)
+        write_lines = not outputs
+
+        for event in events:
+            if isinstance(event, Segment):
+                if gantt_writer:
+                    gantt_writer.writerow(event)
+                if write_lines:
+                    print(json.dumps({"type": "segment", **event._asdict()}))
+            else:
+                if processes_writer:
+                    processes_writer.writerow(event)
+                if write_lines:
+                    print(json.dumps({"type": "process", **event._asdict()}))
+    finally:
+        for file in outputs:
+            if file is not sys.stdout:
+                file.close()
+
+
+def compare_command(args):
+    from .compare import compare, format_report
+
+    workload = read_workload(args.workload)
+    rows = compare(workload, args.algorithms, args.time_quanta, args.workers)
+    if args.json:
+        _write_json(args.json, rows)
+    else:
+        print(format_report(rows))
+
+
+def sweep_command(args):
+    from .compare import format_sweep_report, sweep_time_quantum
+
+    time_quanta = args.time_quanta
+    if args.range:
+        if len(args.range) not in (2, 3):
+            raise ValueError("--range takes START STOP [STEP]")
+        start, stop, step = (args.range + [1])[:3]
+        if step <= 0:
+            raise ValueError("--range step must be greater than 0")
+        time_quanta = range(start, stop + 1, step)
+    workload = read_workload(args.workload)
+    report = sweep_time_quantum(workload, time_quanta, args.objective, args.workers)
+    if args.json:
+        _write_json(args.json, report)
+    else:
+        print(format_sweep_report(report))
+
+
+def convert_command(args):
+    from .columnar import save_workload
+
+    save_workload(read_workload(args.workload), args.output)
+
+
+def serve_command(args):
+    # Imported here, the service module imports this one
+    from .service import serve
+
+    serve(
+        args.host, args.port, args.unix, args.workers, args.batch_size, args.batch_window / 1000,
+        cache_directory=args.cache
+    )
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m scheduling",
+        description="Run CPU scheduling algorithms on workload files."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="schedule a workload with one algorithm")
+    run_parser.add_argument("algorithm", choices=ALGORITHMS)
+    run_parser.add_argument("workload", help="CSV, JSON or columnar workload file")
+    run_parser.add_argument(
+        "-q", "--time-quantum", type=int, help="time quantum for rr, smallest slice for cfs, top level quantum for mlfq"
+    )
+    run_parser.add_argument("--json", metavar="PATH", help="write the full report as JSON ('-' for stdout)")
+    run_parser.add_argument("--gantt-csv", metavar="PATH", help="write the Gantt chart segments as CSV")
+    run_parser.add_argument("--processes-csv", metavar="PATH", help="write the per-process metrics as CSV")
+    run_parser.add_argument("--binary", metavar="PATH", help="write the result as a columnar binary file")
+    run_parser.add_argument(
+        "--stats", action="store_true", help="add event counters and per-phase timing to the JSON report"
+    )
+    run_parser.add_argument("--cache", metavar="DIR", help="reuse results stored in DIR and store new ones there")
+    run_parser.add_argument("--cpus", type=int, default=1, help="number of cores to simulate (default: %(default)s)")
+    run_parser.add_argument(
+        "--balancing", choices=BALANCING_MODES, default="steal",
+        help="how waiting processes move between cores (default: %(default)s)"
+    )
+    run_parser.add_argument(
+        "--balance-interval", type=int, metavar="T",
+        help="time between periodic balancing passes (default: the mean burst time)"
+    )
+    run_parser.add_argument(
+        "--levels", type=int, default=DEFAULT_LEVELS, help="number of mlfq levels (default: %(default)s)"
+    )
+    run_parser.add_argument(
+        "--boost-period", type=int, metavar="T",
+        help="time between mlfq boosts to the top level (default: 10 quanta of the lowest level)"
+    )
+    run_parser.set_defaults(handler=run_command)
+
+    stream_parser = commands.add_parser(
+        "stream", help="schedule an arrival-sorted trace incrementally, with bounded memory"
+    )
+    stream_parser.add_argument("algorithm", choices=STREAM_ALGORITHMS)
+    stream_parser.add_argument("trace", help="arrival-sorted CSV, JSON Lines or columnar trace file")
+    stream_parser.add_argument("-q", "--time-quantum", type=int, help="time quantum for rr")
+    stream_parser.add_argument("--gantt-csv", metavar="PATH", help="write the Gantt chart segments as CSV")
+    stream_parser.add_argument("--processes-csv", metavar="PATH", help="write the per-process metrics as CSV")
+    stream_parser.set_defaults(handler=stream_command)
+
+    compare_parser = commands.add_parser("compare", help="run several algorithms on one workload in parallel")
+    compare_parser.add_argument("workload", help="CSV, JSON or columnar workload file")
+    compare_parser.add_argument(
+        "-a", "--algorithms", nargs="+", choices=ALGORITHMS, metavar="ALGORITHM",
+        help="algorithms to compare (default: all)"
+    )
+    compare_parser.add_argument(
+        "-q", "--time-quanta", nargs="+", type=int, default=DEFAULT_TIME_QUANTA, metavar="QUANTUM",
+        help="time quanta to run rr, cfs and mlfq with (default: %(default)s)"
+    )
+    compare_parser.add_argument("--workers", type=int, help="number of worker processes")
+    compare_parser.add_argument("--json", metavar="PATH", help="write the report as JSON instead of a table")
+    compare_parser.add_argument("--cache", metavar="DIR", help="reuse results stored in DIR and store new ones there")
+    compare_parser.set_defaults(handler=compare_command)
+
+    sweep_parser = commands.add_parser(
+        "sweep", help="run rr with a range of time quanta in parallel and report the best one"
+    )
+    sweep_parser.add_argument("workload", help="CSV, JSON or columnar workload file")
+    quanta_group = sweep_parser.add_mutually_exclusive_group()
+    quanta_group.add_argument(
+        "-q", "--time-quanta", nargs="+", type=int, metavar="QUANTUM",
+        help="time quanta to try (default: 1 up to the longest burst time, at most 20)"
+    )
+    quanta_group.add_argument(
+        "--range", nargs="+", type=int, metavar="N", help="try every quantum from START to STOP by STEP"
+    )
+    sweep_parser.add_argument(
+        "--objective", choices=SWEEP_OBJECTIVES, default="waiting_time_avg",
+        help="statistic the best quantum minimizes (default: %(default)s)"
+    )
+    sweep_parser.add_argument("--workers", type=int, help="number of worker processes")
+    sweep_parser.add_argument("--json", metavar="PATH", help="write the report as JSON instead of a table")
+    sweep_parser.add_argument("--cache", metavar="DIR", help="reuse results stored in DIR and store new ones there")
+    sweep_parser.set_defaults(handler=sweep_command)
+
+    convert_parser = commands.add_parser("convert", help="write a workload as a columnar binary file")
+    convert_parser.add_argument("workload", help="CSV, JSON or columnar workload file")
+    convert_parser.add_argument("output", help="columnar workload file to write")
+    convert_parser.set_defaults(handler=convert_command)
+
+    serve_parser = commands.add_parser("serve", help="serve the algorithms over HTTP/JSON")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: %(default)s)")
+    serve_parser.add_argument("--port", type=int, default=8765, help="port to listen on (default: %(default)s)")
+    serve_parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of a port")
+    serve_parser.add_argument("--workers", type=int, help="number of worker processes")
+    serve_parser.add_argument(
+        "--batch-size", type=int, default=32, help="most requests sent to a worker at once (default: %(default)s)"
+    )
+    serve_parser.add_argument(
+        "--batch-window", type=float, default=2, metavar="MS",
+        help="milliseconds a batch waits for more requests, 0 to never wait (default: %(default)s)"
+    )
+    serve_parser.add_argument("--cache", metavar="DIR", help="reuse results stored in DIR and store new ones there")
+    serve_parser.set_defaults(handler=serve_command)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        if getattr(args, "cache", None):
+            from .cache import ScheduleCache, use_cache
+
+            use_cache(ScheduleCache(directory=args.cache))
+        args.handler(args)
+    except (OSError, ValueError) as error:
+        parser.exit(1, f"error: {error}\n")
+    return 0
@@ -0,0 +1,131 @@
+"""
+Columnar Files
+Binary workload and schedule result files that are memory-mapped instead
+of parsed, so a trace of any size opens in constant time and processes
+mapping the same file share one copy of it in the page cache.
+
+A file is a header of HEADER_FIELDS native int64 values (magic, format
+version, kind, number of processes, number of Gantt chart segments, then
+reserved zeros) followed by native int64 columns, back to back:
+    workload: pid, arrival_time, burst_time, priority
+    result: the workload columns, then starting_time, completion_time and
+        the Gantt chart start, end and pid columns
+
+The workload columns are laid out as Workload.from_buffer() expects, so
+loading wraps the mapping without copying it and the schedulers and
+metrics read the file directly. Loaded columns are read-only. Values are
+not validated again on load: files are only written from Workloads,
+which went through the workload file checks. Files are written to a
+temporary file and renamed, so processes that still map an older version
+of a file keep reading it unchanged.
+"""
+
+import mmap
+import os
+import threading
+from array import array
+
+from .algorithms import ScheduleResult
+from .gantt import GanttChart
+from .process import Workload
+
+# File extension read_workload() recognizes as a columnar workload
+EXTENSION = ".bin"
+
+FILE_MAGIC = 0x5343484544434F4C  # "SCHEDCOL"
+FILE_VERSION = 1
+
+# Kinds of files
+WORKLOAD = 1
+RESULT = 2
+
+# Header values, padded so the columns start 64 bytes into the file
+HEADER_FIELDS = 8
+HEADER_BYTES = 8 * HEADER_FIELDS
+
+
+def _write(path, kind, processes_count, segments_count, columns):
+    header = array("q", [FILE_MAGIC, FILE_VERSION, kind, processes_count, segments_count])
+    header.extend([0] * (HEADER_FIELDS - len(header)))
+    temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(header)
+        for column in columns:
+            file.write(column)
+    os.replace(temporary, path)
+
+
+def save_workload(workload, path):
+    """Write a Workload as a columnar workload file."""
+    _write(path, WORKLOAD, len(workload), 0, [getattr(workload, name) for name in Workload.__slots__])
+
+
+def save_result(result, path):
+    """
+    Write a single CPU ScheduleResult, with its workload, as a columnar
+    result file. Checkpoints are not saved.
+    """
+    if result.gantt is None:
+        raise ValueError("Only single CPU results can be saved")
+    columns = [getattr(result.workload, name) for name in Workload.__slots__]
+    columns += [result.starting_time, result.completion_time]
+    columns += [result.gantt.start, result.gantt.end, result.gantt.pid]
+    _write(path, RESULT, len(result), len(result.gantt), columns)
+
+
+def _map(path):
+    """Map a columnar file and check its header, returning the mapping, kind and counts."""
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size < HEADER_BYTES:
+            raise ValueError(f"{path} is not a columnar scheduling file")
+        # The mapping stays valid after the file is closed
+        data = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+    magic, version, kind, processes_count, segments_count = data[:HEADER_BYTES].cast("q")[:5]
+    if magic != FILE_MAGIC:
+        raise ValueError(f"{path} is not a columnar scheduling file (or has another byte order)")
+    if version != FILE_VERSION:
+        raise ValueError(f"{path} has unsupported format version {version}")
+    if kind not in (WORKLOAD, RESULT) or processes_count < 0 or segments_count < 0:
+        raise ValueError(f"{path} has an invalid header")
+    columns_size = 4 * processes_count
+    if kind == RESULT:
+        columns_size += 2 * processes_count + 3 * segments_count
+    if len(data) != HEADER_BYTES + 8 * columns_size:
+        raise ValueError(f"{path} is truncated or corrupt")
+    return data, kind, processes_count, segments_count
+
+
+def load_workload(path):
+    """
+    Map the workload of a columnar workload or result file, without
+    copying it.
+
+    Returns:
+        Workload: Workload whose columns are views of the file
+    """
+    data, _, processes_count, _ = _map(path)
+    return Workload.from_buffer(data[HEADER_BYTES:HEADER_BYTES + 32 * processes_count], processes_count)
+
+
+def load_result(path):
+    """
+    Map a columnar result file, without copying it.
+
+    Returns:
+        ScheduleResult: Result and workload whose columns are views of the file
+    """
+    data, kind, processes_count, segments_count = _map(path)
+    if kind != RESULT:
+        raise ValueError(f"{path} holds a workload, not a schedule result")
+    workload_end = HEADER_BYTES + 32 * processes_count
+    workload = Workload.from_buffer(data[HEADER_BYTES:workload_end], processes_count)
+
+    columns = []
+    position = workload_end
+    for count in (processes_count, processes_count, segments_count, segments_count, segments_count):
+        columns.append(data[position:position + 8 * count].cast("q").toreadonly())
+        position += 8 * count
+    starting_time, completion_time, start, end, pid = columns
+    gantt = GanttChart()
+    gantt.start, gantt.end, gantt.pid = start, end, pid
+    return ScheduleResult(workload, gantt, starting_time, completion_time)
@@ -0,0 +1,241 @@
+"""
+Algorithm Comparison
+Runs several scheduling algorithms on one workload in parallel worker
+processes and collects their statistics side by side. A Round Robin time
+quantum sweep runs the same way and reports the best quantum.
+
+The workload is copied once into a shared memory block. Every worker wraps
+that block as a Workload without copying it, so the input is never pickled
+or duplicated per algorithm. When the installed result cache has a
+directory, the workers look their runs up in the same directory.
+"""
+
+import os
+import time
+
+from .algorithms import ALGORITHMS, TIME_QUANTUM_ALGORITHMS, result_cache, schedule
+from .process import Workload
+
+# Time quanta of Round Robin, CFS and MLFQ compared when none are given
+DEFAULT_TIME_QUANTA = (2, 4, 8)
+
+# Summary columns shown by format_report, with their headers
+REPORT_COLUMNS = (
+    ("turnaround_time_avg", "Avg TAT"),
+    ("waiting_time_avg", "Avg WT"),
+    ("response_time_avg", "Avg RT"),
+    ("waiting_time_p99", "P99 WT"),
+    ("throughput", "Throughput"),
+    ("cpu_utilization", "CPU Util"),
+    ("jain_fairness", "Fairness"),
+    ("context_switches", "Switches"),
+    ("elapsed", "Seconds"),
+)
+
+# Statistics a time quantum sweep can minimize
+SWEEP_OBJECTIVES = ("turnaround_time_avg", "waiting_time_avg", "response_time_avg", "context_switches")
+
+# Largest time quantum swept when none are given
+MAX_SWEEP_TIME_QUANTUM = 20
+
+# Columns shown by format_sweep_report, with their headers
+SWEEP_COLUMNS = (
+    ("turnaround_time_avg", "Avg TAT"),
+    ("waiting_time_avg", "Avg WT"),
+    ("response_time_avg", "Avg RT"),
+    ("context_switches", "Switches"),
+)
+
+
+def worker_context():
+    """
+    Multiprocessing context of the worker pools. Workers are started by a
+    fork server (spawned where there is none), never forked from the
+    caller, so they do not inherit its threads, sockets or GUI state.
+    """
+    # multiprocessing is only imported once workers are started, so the CLI can use the constants above cheaply
+    import multiprocessing
+
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _summarize_run(workload, algorithm, time_quantum):
+    started = time.perf_counter()
+    result = schedule(workload, algorithm, time_quantum)
+    elapsed = time.perf_counter() - started
+    summary = result.summary()
+    summary["context_switches"] = result.context_switches()
+    summary["elapsed"] = elapsed
+    return summary
+
+
+def _run_shared(shared_name, processes_count, algorithm, time_quantum):
+    """Worker: schedule the shared workload with one algorithm and summarize it."""
+    from multiprocessing import shared_memory
+
+    shared = shared_memory.SharedMemory(name=shared_name)
+    try:
+        return _summarize_run(Workload.from_buffer(shared.buf, processes_count), algorithm, time_quantum)
+    except Exception as error:
+        # The traceback frames still hold views of the shared block, which would keep it from closing
+        raise error.with_traceback(None) from None
+    finally:
+        shared.close()
+
+
+def _use_stored_results(directory):
+    """Worker initializer: cache runs in the directory of the parent's result cache."""
+    from .cache import ScheduleCache, use_cache
+
+    # Nothing is kept in memory, results would keep views of the shared block alive
+    use_cache(ScheduleCache(maxsize=0, directory=directory))
+
+
+def comparison_tasks(algorithms=None, time_quanta=DEFAULT_TIME_QUANTA):
+    """Return the (algorithm, time_quantum) pairs to run, with one task per quantum for rr, cfs and mlfq."""
+    tasks = []
+    for algorithm in algorithms or ALGORITHMS:
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown scheduling algorithm: {algorithm}")
+        if algorithm in TIME_QUANTUM_ALGORITHMS:
+            if not time_quanta:
+                raise ValueError(f"No time quanta given for {algorithm}")
+            if min(time_quanta) <= 0:
+                raise ValueError("Time quantum must be greater than 0")
+            tasks.extend((algorithm, time_quantum) for time_quantum in time_quanta)
+        else:
+            tasks.append((algorithm, None))
+    return tasks
+
+
+def run_parallel(workload, tasks, max_workers=None):
+    """
+    Run (algorithm, time_quantum) tasks on a workload in a process pool.
+
+    Returns:
+        list: One summary dict per task, in task order
+    """
+    if not isinstance(workload, Workload):
+        workload = Workload.from_processes(workload)
+    if not len(workload):
+        raise ValueError("Workload has no processes")
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+
+    shared = shared_memory.SharedMemory(create=True, size=workload.nbytes())
+    try:
+        workload.write_to(shared.buf)
+        max_workers = max_workers or min(len(tasks), os.cpu_count() or 1)
+        initializer, initargs = None, ()
+        cache = result_cache()
+        if cache is not None and cache.directory is not None:
+            initializer, initargs = _use_stored_results, (cache.directory,)
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=worker_context(), initializer=initializer, initargs=initargs
+        ) as executor:
+            futures = [
+                executor.submit(_run_shared, shared.name, len(workload), algorithm, time_quantum)
+                for algorithm, time_quantum in tasks
+            ]
+            return [future.result() for future in futures]
+    finally:
+        shared.close()
+        shared.unlink()
+
+
+def compare(workload, algorithms=None, time_quanta=DEFAULT_TIME_QUANTA, max_workers=None):
+    """
+    Run every algorithm (Round Robin, CFS and MLFQ once per time quantum)
+    on the same workload in parallel.
+
+    Args:
+        workload: Workload to schedule (Process objects or a ProcessTable are converted)
+        algorithms: Algorithm names to compare, all of ALGORITHMS by default
+        time_quanta: Time quanta to run Round Robin, CFS and MLFQ with
+        max_workers: Number of worker processes, one per task up to the CPU count by default
+
+    Returns:
+        list: One row per run with algorithm, time_quantum and the metrics.summarize statistics
+    """
+    tasks = comparison_tasks(algorithms, time_quanta)
+    summaries = run_parallel(workload, tasks, max_workers)
+    return [
+        {"algorithm": algorithm, "time_quantum": time_quantum, **summary}
+        for (algorithm, time_quantum), summary in zip(tasks, summaries)
+    ]
+
+
+def default_time_quanta(workload):
+    """
+    Time quanta swept when none are given: every quantum from 1 up to the
+    longest burst time (larger quanta schedule exactly like FCFS), capped
+    at MAX_SWEEP_TIME_QUANTUM.
+    """
+    longest_burst = max(workload.burst_time, default=1)
+    return range(1, min(longest_burst, MAX_SWEEP_TIME_QUANTUM) + 1)
+
+
+def sweep_time_quantum(workload, time_quanta=None, objective="waiting_time_avg", max_workers=None):
+    """
+    Run Round Robin once per time quantum in parallel and pick the quantum
+    that minimizes the objective.
+
+    Args:
+        workload: Workload to schedule (Process objects or a ProcessTable are converted)
+        time_quanta: Time quanta to try, default_time_quanta(workload) by default
+        objective: Statistic to minimize, one of SWEEP_OBJECTIVES
+        max_workers: Number of worker processes, one per quantum up to the CPU count by default
+
+    Returns:
+        dict: Contains objective, best_time_quantum (the smallest quantum on
+        ties) and runs, one compare() row per quantum
+    """
+    if objective not in SWEEP_OBJECTIVES:
+        raise ValueError(f"Unknown sweep objective: {objective}")
+    if not isinstance(workload, Workload):
+        workload = Workload.from_processes(workload)
+    if time_quanta is None:
+        time_quanta = default_time_quanta(workload)
+
+    runs = compare(workload, ["rr"], sorted(set(time_quanta)), max_workers)
+    best = min(runs, key=lambda row: (row[objective], row["time_quantum"]))
+    return {"objective": objective, "best_time_quantum": best["time_quantum"], "runs": runs}
+
+
+def _format_table(lines):
+    widths = [max(len(line[column]) for line in lines) for column in range(len(lines[0]))]
+    return "\n".join(
+        "  ".join(value.ljust(width) if column == 0 else value.rjust(width)
+                  for column, (value, width) in enumerate(zip(line, widths)))
+        for line in lines
+    )
+
+
+def _format_value(value):
+    return f"{value:.4f}" if isinstance(value, float) else str(value)
+
+
+def format_report(rows):
+    """Format comparison rows as a plain text table."""
+    header = ["Algorithm"] + [title for _, title in REPORT_COLUMNS]
+    lines = [header]
+    for row in rows:
+        name = row["algorithm"]
+        if row["time_quantum"] is not None:
+            name += f" (q={row['time_quantum']})"
+        lines.append([name] + [_format_value(row[key]) for key, _ in REPORT_COLUMNS])
+    return _format_table(lines)
+
+
+def format_sweep_report(report):
+    """Format a sweep_time_quantum report as a plain text table, marking the best quantum."""
+    lines = [["Quantum"] + [title for _, title in SWEEP_COLUMNS]]
+    for row in report["runs"]:
+        quantum = str(row["time_quantum"])
+        if row["time_quantum"] == report["best_time_quantum"]:
+            quantum += " *"
+        lines.append([quantum] + [_format_value(row[key]) for key, _ in SWEEP_COLUMNS])
+    return (_format_table(lines)
+            + f"\n\nBest time quantum for {report['objective']}: {report['best_time_quantum']}")
@@ -0,0 +1,105 @@
+"""
+Gantt Chart
+Compact record of which process held the CPU over time.
+
+Segments are stored as parallel array('q') columns of start time, end
+time and PID, with IDLE_PID marking idle CPU time, so a chart of millions
+of segments holds no Python objects per segment. The legacy list of
+(time, "P<pid>") tuples used by the GUI is built only when asked for.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from operator import countOf
+
+IDLE = "Idle"
+
+# PID stored for segments where the CPU was idle
+IDLE_PID = -1
+
+
+class GanttChart:
+    """
+    Gantt chart as start, end and pid columns.
+    Appending a segment that continues the previous one (same PID, no gap)
+    extends it instead of adding a new segment.
+    """
+
+    __slots__ = ("start", "end", "pid", "_legacy")
+
+    def __init__(self):
+        self.start = array("q")
+        self.end = array("q")
+        self.pid = array("q")
+        self._legacy = None
+
+    def append(self, start, end, pid):
+        """Record that pid (IDLE_PID for idle) held the CPU from start to end."""
+        if start == end:
+            return
+        self._legacy = None
+        if self.pid and self.pid[-1] == pid and self.end[-1] == start:
+            self.end[-1] = end
+            return
+        self.start.append(start)
+        self.end.append(end)
+        self.pid.append(pid)
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __getitem__(self, index):
+        return self.start[index], self.end[index], self.pid[index]
+
+    def __iter__(self):
+        return zip(self.start, self.end, self.pid)
+
+    @property
+    def end_time(self):
+        """End of the last segment, 0 for an empty chart."""
+        return self.end[-1] if self.end else 0
+
+    def index_at(self, time):
+        """Index of the segment running at time, or -1 when time is outside the chart. O(log n)."""
+        index = bisect_right(self.start, time) - 1
+        if index < 0 or time >= self.end[index]:
+            return -1
+        return index
+
+    def pid_at(self, time):
+        """PID running at time, IDLE_PID when the CPU was idle, None outside the chart."""
+        index = self.index_at(time)
+        return self.pid[index] if index != -1 else None
+
+    def until(self, time):
+        """Return a new chart holding the part of this one before time."""
+        count = bisect_left(self.start, time)
+        chart = GanttChart()
+        # Columns of a chart loaded from a file are read-only views, the new chart gets arrays
+        chart.start = array("q", self.start[:count])
+        chart.end = array("q", self.end[:count])
+        chart.pid = array("q", self.pid[:count])
+        if count and chart.end[-1] > time:
+            chart.end[-1] = time
+        return chart
+
+    def process_segments(self):
+        """Number of segments in which a process (not the idle CPU) ran."""
+        return len(self.pid) - countOf(self.pid, IDLE_PID)
+
+    def labelled(self):
+        """Yield (start, end, label) segments with the legacy "P<pid>" and IDLE labels."""
+        for start, end, pid in zip(self.start, self.end, self.pid):
+            yield start, end, IDLE if pid == IDLE_PID else f"P{pid}"
+
+    def to_list(self):
+        """
+        Return the legacy Gantt chart list: (start time, "P<pid>") entries,
+        (start time, IDLE) for idle CPU time and a final (end time, None)
+        entry. Built on first use and cached.
+        """
+        if self._legacy is None:
+            legacy = [(start, label) for start, _, label in self.labelled()]
+            legacy.append((self.end_time, None))
+            self._legacy = legacy
+        return self._legacy
@@ -0,0 +1,106 @@
+"""
+Schedule Metrics
+Derives per-process timing metrics and whole-schedule statistics from the
+arrival, burst, starting and completion time columns of a run.
+
+Every function works on whole columns at once with NumPy, so the cost per
+process is a few vectorized operations instead of Python attribute access.
+Columns can be array('q') objects, memoryviews or NumPy arrays. Small
+schedules are summarized by summaries instead, without NumPy.
+"""
+
+import numpy as np
+
+from .summaries import WAITING_TIME_PERCENTILES
+
+
+def _column(values):
+    """View a column as an int64 NumPy array, without copying when possible."""
+    if isinstance(values, np.ndarray):
+        return values.astype(np.int64, copy=False)
+    try:
+        return np.frombuffer(values, dtype=np.int64)
+    except (TypeError, ValueError):
+        return np.asarray(values, dtype=np.int64)
+
+
+def process_metrics(arrival_time, burst_time, starting_time, completion_time):
+    """
+    Calculate turnaround, waiting and response time of every process.
+
+    Returns:
+        tuple: turnaround_time, waiting_time, response_time as int64 arrays
+    """
+    arrival_time = _column(arrival_time)
+    turnaround_time = _column(completion_time) - arrival_time
+    waiting_time = turnaround_time - _column(burst_time)
+    response_time = _column(starting_time) - arrival_time
+    return turnaround_time, waiting_time, response_time
+
+
+def averages(turnaround_time, waiting_time, response_time, processes_count=None):
+    """
+    Calculate average turnaround time, waiting time, and response time.
+
+    Returns:
+        dict: Contains turnaround_time_avg, waiting_time_avg, response_time_avg
+    """
+    turnaround_time = _column(turnaround_time)
+    if processes_count is None:
+        processes_count = len(turnaround_time)
+    return {
+        "turnaround_time_avg": int(turnaround_time.sum()) / processes_count,
+        "waiting_time_avg": int(_column(waiting_time).sum()) / processes_count,
+        "response_time_avg": int(_column(response_time).sum()) / processes_count
+    }
+
+
+def jain_fairness(values):
+    """
+    Jain's fairness index of the values: 1.0 when all are equal, down to
+    1/n when a single process gets everything.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    square_sum = np.dot(values, values)
+    if square_sum == 0:
+        return 1.0
+    return float(values.sum() ** 2 / (len(values) * square_sum))
+
+
+def summarize(arrival_time, burst_time, starting_time, completion_time, cpus=1):
+    """
+    Calculate the statistics of a whole schedule.
+
+    Args:
+        cpus: Number of CPUs the processes were scheduled on
+
+    Returns:
+        dict: Contains turnaround_time_avg, waiting_time_avg, response_time_avg,
+        waiting_time_max, waiting_time_p50/p90/p99, makespan, throughput
+        (processes completed per time unit), cpu_utilization (busy fraction
+        of the makespan, averaged over the CPUs) and jain_fairness (over
+        each process's turnaround time divided by its burst time)
+    """
+    arrival_time = _column(arrival_time)
+    burst_time = _column(burst_time)
+    processes_count = len(arrival_time)
+    if processes_count == 0:
+        raise ValueError("Cannot summarize a schedule without processes")
+
+    turnaround_time, waiting_time, response_time = process_metrics(
+        arrival_time, burst_time, starting_time, completion_time
+    )
+
+    # The schedule spans from the first arrival to the last completion
+    makespan = int(_column(completion_time).max() - arrival_time.min())
+    busy_time = int(burst_time.sum())
+
+    summary = averages(turnaround_time, waiting_time, response_time)
+    summary["waiting_time_max"] = int(waiting_time.max())
+    for percentile, value in zip(WAITING_TIME_PERCENTILES, np.percentile(waiting_time, WAITING_TIME_PERCENTILES)):
+        summary[f"waiting_time_p{percentile}"] = float(value)
+    summary["makespan"] = makespan
+    summary["throughput"] = processes_count / makespan if makespan else 0.0
+    summary["cpu_utilization"] = busy_time / (makespan * cpus) if makespan else 0.0
+    summary["jain_fairness"] = jain_fairness(turnaround_time / burst_time)
+    return summary
@@ -0,0 +1,301 @@
+"""
+Multi-Core Scheduling
+Simulates the scheduling algorithms on several CPUs sharing one workload.
+
+Every core has its own ready queue, ordered the way the algorithm picks
+processes on a single CPU, and its own Gantt chart lane. An arriving
+process is placed on the core with the fewest unfinished processes
+(lowest core number on ties), and every core then schedules its own
+queue like a single CPU: SRTF and Preemptive Priority preempt when a
+process arrives on the core, Round Robin after every quantum. Balancing
+moves waiting processes between cores:
+    steal: A core that runs out of processes takes the next process of
+        the core with the longest ready queue
+    periodic: Every balance_interval time units, waiting processes move
+        from the most to the least loaded cores until their loads differ
+        by at most one
+    none: Processes stay on the core they were placed on
+
+The simulation jumps from event to event (arrivals, ends of runs and
+balance ticks) and a dispatch costs O(log n) ready queue operations,
+plus O(cpus) to pick a core. With one CPU the schedule is the same as the
+single CPU one. CFS and MLFQ only run on a single CPU.
+"""
+
+import heapq
+from array import array
+from collections import deque
+
+from .algorithms import (
+    ALGORITHMS, PREEMPTIVE_ALGORITHMS, ScheduleResult, _arrival_order, _ready_queue, _summarize
+)
+from .gantt import IDLE_PID, GanttChart
+
+BALANCING_MODES = ("steal", "periodic", "none")
+
+# Algorithms that can run on several CPUs
+MULTI_CORE_ALGORITHMS = tuple(algorithm for algorithm in ALGORITHMS if algorithm not in ("cfs", "mlfq"))
+
+_NEVER = float("inf")
+
+
+class MultiCoreResult(ScheduleResult):
+    """
+    Outcome of a multi-core run.
+    Instead of one Gantt chart (gantt is None) it holds one lane per core,
+    the core every process completed on and the busy time of every core.
+    """
+
+    __slots__ = ("lanes", "core", "busy_time")
+
+    def __init__(self, workload, lanes, starting_time, completion_time, core, busy_time):
+        super().__init__(workload, None, starting_time, completion_time)
+        self.lanes = lanes
+        self.core = core
+        self.busy_time = busy_time
+
+    @property
+    def cpus(self):
+        return len(self.lanes)
+
+    @property
+    def gantt_chart(self):
+        """The lane of every core as a legacy list of (time, label) tuples."""
+        return [lane.to_list() for lane in self.lanes]
+
+    def utilization(self):
+        """Busy fraction of every core between the first arrival and the last completion."""
+        span = max(self.completion_time) - min(self.workload.arrival_time)
+        return [busy_time / span if span else 0.0 for busy_time in self.busy_time]
+
+    def summary(self):
+        """Return the metrics.summarize statistics, plus cpus and core_utilization."""
+        summary = _summarize(*self._columns(), cpus=self.cpus)
+        summary["cpus"] = self.cpus
+        summary["core_utilization"] = self.utilization()
+        return summary
+
+    def context_switches(self):
+        """Count the times a core was handed to a different process, over all cores."""
+        return sum(max(lane.process_segments() - 1, 0) for lane in self.lanes)
+
+
+class _FifoReadyQueue:
+    """Round Robin ready queue, row indices in the order they were queued."""
+
+    def __init__(self):
+        self.queue = deque()
+
+    def __len__(self):
+        return len(self.queue)
+
+    def push(self, index):
+        self.queue.append(index)
+
+    def pop(self, current_time):
+        return self.queue.popleft()
+
+
+def _balance(queues, load, waiting, current_time):
+    """
+    Move waiting processes from the most to the least loaded cores until
+    loads differ by at most one. Returns the cores that received processes.
+    """
+    receivers = []
+    while True:
+        busiest = load.index(max(load))
+        idlest = load.index(min(load))
+        # A load of two or more means at least one process is waiting
+        if load[busiest] - load[idlest] <= 1:
+            return receivers
+        queues[idlest].push(queues[busiest].pop(current_time))
+        load[busiest] -= 1
+        waiting[busiest] -= 1
+        load[idlest] += 1
+        waiting[idlest] += 1
+        receivers.append(idlest)
+
+
+def schedule_multi_core(workload, algorithm, time_quantum=None, cpus=2, balancing="steal",
+                        balance_interval=None, observer=None):
+    """
+    Run a scheduling algorithm on several CPUs without modifying its input.
+
+    Args:
+        workload: Workload to schedule
+        algorithm: Name of the algorithm, one of MULTI_CORE_ALGORITHMS
+        time_quantum: Time slice for Round Robin
+        cpus: Number of cores
+        balancing: How waiting processes move between cores, one of BALANCING_MODES
+        balance_interval: Time between two periodic balancing passes, the mean burst time by default
+        observer: Optional observers.SchedulerObserver notified of the events of every core
+
+    Returns:
+        MultiCoreResult: Gantt chart lane of every core and per-process metrics of the run
+    """
+    if cpus <= 0:
+        raise ValueError("Number of CPUs must be greater than 0")
+    if algorithm not in MULTI_CORE_ALGORITHMS:
+        raise ValueError(f"{algorithm} cannot run on several CPUs")
+    if balancing not in BALANCING_MODES:
+        raise ValueError(f"Unknown balancing mode: {balancing}")
+    if algorithm == "rr" and (time_quantum is None or time_quantum <= 0):
+        raise ValueError("Time quantum must be greater than 0")
+    if balance_interval is None:
+        balance_interval = max(round(sum(workload.burst_time) / max(len(workload), 1)), 1)
+    elif balance_interval <= 0:
+        raise ValueError("Balance interval must be greater than 0")
+
+    pid, arrival_time = workload.pid, workload.arrival_time
+    processes_count = len(workload)
+    remaining_time = array("q", workload.burst_time)
+    starting_time = array("q", [-1]) * processes_count
+    completion_time = array("q", bytes(8 * processes_count))
+    core = array("q", bytes(8 * processes_count))
+    if algorithm == "rr":
+        queues = [_FifoReadyQueue() for _ in range(cpus)]
+    else:
+        queues = [_ready_queue(workload, algorithm, remaining_time) for _ in range(cpus)]
+    preemptive = algorithm in PREEMPTIVE_ALGORITHMS
+    quantum = time_quantum if algorithm == "rr" else None
+    stealing = balancing == "steal"
+    periodic = balancing == "periodic"
+
+    # State of every core
+    lanes = [GanttChart() for _ in range(cpus)]
+    busy_time = [0] * cpus
+    load = [0] * cpus  # Processes placed on the core and not completed yet
+    waiting = [0] * cpus  # Processes in the ready queue of the core
+    running = [-1] * cpus
+    run_start = [0] * cpus
+    run_token = [0] * cpus  # Tells the current run of a core from the runs it preempted
+    last_pid = [-1] * cpus
+    preempted = [-1] * cpus  # Row of the process that went back to the ready queue unfinished
+
+    # Ends of the runs in progress as [time, core, token], outdated when the token is not current
+    run_ends = []
+    arrivals = _arrival_order(workload)
+    next_arrival = 0
+    next_balance = _NEVER
+    completed_count = 0
+    if observer is not None:
+        observer.phase("simulation")
+
+    while completed_count < processes_count:
+        # Next event: an arrival, the end of a run or a balance tick
+        while run_ends and run_ends[0][2] != run_token[run_ends[0][1]]:
+            heapq.heappop(run_ends)
+        current_time = next_balance
+        if next_arrival < processes_count and arrival_time[arrivals[next_arrival]] < current_time:
+            current_time = arrival_time[arrivals[next_arrival]]
+        if run_ends and run_ends[0][0] < current_time:
+            current_time = run_ends[0][0]
+        touched = []
+        expired = []
+
+        # Runs ending now, with a completion or at the end of a quantum
+        while run_ends and run_ends[0][0] == current_time:
+            _, c, token = heapq.heappop(run_ends)
+            if token != run_token[c]:
+                continue
+            i = running[c]
+            running[c] = -1
+            lanes[c].append(run_start[c], current_time, pid[i])
+            busy_time[c] += current_time - run_start[c]
+            remaining_time[i] -= current_time - run_start[c]
+            if remaining_time[i] == 0:
+                completion_time[i] = current_time
+                core[i] = c
+                load[c] -= 1
+                completed_count += 1
+                preempted[c] = -1
+                if observer is not None:
+                    observer.completion(current_time, pid[i])
+            else:
+                expired.append((c, i))
+            touched.append(c)
+
+        # Add newly arrived processes to the ready queue of the least loaded core
+        while next_arrival < processes_count and arrival_time[arrivals[next_arrival]] == current_time:
+            i = arrivals[next_arrival]
+            next_arrival += 1
+            c = load.index(min(load))
+            queues[c].push(i)
+            load[c] += 1
+            waiting[c] += 1
+            touched.append(c)
+            if observer is not None:
+                observer.arrival(current_time, pid[i])
+            if periodic and next_balance == _NEVER:
+                next_balance = current_time + balance_interval
+
+        # Processes at the end of their quantum queue up behind the processes that just arrived
+        for c, i in expired:
+            queues[c].push(i)
+            waiting[c] += 1
+            preempted[c] = i
+
+        if current_time == next_balance:
+            touched.extend(_balance(queues, load, waiting, current_time))
+            next_balance = current_time + balance_interval if max(waiting) else _NEVER
+
+        # Dispatch on the cores whose state changed, in the order they changed
+        for c in dict.fromkeys(touched):
+            i = running[c]
+            if i != -1:
+                if not preemptive:
+                    continue
+                # The running process goes back to the ready queue and keeps the core unless a better one arrived
+                running[c] = -1
+                run_token[c] += 1
+                lanes[c].append(run_start[c], current_time, pid[i])
+                busy_time[c] += current_time - run_start[c]
+                remaining_time[i] -= current_time - run_start[c]
+                queues[c].push(i)
+                waiting[c] += 1
+                preempted[c] = i
+
+            queue = queues[c]
+            if not waiting[c]:
+                if not stealing:
+                    continue
+                victim = waiting.index(max(waiting))
+                if not waiting[victim]:
+                    continue
+                queue.push(queues[victim].pop(current_time))
+                load[victim] -= 1
+                waiting[victim] -= 1
+                load[c] += 1
+                waiting[c] += 1
+
+            i = queue.pop(current_time)
+            waiting[c] -= 1
+            lane = lanes[c]
+            if lane.end_time < current_time:
+                # The core was idle since its last run
+                if observer is not None:
+                    observer.idle(lane.end_time, current_time)
+                lane.append(lane.end_time, current_time, IDLE_PID)
+                last_pid[c] = -1
+
+            # Set starting time on first execution
+            if starting_time[i] == -1:
+                starting_time[i] = current_time
+
+            # Report a dispatch only when the process changes
+            if observer is not None and pid[i] != last_pid[c]:
+                if preempted[c] != -1:
+                    observer.preemption(current_time, pid[preempted[c]])
+                observer.dispatch(current_time, pid[i])
+            last_pid[c] = pid[i]
+
+            # Run until completion, or for one quantum with Round Robin
+            run_time = remaining_time[i] if quantum is None else min(quantum, remaining_time[i])
+            running[c] = i
+            run_start[c] = current_time
+            run_token[c] += 1
+            heapq.heappush(run_ends, [current_time + run_time, c, run_token[c]])
+
+    if observer is not None:
+        observer.finished(max(completion_time, default=0))
+    return MultiCoreResult(workload, lanes, starting_time, completion_time, core, busy_time)
@@ -0,0 +1,247 @@
+"""
+Scheduler Observers
+Hooks that follow a scheduling run event by event.
+
+Pass an observer to algorithms.schedule() to have the dispatch loop call
+it on every event of the run. Without an observer the loops only skip a
+few `is not None` checks, so scheduling costs the same as before.
+
+Events, all with simulated times:
+    phase(name): The run entered a phase ("setup", then "simulation")
+    resumed(time, completed): reschedule() resumes the run from a checkpoint
+        at time, with completed processes already completed
+    arrival(time, pid): A process arrived (time is its arrival time)
+    dispatch(time, pid): A process was given the CPU
+    preemption(time, pid): A running process lost the CPU before completing
+    completion(time, pid): A process completed
+    idle(start, end): The CPU was idle because no process was ready
+    finished(time): The run ended, time is the last completion time
+
+A hook may raise ScheduleCancelled to abort the run, which is how
+ProgressReporter implements cancellation.
+"""
+
+import time
+
+# Events between two cancellation checks of ProgressReporter
+CHECK_EVENTS = 1024
+
+# Longest time between two reports of ProgressReporter while a run goes on, in seconds
+REPORT_INTERVAL = 0.1
+
+
+class SchedulerObserver:
+    """Base class of observers, every hook does nothing. Override the events of interest."""
+
+    def phase(self, name):
+        pass
+
+    def resumed(self, time, completed):
+        pass
+
+    def arrival(self, time, pid):
+        pass
+
+    def dispatch(self, time, pid):
+        pass
+
+    def preemption(self, time, pid):
+        pass
+
+    def completion(self, time, pid):
+        pass
+
+    def idle(self, start, end):
+        pass
+
+    def finished(self, time):
+        pass
+
+
+class Counters(SchedulerObserver):
+    """Counts the events of a run and adds up the idle time."""
+
+    def __init__(self):
+        self.arrivals = 0
+        self.dispatches = 0
+        self.preemptions = 0
+        self.completions = 0
+        self.idle_periods = 0
+        self.idle_time = 0
+
+    def arrival(self, time, pid):
+        self.arrivals += 1
+
+    def dispatch(self, time, pid):
+        self.dispatches += 1
+
+    def preemption(self, time, pid):
+        self.preemptions += 1
+
+    def completion(self, time, pid):
+        self.completions += 1
+
+    def idle(self, start, end):
+        self.idle_periods += 1
+        self.idle_time += end - start
+
+    @property
+    def context_switches(self):
+        # Every dispatch after the first hands the CPU to a different process
+        return max(self.dispatches - 1, 0)
+
+    def as_dict(self):
+        return {
+            "arrivals": self.arrivals,
+            "dispatches": self.dispatches,
+            "preemptions": self.preemptions,
+            "completions": self.completions,
+            "context_switches": self.context_switches,
+            "idle_periods": self.idle_periods,
+            "idle_time": self.idle_time,
+        }
+
+
+class WallClockProfiler(SchedulerObserver):
+    """Measures the wall-clock seconds spent in each phase of a run."""
+
+    def __init__(self):
+        self.seconds = {}
+        self._phase = None
+        self._started = None
+
+    def _close_phase(self):
+        if self._phase is not None:
+            elapsed = time.perf_counter() - self._started
+            self.seconds[self._phase] = self.seconds.get(self._phase, 0.0) + elapsed
+            self._phase = None
+
+    def phase(self, name):
+        self._close_phase()
+        self._phase = name
+        self._started = time.perf_counter()
+
+    def finished(self, time):
+        self._close_phase()
+
+    @property
+    def total(self):
+        return sum(self.seconds.values())
+
+    def as_dict(self):
+        return {**self.seconds, "total": self.total}
+
+
+class ObserverGroup(SchedulerObserver):
+    """Forwards every event to several observers, in order."""
+
+    def __init__(self, *observers):
+        self.observers = observers
+
+    def phase(self, name):
+        for observer in self.observers:
+            observer.phase(name)
+
+    def resumed(self, time, completed):
+        for observer in self.observers:
+            observer.resumed(time, completed)
+
+    def arrival(self, time, pid):
+        for observer in self.observers:
+            observer.arrival(time, pid)
+
+    def dispatch(self, time, pid):
+        for observer in self.observers:
+            observer.dispatch(time, pid)
+
+    def preemption(self, time, pid):
+        for observer in self.observers:
+            observer.preemption(time, pid)
+
+    def completion(self, time, pid):
+        for observer in self.observers:
+            observer.completion(time, pid)
+
+    def idle(self, start, end):
+        for observer in self.observers:
+            observer.idle(start, end)
+
+    def finished(self, time):
+        for observer in self.observers:
+            observer.finished(time)
+
+
+class ScheduleCancelled(Exception):
+    """Raised from an observer hook to stop a run before it finishes."""
+
+
+class ProgressReporter(SchedulerObserver):
+    """
+    Reports the number of completed processes every `every` completions,
+    and at least every REPORT_INTERVAL seconds while the run goes on, and
+    cancels the run by raising ScheduleCancelled once cancel_event (a
+    threading.Event) is set. Cancellation is checked at every completion
+    and every CHECK_EVENTS other events, so runs with few completions (long
+    processes preempted over and over) can be cancelled quickly too.
+    """
+
+    def __init__(self, processes_count, report, cancel_event=None, every=None):
+        self.processes_count = processes_count
+        self.report = report
+        self.cancel_event = cancel_event
+        # About a hundred reports per run unless told otherwise
+        self.every = every or max(processes_count // 100, 1)
+        self.completed = 0
+        self.events = 0
+        self._reported_at = time.perf_counter()
+
+    def _check_cancelled(self):
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise ScheduleCancelled("Scheduling was cancelled")
+
+    def _report(self):
+        self._reported_at = time.perf_counter()
+        self.report(self.completed, self.processes_count)
+
+    def _tick(self):
+        # Called every CHECK_EVENTS events only, the hooks run once per event of the run
+        self._check_cancelled()
+        if time.perf_counter() - self._reported_at >= REPORT_INTERVAL:
+            self._report()
+
+    def phase(self, name):
+        self._check_cancelled()
+
+    def resumed(self, time, completed):
+        # Processes completed before the checkpoint count as done
+        self.completed = completed
+        self._report()
+
+    def arrival(self, time, pid):
+        self.events += 1
+        if not self.events % CHECK_EVENTS:
+            self._tick()
+
+    def dispatch(self, time, pid):
+        self.events += 1
+        if not self.events % CHECK_EVENTS:
+            self._tick()
+
+    def preemption(self, time, pid):
+        self.events += 1
+        if not self.events % CHECK_EVENTS:
+            self._tick()
+
+    def idle(self, start, end):
+        self.events += 1
+        if not self.events % CHECK_EVENTS:
+            self._tick()
+
+    def completion(self, time, pid):
+        self._check_cancelled()
+        self.completed += 1
+        self.events += 1
+        if self.completed % self.every == 0 or self.completed == self.processes_count:
+            self._report()
+        elif not self.events % CHECK_EVENTS:
+            self._tick()
@@ -0,0 +1,345 @@
+"""
+Kernel-Style Scheduling Policies
+Completely Fair Scheduler (CFS) and Multi-Level Feedback Queue (MLFQ).
+
+CFS runs the ready process with the smallest virtual runtime, the time it
+ran scaled down by its weight, so heavier processes get a larger share of
+the CPU. The weight comes from the priority, mapped onto the Linux nice
+values (priorities 1 to 40 are nice -20 to 19, so lower numbers weigh
+more, and processes without a priority get the nice 0 weight) and looked
+up in the kernel's nice-to-weight table. The running process keeps the CPU for its
+weighted share of the scheduling latency, at least one granularity (the
+time quantum), then goes back to the ready queue, a heap ordered by
+virtual runtime. Arriving processes start at the smallest virtual runtime
+of the queue and wait for the end of the running slice.
+
+MLFQ keeps one Round Robin queue per level. Processes arrive on the top
+level and drop one level whenever they use up the quantum of their level,
+and a process on a lower level is preempted as soon as a process arrives.
+Every boost_period time units all processes move back to the top level,
+so long processes are not starved.
+
+Each dispatch costs O(log n) for CFS and O(levels) for MLFQ, plus O(n)
+per MLFQ boost. Runs save no checkpoints, so reschedule() runs them again
+from the start.
+"""
+
+import heapq
+from array import array
+from collections import deque, namedtuple
+
+from .algorithms import ScheduleResult, _arrival_order
+from .gantt import IDLE_PID, GanttChart
+
+# Weight of a process with nice value 0
+NICE_0_WEIGHT = 1024
+
+# Priority read as nice value 0, priorities are 1-based like those of the other algorithms
+NICE_0_PRIORITY = 21
+
+# Weight of every nice value from -20 to 19, as in the Linux kernel
+NICE_TO_WEIGHT = (
+    88761, 71755, 56483, 46273, 36291, 29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906, 3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423, 335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45, 36, 29, 23, 18, 15,
+)
+
+# Smallest CFS slice when no time quantum is given
+DEFAULT_GRANULARITY = 1
+
+# CFS scheduling latency, shared among the ready processes, in granularities
+LATENCY_GRANULARITIES = 8
+
+# Virtual runtime units per time unit of a nice 0 process, so that heavy processes still advance
+VRUNTIME_SCALE = 1024
+
+# MLFQ levels when only a time quantum is given
+DEFAULT_LEVELS = 3
+
+# MLFQ top level quantum when no time quantum is given
+DEFAULT_TOP_QUANTUM = 1
+
+# MLFQ boost period when none is given, in quanta of the lowest level
+BOOST_PERIOD_QUANTA = 10
+
+
+def nice_weight(priority):
+    """
+    Return the CFS weight of a priority. Priorities 1 to 40 are nice values
+    -20 to 19, larger priorities are nice 19 and 0 (no priority) is nice 0.
+    """
+    if priority <= 0:
+        return NICE_0_WEIGHT
+    return NICE_TO_WEIGHT[min(priority, len(NICE_TO_WEIGHT)) - 1]
+
+
+class MLFQParameters(namedtuple("MLFQParameters", ("quanta", "boost_period"))):
+    """Time quantum of every MLFQ level, from the top level down, and the boost period."""
+
+    __slots__ = ()
+
+    def __str__(self):
+        return "x".join(map(str, self.quanta)) + f"-boost{self.boost_period}"
+
+
+def mlfq_parameters(time_quantum=None, levels=DEFAULT_LEVELS, boost_period=None):
+    """
+    Build MLFQParameters from the quantum of the top level, doubled on every lower level.
+
+    Args:
+        time_quantum: Quantum of the top level (DEFAULT_TOP_QUANTUM by default), or MLFQParameters returned as they are
+        levels: Number of levels
+        boost_period: Time between two boosts, BOOST_PERIOD_QUANTA quanta of the lowest level by default
+
+    Returns:
+        MLFQParameters: Quanta of every level and boost period
+    """
+    if isinstance(time_quantum, MLFQParameters):
+        parameters = time_quantum
+    else:
+        if time_quantum is None:
+            time_quantum = DEFAULT_TOP_QUANTUM
+        elif time_quantum <= 0:
+            raise ValueError("Time quantum must be greater than 0")
+        if levels <= 0:
+            raise ValueError("Number of levels must be greater than 0")
+        quanta = tuple(time_quantum << level for level in range(levels))
+        if boost_period is None:
+            boost_period = BOOST_PERIOD_QUANTA * quanta[-1]
+        parameters = MLFQParameters(quanta, boost_period)
+    if not parameters.quanta or min(parameters.quanta) <= 0:
+        raise ValueError("Time quantum must be greater than 0")
+    if parameters.boost_period <= 0:
+        raise ValueError("Boost period must be greater than 0")
+    return parameters
+
+
+def run_cfs(workload, granularity=None, observer=None, checkpoints=None):
+    """
+    Dispatch loop of CFS, see the module docstring.
+
+    Args:
+        workload: Workload to schedule
+        granularity: Smallest slice a process runs for, DEFAULT_GRANULARITY by default
+        observer: Optional observers.SchedulerObserver notified of every event of the run
+        checkpoints: Checkpoints passed on to the result, no states are saved
+
+    Returns:
+        ScheduleResult: Gantt chart and per-process metrics of the run
+    """
+    if granularity is None:
+        granularity = DEFAULT_GRANULARITY
+    elif granularity <= 0:
+        raise ValueError("Time quantum must be greater than 0")
+    latency = LATENCY_GRANULARITIES * granularity
+
+    pid, arrival_time = workload.pid, workload.arrival_time
+    processes_count = len(workload)
+    remaining_time = array("q", workload.burst_time)
+    weight = array("q", map(nice_weight, workload.priority))
+    starting_time = array("q", [-1]) * processes_count
+    completion_time = array("q", bytes(8 * processes_count))
+    arrivals = _arrival_order(workload)
+    gantt_chart = GanttChart()
+
+    # Ready queue of [virtual runtime, arrival time, PID, row] entries - ties go to the earlier arrival, then lower PID
+    ready_queue = []
+    preempted_entry = None  # Entry of the process that just ran, pushed and popped again in one step
+    total_weight = 0  # Weight of the ready and running processes
+    min_vruntime = 0  # Never decreases, so arriving processes cannot undercut processes that waited
+    current_time, next_process_idx, completed_count = 0, 0, 0
+    last_pid = -1
+    preempted = -1  # Row of the process that went back to the ready queue unfinished
+    if observer is not None:
+        observer.phase("simulation")
+
+    while completed_count < processes_count:
+        # Newly arrived processes start at the smallest virtual runtime
+        if preempted_entry is not None:
+            leftmost = min(ready_queue[0][0], preempted_entry[0]) if ready_queue else preempted_entry[0]
+        else:
+            leftmost = ready_queue[0][0] if ready_queue else min_vruntime
+        if leftmost > min_vruntime:
+            min_vruntime = leftmost
+        while next_process_idx < processes_count and arrival_time[arrivals[next_process_idx]] <= current_time:
+            i = arrivals[next_process_idx]
+            heapq.heappush(ready_queue, [min_vruntime, arrival_time[i], pid[i], i])
+            total_weight += weight[i]
+            if observer is not None:
+                observer.arrival(arrival_time[i], pid[i])
+            next_process_idx += 1
+
+        # Run the process with the smallest virtual runtime
+        if preempted_entry is not None:
+            entry = heapq.heappushpop(ready_queue, preempted_entry)
+            preempted_entry = None
+        elif ready_queue:
+            entry = heapq.heappop(ready_queue)
+        else:
+            # No process in ready queue, CPU stays idle until the next arrival
+            next_time = arrival_time[arrivals[next_process_idx]]
+            gantt_chart.append(current_time, next_time, IDLE_PID)
+            if observer is not None:
+                observer.idle(current_time, next_time)
+            current_time = next_time
+            last_pid = -1
+            continue
+        selected_index = entry[3]
+        if starting_time[selected_index] == -1:
+            starting_time[selected_index] = current_time
+
+        # Report a dispatch only when the process changes
+        if observer is not None and pid[selected_index] != last_pid:
+            if preempted != -1:
+                observer.preemption(current_time, pid[preempted])
+            observer.dispatch(current_time, pid[selected_index])
+        last_pid = pid[selected_index]
+
+        # Slice: the weighted share of the latency, at least one granularity, the chart merges consecutive slices
+        time_slice = max(granularity, latency * weight[selected_index] // total_weight)
+        execution_time = min(time_slice, remaining_time[selected_index])
+        remaining_time[selected_index] -= execution_time
+        gantt_chart.append(current_time, current_time + execution_time, pid[selected_index])
+        current_time += execution_time
+
+        if remaining_time[selected_index] == 0:
+            completion_time[selected_index] = current_time
+            completed_count += 1
+            total_weight -= weight[selected_index]
+            preempted = -1
+            if observer is not None:
+                observer.completion(current_time, pid[selected_index])
+        else:
+            entry[0] += execution_time * VRUNTIME_SCALE * NICE_0_WEIGHT // weight[selected_index]
+            preempted_entry = entry
+            preempted = selected_index
+
+    if observer is not None:
+        observer.finished(current_time)
+    return ScheduleResult(workload, gantt_chart, starting_time, completion_time, checkpoints)
+
+
+def run_mlfq(workload, parameters=None, observer=None, checkpoints=None):
+    """
+    Dispatch loop of MLFQ, see the module docstring.
+    Processes that arrive during a quantum are queued ahead of the process
+    that was just demoted, like with Round Robin. A preempted process goes
+    back to the front of its level and keeps the rest of its quantum.
+
+    Args:
+        workload: Workload to schedule
+        parameters: Time quantum of the top level or MLFQParameters, see mlfq_parameters
+        observer: Optional observers.SchedulerObserver notified of every event of the run
+        checkpoints: Checkpoints passed on to the result, no states are saved
+
+    Returns:
+        ScheduleResult: Gantt chart and per-process metrics of the run
+    """
+    quanta, boost_period = mlfq_parameters(parameters)
+    lowest_level = len(quanta) - 1
+
+    pid, arrival_time = workload.pid, workload.arrival_time
+    processes_count = len(workload)
+    remaining_time = array("q", workload.burst_time)
+    used_time = array("q", bytes(8 * processes_count))  # Part of the quantum of its level a process used up
+    starting_time = array("q", [-1]) * processes_count
+    completion_time = array("q", bytes(8 * processes_count))
+    arrivals = _arrival_order(workload)
+    gantt_chart = GanttChart()
+
+    queues = [deque() for _ in quanta]
+    partial = []  # Rows preempted before the end of their quantum since the last boost
+    current_time, next_process_idx, completed_count = 0, 0, 0
+    next_boost = boost_period
+    last_pid = -1
+    preempted = -1  # Row of the process that went back to a queue unfinished
+    if observer is not None:
+        observer.phase("simulation")
+
+    while completed_count < processes_count:
+        # Boost: every process moves to the top level, in level order, with a full quantum
+        if current_time >= next_boost:
+            top = queues[0]
+            for queue in queues[1:]:
+                top.extend(queue)
+                queue.clear()
+            for i in partial:
+                used_time[i] = 0
+            partial.clear()
+            next_boost = (current_time // boost_period + 1) * boost_period
+
+        # Newly arrived processes start on the top level
+        while next_process_idx < processes_count and arrival_time[arrivals[next_process_idx]] <= current_time:
+            i = arrivals[next_process_idx]
+            queues[0].append(i)
+            if observer is not None:
+                observer.arrival(arrival_time[i], pid[i])
+            next_process_idx += 1
+
+        # Highest level with a process
+        level = 0
+        while level <= lowest_level and not queues[level]:
+            level += 1
+
+        # No process in any queue, CPU stays idle until the next arrival
+        if level > lowest_level:
+            next_time = arrival_time[arrivals[next_process_idx]]
+            gantt_chart.append(current_time, next_time, IDLE_PID)
+            if observer is not None:
+                observer.idle(current_time, next_time)
+            current_time = next_time
+            last_pid = -1
+            continue
+
+        selected_index = queues[level].popleft()
+        if starting_time[selected_index] == -1:
+            starting_time[selected_index] = current_time
+
+        # Report a dispatch only when the process changes
+        if observer is not None and pid[selected_index] != last_pid:
+            if preempted != -1:
+                observer.preemption(current_time, pid[preempted])
+            observer.dispatch(current_time, pid[selected_index])
+        last_pid = pid[selected_index]
+
+        # Run for the rest of the quantum, until completion, the next boost or, below the top level, the next arrival
+        end_time = current_time + min(quanta[level] - used_time[selected_index], remaining_time[selected_index])
+        if level and next_process_idx < processes_count and arrival_time[arrivals[next_process_idx]] < end_time:
+            end_time = arrival_time[arrivals[next_process_idx]]
+        if next_boost < end_time:
+            end_time = next_boost
+        execution_time = end_time - current_time
+        remaining_time[selected_index] -= execution_time
+        used_time[selected_index] += execution_time
+        gantt_chart.append(current_time, end_time, pid[selected_index])
+        current_time = end_time
+
+        # Add newly arrived processes to the top level during execution, ahead of the process that ran
+        while next_process_idx < processes_count and arrival_time[arrivals[next_process_idx]] <= current_time:
+            i = arrivals[next_process_idx]
+            queues[0].append(i)
+            if observer is not None:
+                observer.arrival(arrival_time[i], pid[i])
+            next_process_idx += 1
+
+        if remaining_time[selected_index] == 0:
+            completion_time[selected_index] = current_time
+            completed_count += 1
+            preempted = -1
+            if observer is not None:
+                observer.completion(current_time, pid[selected_index])
+        elif used_time[selected_index] == quanta[level]:
+            # Quantum used up: drop one level, the lowest level works like Round Robin
+            used_time[selected_index] = 0
+            queues[min(level + 1, lowest_level)].append(selected_index)
+            preempted = selected_index
+        else:
+            # Preempted by an arrival or a boost: back to the front of its level
+            queues[level].appendleft(selected_index)
+            partial.append(selected_index)
+            preempted = selected_index
+
+    if observer is not None:
+        observer.finished(current_time)
+    return ScheduleResult(workload, gantt_chart, starting_time, completion_time, checkpoints)
@@ -1,4 +1,11 @@
+from array import array
+
 class Process:
+    __slots__ = (
+        "pid", "arrival_time", "burst_time", "priority", "remaining_time", "starting_time",
+        "completion_time", "turnaround_time", "waiting_time", "response_time", "completed"
+    )
+
     def __init__(self, pid, arrival_time, burst_time, priority=0):
         self.pid = pid
         self.arrival_time = arrival_time
@@ -10,4 +17,207 @@ class Process:
         self.turnaround_time = 0
         self.waiting_time = 0
         self.response_time = 0
-        self.completed = False
\ No newline at end of file
+        self.completed = False
+
+
+# Integer columns of a ProcessTable, one per Process attribute
+TABLE_COLUMNS = (
+    "pid", "arrival_time", "burst_time", "priority", "remaining_time", "starting_time",
+    "completion_time", "turnaround_time", "waiting_time", "response_time"
+)
+
+
+class ProcessTable:
+    """
+    Columnar storage for many processes.
+    Every Process attribute is kept in its own array('q') column (and a
+    bytearray for completed), so a process costs 81 bytes instead of a
+    full Python object. Indexing or iterating yields ProcessRow views
+    that behave like Process objects.
+    """
+
+    __slots__ = TABLE_COLUMNS + ("completed",)
+
+    def __init__(self, pids=(), arrival_times=(), burst_times=(), priorities=None):
+        self.pid = array("q", pids)
+        self.arrival_time = array("q", arrival_times)
+        self.burst_time = array("q", burst_times)
+        processes_count = len(self.pid)
+        if len(self.arrival_time) != processes_count or len(self.burst_time) != processes_count:
+            raise ValueError("All columns must have the same length")
+
+        if priorities is None:
+            self.priority = array("q", bytes(8 * processes_count))
+        else:
+            self.priority = array("q", priorities)
+            if len(self.priority) != processes_count:
+                raise ValueError("All columns must have the same length")
+
+        self.remaining_time = array("q", self.burst_time)
+        self.starting_time = array("q", [-1]) * processes_count
+        self.completion_time = array("q", bytes(8 * processes_count))
+        self.turnaround_time = array("q", bytes(8 * processes_count))
+        self.waiting_time = array("q", bytes(8 * processes_count))
+        self.response_time = array("q", bytes(8 * processes_count))
+        self.completed = bytearray(processes_count)
+
+    @classmethod
+    def from_processes(cls, processes):
+        """Build a table from Process objects (or anything with the same attributes)."""
+        return cls(
+            [process.pid for process in processes],
+            [process.arrival_time for process in processes],
+            [process.burst_time for process in processes],
+            [process.priority for process in processes]
+        )
+
+    def append(self, pid, arrival_time, burst_time, priority=0):
+        """Add one process to the end of the table."""
+        self.pid.append(pid)
+        self.arrival_time.append(arrival_time)
+        self.burst_time.append(burst_time)
+        self.priority.append(priority)
+        self.remaining_time.append(burst_time)
+        self.starting_time.append(-1)
+        self.completion_time.append(0)
+        self.turnaround_time.append(0)
+        self.waiting_time.append(0)
+        self.response_time.append(0)
+        self.completed.append(0)
+
+    def extend(self, pids, arrival_times, burst_times, priorities=None):
+        """Add many processes to the end of the table at once, priorities default to 0."""
+        processes_count = len(pids)
+        if len(arrival_times) != processes_count or len(burst_times) != processes_count:
+            raise ValueError("All columns must have the same length")
+        if priorities is not None and len(priorities) != processes_count:
+            raise ValueError("All columns must have the same length")
+
+        zeros = bytes(8 * processes_count)
+        self.pid.extend(pids)
+        self.arrival_time.extend(arrival_times)
+        self.burst_time.extend(burst_times)
+        if priorities is None:
+            self.priority.frombytes(zeros)
+        else:
+            self.priority.extend(priorities)
+        self.remaining_time.extend(burst_times)
+        self.starting_time.extend(array("q", [-1]) * processes_count)
+        for column in (self.completion_time, self.turnaround_time, self.waiting_time, self.response_time):
+            column.frombytes(zeros)
+        self.completed.extend(bytes(processes_count))
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.pid)
+        if not 0 <= index < len(self.pid):
+            raise IndexError("ProcessTable index out of range")
+        return ProcessRow(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.pid)):
+            yield ProcessRow(self, index)
+
+
+class ProcessRow:
+    """Process-compatible view of one row of a ProcessTable."""
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    @property
+    def completed(self):
+        return bool(self.table.completed[self.index])
+
+    @completed.setter
+    def completed(self, value):
+        self.table.completed[self.index] = bool(value)
+
+
+def _column_property(name):
+    def getter(row):
+        return getattr(row.table, name)[row.index]
+
+    def setter(row, value):
+        getattr(row.table, name)[row.index] = value
+
+    return property(getter, setter)
+
+
+for _name in TABLE_COLUMNS:
+    setattr(ProcessRow, _name, _column_property(_name))
+
+
+class Workload:
+    """
+    Immutable input of a scheduling run.
+    Holds the pid, arrival time, burst time and priority columns as
+    read-only memoryviews, so one workload can be scheduled any number
+    of times, by any number of threads, without being copied.
+    """
+
+    __slots__ = ("pid", "arrival_time", "burst_time", "priority")
+
+    def __init__(self, pids, arrival_times, burst_times, priorities=None):
+        columns = [array("q", pids), array("q", arrival_times), array("q", burst_times)]
+        if priorities is None:
+            columns.append(array("q", bytes(8 * len(columns[0]))))
+        else:
+            columns.append(array("q", priorities))
+        if any(len(column) != len(columns[0]) for column in columns):
+            raise ValueError("All columns must have the same length")
+
+        for name, column in zip(self.__slots__, columns):
+            object.__setattr__(self, name, memoryview(column).toreadonly())
+
+    @classmethod
+    def from_processes(cls, processes):
+        """Build a workload from Process objects or a ProcessTable."""
+        if isinstance(processes, ProcessTable):
+            return cls(processes.pid, processes.arrival_time, processes.burst_time, processes.priority)
+        return cls(
+            [process.pid for process in processes],
+            [process.arrival_time for process in processes],
+            [process.burst_time for process in processes],
+            [process.priority for process in processes]
+        )
+
+    @classmethod
+    def from_buffer(cls, buffer, processes_count):
+        """
+        Wrap a buffer holding the pid, arrival time, burst time and priority
+        columns back to back as native int64 values, without copying it.
+        """
+        column_size = 8 * processes_count
+        data = memoryview(buffer).cast("B")
+        if len(data) < 4 * column_size:
+            raise ValueError("Buffer is too small for the given number of processes")
+
+        workload = object.__new__(cls)
+        for position, name in enumerate(cls.__slots__):
+            column = data[position * column_size:(position + 1) * column_size].cast("q")
+            object.__setattr__(workload, name, column.toreadonly())
+        return workload
+
+    def nbytes(self):
+        """Size of the buffer written by write_to()."""
+        return 32 * len(self)
+
+    def write_to(self, buffer):
+        """Copy the columns into a buffer in the layout read by from_buffer()."""
+        column_size = 8 * len(self)
+        data = memoryview(buffer).cast("B")
+        for position, name in enumerate(self.__slots__):
+            data[position * column_size:(position + 1) * column_size] = getattr(self, name).cast("B")
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Workload is immutable")
+
+    def __len__(self):
+        return len(self.pid)
@@ -0,0 +1,470 @@
+"""
+Scheduling Service
+Serves the scheduling algorithms over HTTP/JSON on a local TCP port or
+Unix socket, for tools that cannot import this package.
+
+Endpoints:
+    POST /schedule: Schedule the workload in the JSON body, an object with
+        algorithm, processes (a list of process objects, like JSON workload
+        files) and optionally time_quantum, cpus, balancing,
+        balance_interval, levels and boost_period. Answers the report of
+        `python -m scheduling run --json`, or {"error": ...} with status 400.
+    GET /algorithms: Names of the algorithms
+    GET /metrics: Queue depth, batch and latency statistics
+    GET /health: {"status": "ok"}
+
+Requests are micro-batched: the requests that arrive while the service
+waits batch_window seconds after the first one (up to batch_size requests
+or BATCH_BYTES of bodies) go to the worker process pool as one task, so
+many small workloads cost one round trip to a worker. The workers parse,
+schedule and encode the report. Reports of more than STREAM_ROWS Gantt
+chart segments and processes come back as int64 columns instead and are
+encoded a chunk at a time while they are sent with chunked transfer
+encoding, as fast as the client reads them, so their JSON is never held
+in memory as a whole (HTTP/1.0 clients get a Content-Length instead).
+Connections are kept alive (HTTP/1.1, or HTTP/1.0 with keep-alive).
+This module must never import PyQt5, so it can run on headless machines.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+
+from .algorithms import ALGORITHMS, schedule
+from .cli import PROCESS_FIELDS, build_report
+from .compare import _use_stored_results, worker_context
+from .gantt import IDLE, IDLE_PID
+from .policies import DEFAULT_LEVELS, mlfq_parameters
+from .workload import workload_from_records
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Most requests and seconds a batch waits for before it goes to a worker
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_BATCH_WINDOW = 0.002
+
+# Most bytes of request bodies in one batch, a larger request goes alone
+BATCH_BYTES = 1024 * 1024
+
+# Largest request body accepted
+MAX_BODY_BYTES = 256 * 1024 * 1024
+
+# Reports with more Gantt chart segments and processes than this are streamed
+STREAM_ROWS = 512
+
+# Size of the chunks of streamed reports, and rows encoded at a time
+CHUNK_BYTES = 64 * 1024
+ROWS_PER_PIECE = 256
+
+# Most header lines of a request
+MAX_HEADERS = 100
+
+# Requests whose latency the metrics keep
+LATENCY_WINDOW = 4096
+
+
+def _schedule_request(body):
+    """Schedule the request in a JSON body and return the encoded report."""
+    request = json.loads(body)
+    if not isinstance(request, dict):
+        raise ValueError("Request must be a JSON object")
+    algorithm = request.get("algorithm")
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown scheduling algorithm: {algorithm}")
+    workload = workload_from_records(request.get("processes"), with_priority="priority" in algorithm)
+    if not len(workload):
+        raise ValueError("Workload has no processes")
+
+    time_quantum = request.get("time_quantum")
+    if algorithm == "mlfq":
+        time_quantum = mlfq_parameters(
+            time_quantum, request.get("levels", DEFAULT_LEVELS), request.get("boost_period")
+        )
+    result = schedule(
+        workload, algorithm, time_quantum, cpus=request.get("cpus", 1),
+        balancing=request.get("balancing", "steal"), balance_interval=request.get("balance_interval")
+    )
+    if len(result) + sum(len(lane) for lane in result.lanes) <= STREAM_ROWS:
+        report = build_report(algorithm, request.get("time_quantum"), result)
+        if algorithm == "mlfq":
+            report["mlfq"] = time_quantum._asdict()
+        return json.dumps(report).encode()
+
+    # The same report, with the Gantt chart and process lists left as columns
+    head = {"algorithm": algorithm, "time_quantum": request.get("time_quantum"), "summary": result.summary()}
+    if result.gantt is None:
+        head["cpus"] = result.cpus
+    if algorithm == "mlfq":
+        head["mlfq"] = time_quantum._asdict()
+    workload = result.workload
+    columns = [bytes(column) for column in (
+        workload.pid, workload.arrival_time, workload.burst_time, workload.priority,
+        result.starting_time, result.completion_time
+    )]
+    columns += [metric.tobytes() for metric in (result.turnaround_time, result.waiting_time, result.response_time)]
+    return StreamedReport(
+        json.dumps(head).encode(), result.gantt is None,
+        [(bytes(lane.start), bytes(lane.end), bytes(lane.pid)) for lane in result.lanes], columns
+    )
+
+
+# Report of a large run: encoded head, whether it has lanes, start/end/pid of every lane and PROCESS_FIELDS columns
+StreamedReport = namedtuple("StreamedReport", ("head", "multi_core", "lanes", "columns"))
+
+_SEGMENT_FORMAT = '{"start": %d, "end": %d, "process": "%s"}'
+_PROCESS_FORMAT = "{" + ", ".join(f'"{name}": %d' for name in PROCESS_FIELDS) + "}"
+
+
+def _encode_segment(segment):
+    start, end, pid = segment
+    return _SEGMENT_FORMAT % (start, end, IDLE if pid == IDLE_PID else f"P{pid}")
+
+
+def _encode_rows(columns, encode_row):
+    # Comma separated rows of int64 columns, ROWS_PER_PIECE rows at a time
+    views = [memoryview(column).cast("q") for column in columns]
+    for first in range(0, len(views[0]), ROWS_PER_PIECE):
+        piece = ", ".join(map(encode_row, zip(*(view[first:first + ROWS_PER_PIECE] for view in views))))
+        yield piece.encode() if not first else b", " + piece.encode()
+
+
+def report_pieces(report):
+    """Yield the JSON of a StreamedReport in pieces, with the keys of build_report."""
+    yield report.head[:-1]
+    yield b', "lanes": [' if report.multi_core else b', "gantt_chart": '
+    for number, lane in enumerate(report.lanes):
+        yield b"[" if not number else b", ["
+        yield from _encode_rows(lane, _encode_segment)
+        yield b"]"
+    if report.multi_core:
+        yield b"]"
+    yield b', "processes": ['
+    yield from _encode_rows(report.columns, _PROCESS_FORMAT.__mod__)
+    yield b"]}"
+
+
+def _run_batch(bodies):
+    """
+    Worker task: schedule a batch of requests.
+
+    Returns:
+        list: (True, encoded report) or (False, error message) per request
+    """
+    outcomes = []
+    for body in bodies:
+        try:
+            outcomes.append((True, _schedule_request(body)))
+        except Exception as error:
+            # Malformed JSON, missing keys, values of the wrong type or out of the int64 range:
+            # only this request fails, the rest of the batch is still answered
+            outcomes.append((False, str(error)))
+    return outcomes
+
+
+class SchedulingService:
+    """
+    Micro-batching HTTP/JSON front end of a worker process pool.
+    Create it, await start() inside a running event loop and close() it
+    when done, or call serve().
+    """
+
+    def __init__(self, workers=None, batch_size=DEFAULT_BATCH_SIZE, batch_window=DEFAULT_BATCH_WINDOW,
+                 cache_directory=None):
+        if batch_size <= 0:
+            raise ValueError("Batch size must be greater than 0")
+        if batch_window < 0:
+            raise ValueError("Batch window cannot be negative")
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.cache_directory = cache_directory
+        self.executor = None
+        self.server = None
+        self.pending = deque()  # (body, future) of the requests waiting for a batch
+        self.in_flight = 0  # Requests in batches sent to the workers
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.batched_requests = 0
+        self.connections = 0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.started = None
+        self._wakeup = None
+        self._slots = None
+        self._batcher = None
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT, path=None):
+        """Start the worker pool and listen on host and port, or on the Unix socket path."""
+        initializer, initargs = None, ()
+        if self.cache_directory is not None:
+            initializer, initargs = _use_stored_results, (self.cache_directory,)
+        # Workers forked from the event loop would inherit the listening socket and client connections
+        self.executor = ProcessPoolExecutor(
+            self.workers, mp_context=worker_context(), initializer=initializer, initargs=initargs
+        )
+        # Start the fork server and a first worker before listening, so startup errors show right away
+        await asyncio.get_running_loop().run_in_executor(self.executor, _run_batch, [])
+        self._wakeup = asyncio.Event()
+        # Two batches per worker in flight, so a worker never waits for the next one
+        self._slots = asyncio.Semaphore(2 * self.workers)
+        self._batcher = asyncio.create_task(self._run_batches())
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self._handle_connection, path)
+        else:
+            self.server = await asyncio.start_server(self._handle_connection, host, port)
+        self.started = time.monotonic()
+        return self.server
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self._batcher is not None:
+            self._batcher.cancel()
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+
+    def metrics(self):
+        """Return the statistics served at /metrics, latencies in milliseconds."""
+        latencies = sorted(self.latencies)
+
+        def percentile(fraction):
+            return latencies[min(int(fraction * len(latencies)), len(latencies) - 1)] * 1000 if latencies else 0.0
+
+        uptime = time.monotonic() - self.started if self.started is not None else 0.0
+        return {
+            "queue_depth": len(self.pending),
+            "in_flight": self.in_flight,
+            "connections": self.connections,
+            "requests": self.requests,
+            "errors": self.errors,
+            "requests_per_second": self.requests / uptime if uptime else 0.0,
+            "batches": self.batches,
+            "batch_size_avg": self.batched_requests / self.batches if self.batches else 0.0,
+            "latency_ms_p50": percentile(0.5),
+            "latency_ms_p90": percentile(0.9),
+            "latency_ms_p99": percentile(0.99),
+            "latency_ms_max": latencies[-1] * 1000 if latencies else 0.0,
+            "workers": self.workers,
+            "uptime_seconds": uptime,
+        }
+
+    async def _run_batches(self):
+        # Collects waiting requests into batches and sends them to the workers
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self.pending:
+                await self._slots.acquire()
+                batch = self._take_batch()
+                if len(batch) < self.batch_size and self.batch_window:
+                    # Give concurrent requests a moment to join the batch
+                    await asyncio.sleep(self.batch_window)
+                    batch.extend(self._take_batch(batch))
+                self.batches += 1
+                self.batched_requests += len(batch)
+                self.in_flight += len(batch)
+                task = loop.run_in_executor(self.executor, _run_batch, [body for body, _ in batch])
+                task.add_done_callback(lambda task, batch=batch: self._finish_batch(task, batch))
+
+    def _take_batch(self, batch=()):
+        # Waiting requests up to the batch limits, always at least one when starting a batch
+        size = len(batch)
+        nbytes = sum(len(body) for body, _ in batch)
+        taken = []
+        while self.pending and size < self.batch_size:
+            body = self.pending[0][0]
+            if size and nbytes + len(body) > BATCH_BYTES:
+                break
+            taken.append(self.pending.popleft())
+            size += 1
+            nbytes += len(body)
+        return taken
+
+    def _finish_batch(self, task, batch):
+        self._slots.release()
+        self.in_flight -= len(batch)
+        if task.cancelled():
+            return
+        error = task.exception()
+        for position, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(task.result()[position])
+
+    async def _schedule(self, body):
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((body, future))
+        self._wakeup.set()
+        return await future
+
+    async def _handle_connection(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    request_line = await reader.readline()
+                except ValueError:
+                    # Longer than the limit of the stream reader
+                    await self._respond(writer, HTTPStatus.REQUEST_URI_TOO_LONG, {"error": "Request line too long"}, False)
+                    break
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self._respond(writer, HTTPStatus.BAD_REQUEST, {"error": "Malformed request line"}, False)
+                    break
+                try:
+                    headers = await self._read_headers(reader)
+                except ValueError:
+                    await self._respond(
+                        writer, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, {"error": "Headers too large"}, False
+                    )
+                    break
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                if "chunked" in headers.get("transfer-encoding", "").lower():
+                    await self._respond(writer, HTTPStatus.LENGTH_REQUIRED, {"error": "Content-Length required"}, False)
+                    break
+                try:
+                    length = int(headers.get("content-length", 0))
+                except ValueError:
+                    length = -1
+                if not 0 <= length <= MAX_BODY_BYTES:
+                    await self._respond(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "Invalid body size"}, False)
+                    break
+                if length and headers.get("expect", "").lower() == "100-continue":
+                    writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+                body = await reader.readexactly(length) if length else b""
+
+                started = time.monotonic()
+                await self._dispatch(writer, method, target.partition("?")[0], body, keep_alive, version == "HTTP/1.1")
+                self.latencies.append(time.monotonic() - started)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            # The client went away mid-request
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def _read_headers(self, reader):
+        # Header lines up to the blank line, ValueError when a line or their number is over the limit
+        headers = {}
+        for _ in range(MAX_HEADERS + 1):
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                return headers
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        raise ValueError("Too many headers")
+
+    async def _dispatch(self, writer, method, path, body, keep_alive, chunked):
+        self.requests += 1
+        if path == "/schedule":
+            if method != "POST":
+                await self._respond(writer, HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Use POST"}, keep_alive)
+                return
+            try:
+                succeeded, outcome = await self._schedule(body)
+            except Exception as error:
+                await self._respond(writer, HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(error)}, keep_alive)
+                return
+            if succeeded:
+                await self._respond(writer, HTTPStatus.OK, outcome, keep_alive, chunked)
+            else:
+                await self._respond(writer, HTTPStatus.BAD_REQUEST, {"error": outcome}, keep_alive)
+        elif path in ("/algorithms", "/metrics", "/health"):
+            if method != "GET":
+                await self._respond(writer, HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Use GET"}, keep_alive)
+            elif path == "/algorithms":
+                await self._respond(writer, HTTPStatus.OK, {"algorithms": list(ALGORITHMS)}, keep_alive)
+            elif path == "/metrics":
+                await self._respond(writer, HTTPStatus.OK, self.metrics(), keep_alive)
+            else:
+                await self._respond(writer, HTTPStatus.OK, {"status": "ok"}, keep_alive)
+        else:
+            await self._respond(writer, HTTPStatus.NOT_FOUND, {"error": f"Unknown path: {path}"}, keep_alive)
+
+    async def _respond(self, writer, status, body, keep_alive, chunked=False):
+        # body is an encoded report, a StreamedReport or a dict to encode
+        if status >= 400:
+            self.errors += 1
+        if isinstance(body, StreamedReport) and not chunked:
+            # HTTP/1.0 has no chunked transfer encoding, the length comes first
+            body = b"".join(report_pieces(body))
+        elif isinstance(body, dict):
+            body = json.dumps(body).encode()
+        head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n")
+        if isinstance(body, bytes):
+            writer.write(f"{head}Content-Length: {len(body)}\r\n\r\n".encode() + body)
+            await writer.drain()
+            return
+
+        # Encode the report a chunk at a time, as fast as the client reads it
+        writer.write(f"{head}Transfer-Encoding: chunked\r\n\r\n".encode())
+        pieces = []
+        size = 0
+        for piece in report_pieces(body):
+            pieces.append(piece)
+            size += len(piece)
+            if size >= CHUNK_BYTES:
+                await self._write_chunk(writer, b"".join(pieces))
+                pieces.clear()
+                size = 0
+        if pieces:
+            await self._write_chunk(writer, b"".join(pieces))
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    async def _write_chunk(self, writer, chunk):
+        writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        await writer.drain()
+        # Let other connections run between chunks, drain only waits when the client is slow
+        await asyncio.sleep(0)
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, path=None, workers=None, batch_size=DEFAULT_BATCH_SIZE,
+          batch_window=DEFAULT_BATCH_WINDOW, cache_directory=None):
+    """
+    Run the service until interrupted.
+
+    Args:
+        host: Address to listen on
+        port: TCP port to listen on
+        path: Unix socket to listen on instead of host and port
+        workers: Number of worker processes, the CPU count by default
+        batch_size: Most requests per batch
+        batch_window: Seconds a batch waits for more requests, 0 to send every request at once
+        cache_directory: Directory the workers store and reuse results in
+    """
+    service = SchedulingService(workers, batch_size, batch_window, cache_directory)
+
+    async def run():
+        server = await service.start(host, port, path)
+        address = path or f"http://{host}:{server.sockets[0].getsockname()[1]}"
+        print(f"Serving the schedulers on {address} with {service.workers} workers", file=sys.stderr)
+        try:
+            await server.serve_forever()
+        finally:
+            await service.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,245 @@
+"""
+Streaming Scheduler
+Schedules an arrival-sorted stream of processes incrementally.
+
+Processes are pulled from the input only when simulated time reaches their
+arrival, and Gantt chart segments and completed processes are yielded as
+soon as they are known. Only processes that have arrived but not completed
+are held in memory, so traces of any length can be scheduled.
+
+Args of stream_schedule:
+    processes: Iterable of (pid, arrival_time, burst_time, priority) tuples
+        sorted by arrival time, e.g. from workload.iter_trace()
+    algorithm: Name of the algorithm, one of STREAM_ALGORITHMS
+    time_quantum: Time slice for Round Robin
+
+Yields:
+    Segment and CompletedProcess tuples, in time order
+"""
+
+from collections import deque, namedtuple
+
+from .algorithms import ALGORITHMS, PREEMPTIVE_ALGORITHMS, _ready_queue
+from .gantt import IDLE
+
+Segment = namedtuple("Segment", ("start", "end", "label"))
+
+CompletedProcess = namedtuple("CompletedProcess", (
+    "pid", "arrival_time", "burst_time", "priority", "starting_time",
+    "completion_time", "turnaround_time", "waiting_time", "response_time"
+))
+
+# Algorithms that can schedule a stream, all but CFS and MLFQ
+STREAM_ALGORITHMS = tuple(algorithm for algorithm in ALGORITHMS if algorithm not in ("cfs", "mlfq"))
+
+
+class _LiveProcesses:
+    """
+    Columns of the processes that have arrived but not completed, as dicts
+    keyed by row number, so the ready queues can index them like the
+    columns of a Workload.
+    """
+
+    __slots__ = ("pid", "arrival_time", "burst_time", "priority", "remaining_time", "starting_time", "rows")
+
+    def __init__(self):
+        self.pid = {}
+        self.arrival_time = {}
+        self.burst_time = {}
+        self.priority = {}
+        self.remaining_time = {}
+        self.starting_time = {}
+        self.rows = 0
+
+    def __len__(self):
+        return len(self.pid)
+
+    def add(self, pid, arrival_time, burst_time, priority):
+        row = self.rows
+        self.rows += 1
+        self.pid[row] = pid
+        self.arrival_time[row] = arrival_time
+        self.burst_time[row] = burst_time
+        self.priority[row] = priority
+        self.remaining_time[row] = burst_time
+        self.starting_time[row] = -1
+        return row
+
+    def complete(self, row, completion_time):
+        """Forget a completed process and return its metrics."""
+        pid = self.pid.pop(row)
+        arrival_time = self.arrival_time.pop(row)
+        burst_time = self.burst_time.pop(row)
+        priority = self.priority.pop(row)
+        starting_time = self.starting_time.pop(row)
+        del self.remaining_time[row]
+        turnaround_time = completion_time - arrival_time
+        return CompletedProcess(
+            pid, arrival_time, burst_time, priority, starting_time, completion_time,
+            turnaround_time, turnaround_time - burst_time, starting_time - arrival_time
+        )
+
+
+class _Arrivals:
+    """Arrival-sorted process source with one process of lookahead."""
+
+    def __init__(self, processes, live):
+        self.processes = iter(processes)
+        self.live = live
+        self.pending = next(self.processes, None)
+        self.last_arrival = None
+
+    def next_arrival_time(self):
+        """Arrival time of the next process, or None when the stream is exhausted."""
+        return self.pending[1] if self.pending is not None else None
+
+    def admit(self, current_time):
+        """
+        Add every process that has arrived by current_time to the live
+        processes, returning their rows ordered by arrival time, then PID.
+        """
+        arrived = []
+        while self.pending is not None and self.pending[1] <= current_time:
+            arrival_time = self.pending[1]
+            if self.last_arrival is not None and arrival_time < self.last_arrival:
+                raise ValueError("Process stream must be sorted by arrival time")
+            self.last_arrival = arrival_time
+            arrived.append(self.pending)
+            self.pending = next(self.processes, None)
+
+        arrived.sort(key=lambda process: (process[1], process[0]))
+        return [self.live.add(*process) for process in arrived]
+
+
+def _stream_non_preemptive(arrivals, live, ready_queue):
+    current_time = 0
+
+    while ready_queue or arrivals.next_arrival_time() is not None:
+        # No process available, CPU stays idle until the next arrival
+        if not ready_queue and arrivals.next_arrival_time() > current_time:
+            yield Segment(current_time, arrivals.next_arrival_time(), IDLE)
+            current_time = arrivals.next_arrival_time()
+
+        # Add newly arrived processes to ready queue
+        for row in arrivals.admit(current_time):
+            ready_queue.push(row)
+
+        # Execute selected process
+        row = ready_queue.pop(current_time)
+        live.starting_time[row] = start = current_time
+        current_time += live.burst_time[row]
+        yield Segment(start, current_time, f"P{live.pid[row]}")
+        yield live.complete(row, current_time)
+
+
+def _stream_preemptive(arrivals, live, ready_queue):
+    current_time = 0
+    segment_start = 0
+    last_row = -1
+
+    while ready_queue or arrivals.next_arrival_time() is not None:
+        # No process available, CPU stays idle until the next arrival
+        if not ready_queue and arrivals.next_arrival_time() > current_time:
+            yield Segment(current_time, arrivals.next_arrival_time(), IDLE)
+            current_time = arrivals.next_arrival_time()
+
+        # Add newly arrived processes to ready queue
+        for row in arrivals.admit(current_time):
+            ready_queue.push(row)
+
+        row = ready_queue.pop(current_time)
+
+        # Close the segment of the preempted process when another one takes over
+        if row != last_row:
+            if last_row != -1:
+                yield Segment(segment_start, current_time, f"P{live.pid[last_row]}")
+            segment_start = current_time
+            last_row = row
+
+        # Set starting time on first execution
+        if live.starting_time[row] == -1:
+            live.starting_time[row] = current_time
+
+        # Execute until completion or the next arrival
+        run_until = current_time + live.remaining_time[row]
+        next_arrival_time = arrivals.next_arrival_time()
+        if next_arrival_time is not None and next_arrival_time < run_until:
+            run_until = next_arrival_time
+        live.remaining_time[row] -= run_until - current_time
+        current_time = run_until
+
+        # Check if process completed
+        if live.remaining_time[row] == 0:
+            yield Segment(segment_start, current_time, f"P{live.pid[row]}")
+            yield live.complete(row, current_time)
+            last_row = -1
+        else:
+            ready_queue.push(row)
+
+
+def _stream_round_robin(arrivals, live, time_quantum):
+    current_time = 0
+    segment_start = 0
+    last_row = -1
+    ready_queue = deque()
+
+    while ready_queue or arrivals.next_arrival_time() is not None:
+        # Add newly arrived processes to ready queue
+        ready_queue.extend(arrivals.admit(current_time))
+
+        # No process in ready queue, CPU stays idle until the next arrival
+        if not ready_queue:
+            yield Segment(current_time, arrivals.next_arrival_time(), IDLE)
+            current_time = arrivals.next_arrival_time()
+            continue
+
+        row = ready_queue.popleft()
+
+        # Close the segment of the previous process when another one takes over
+        if row != last_row:
+            if last_row != -1:
+                yield Segment(segment_start, current_time, f"P{live.pid[last_row]}")
+            segment_start = current_time
+            last_row = row
+
+        # Set starting time on first execution
+        if live.starting_time[row] == -1:
+            live.starting_time[row] = current_time
+
+        # Execute for time quantum or until completion
+        execution_time = min(time_quantum, live.remaining_time[row])
+        live.remaining_time[row] -= execution_time
+        current_time += execution_time
+
+        # Add newly arrived processes to ready queue during execution,
+        # ahead of the process that was just preempted
+        ready_queue.extend(arrivals.admit(current_time))
+
+        # Check if process completed
+        if live.remaining_time[row] == 0:
+            yield Segment(segment_start, current_time, f"P{live.pid[row]}")
+            yield live.complete(row, current_time)
+            last_row = -1
+        else:
+            ready_queue.append(row)
+
+
+def stream_schedule(processes, algorithm, time_quantum=None):
+    """Schedule a process stream incrementally, see the module docstring."""
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown scheduling algorithm: {algorithm}")
+    if algorithm not in STREAM_ALGORITHMS:
+        raise ValueError(f"{algorithm} cannot schedule a stream")
+    if algorithm == "rr" and (time_quantum is None or time_quantum <= 0):
+        raise ValueError("Time quantum must be greater than 0")
+
+    live = _LiveProcesses()
+    arrivals = _Arrivals(processes, live)
+
+    if algorithm == "rr":
+        return _stream_round_robin(arrivals, live, time_quantum)
+    # The ready queue of schedule(), with the same tie-breakers, over the columns of the live processes
+    ready_queue = _ready_queue(live, algorithm, live.remaining_time)
+    if algorithm in PREEMPTIVE_ALGORITHMS:
+        return _stream_preemptive(arrivals, live, ready_queue)
+    return _stream_non_preemptive(arrivals, live, ready_queue)
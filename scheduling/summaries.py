@@ -0,0 +1,79 @@
+"""
+Small Schedule Summaries
+The statistics of metrics.summarize() computed in plain Python.
+
+Importing NumPy takes longer than summarizing a few thousand processes
+without it, so schedule results use this module for schedules of up to
+PLAIN_PROCESSES processes and metrics only for larger ones. One-off runs
+of small workloads, like most CLI runs and service requests, then never
+import NumPy. Percentiles interpolate linearly like np.percentile; the
+fairness index can differ from the NumPy one in the last bits, its sums
+are added up in another order.
+"""
+
+# Waiting time percentiles reported by summarize()
+WAITING_TIME_PERCENTILES = (50, 90, 99)
+
+# Most processes summarized in plain Python
+PLAIN_PROCESSES = 4096
+
+
+def _percentile(sorted_values, percentile):
+    """Percentile of sorted values, interpolated between the two nearest like np.percentile."""
+    position = (percentile / 100) * (len(sorted_values) - 1)
+    lower = int(position)
+    fraction = position - lower
+    below = sorted_values[lower]
+    above = sorted_values[min(lower + 1, len(sorted_values) - 1)]
+    # Interpolated from the nearer value, as NumPy does
+    if fraction >= 0.5:
+        return float(above - (above - below) * (1 - fraction))
+    return float(below + (above - below) * fraction)
+
+
+def jain_fairness(values):
+    """Jain's fairness index of the values, see metrics.jain_fairness."""
+    square_sum = sum(value * value for value in values)
+    if square_sum == 0:
+        return 1.0
+    return sum(values) ** 2 / (len(values) * square_sum)
+
+
+def summarize(arrival_time, burst_time, starting_time, completion_time, cpus=1):
+    """
+    Calculate the statistics of a whole schedule, see metrics.summarize.
+
+    Args:
+        cpus: Number of CPUs the processes were scheduled on
+
+    Returns:
+        dict: The same statistics as metrics.summarize
+    """
+    processes_count = len(arrival_time)
+    if processes_count == 0:
+        raise ValueError("Cannot summarize a schedule without processes")
+
+    turnaround_time = [completion - arrival for completion, arrival in zip(completion_time, arrival_time)]
+    waiting_time = [turnaround - burst for turnaround, burst in zip(turnaround_time, burst_time)]
+    response_time = [start - arrival for start, arrival in zip(starting_time, arrival_time)]
+
+    # The schedule spans from the first arrival to the last completion
+    makespan = max(completion_time) - min(arrival_time)
+    busy_time = sum(burst_time)
+
+    summary = {
+        "turnaround_time_avg": sum(turnaround_time) / processes_count,
+        "waiting_time_avg": sum(waiting_time) / processes_count,
+        "response_time_avg": sum(response_time) / processes_count
+    }
+    sorted_waiting_time = sorted(waiting_time)
+    summary["waiting_time_max"] = sorted_waiting_time[-1]
+    for percentile in WAITING_TIME_PERCENTILES:
+        summary[f"waiting_time_p{percentile}"] = _percentile(sorted_waiting_time, percentile)
+    summary["makespan"] = makespan
+    summary["throughput"] = processes_count / makespan if makespan else 0.0
+    summary["cpu_utilization"] = busy_time / (makespan * cpus) if makespan else 0.0
+    summary["jain_fairness"] = jain_fairness(
+        [turnaround / burst for turnaround, burst in zip(turnaround_time, burst_time)]
+    )
+    return summary
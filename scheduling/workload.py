@@ -0,0 +1,216 @@
+"""
+Workload Files
+Reads processes from CSV or JSON files into a Workload, or lazily from
+CSV or JSON Lines traces for the streaming scheduler. Columnar binary
+files (.bin, see columnar) are memory-mapped instead of parsed.
+
+CSV files need a header row, JSON files hold a list of objects (or an
+object with a "processes" list) and JSON Lines files hold one object per
+line. Pasted text (parse_text) may also be tab, semicolon or whitespace
+separated, and without a header. Columns/keys:
+    pid: Process ID (optional, numbered from 1 in file order when missing)
+    arrival_time: Arrival time (also accepted as "arrival" or "at")
+    burst_time: Burst time (also accepted as "burst" or "bt")
+    priority: Priority level (optional)
+"""
+
+import csv
+import itertools
+import json
+import os
+
+from . import columnar
+from .process import Workload
+
+# Accepted spellings of each column, compared case-insensitively
+COLUMN_ALIASES = {
+    "pid": ("pid",),
+    "arrival_time": ("arrival_time", "arrival", "at"),
+    "burst_time": ("burst_time", "burst", "bt"),
+    "priority": ("priority",),
+}
+
+
+def check_process(arrival_time, burst_time, priority=None):
+    """Apply the same rules as the GUI input fields, raising ValueError on invalid values."""
+    # Error: arrival time cannot be negative and burst time cannot be negative or zero
+    if arrival_time < 0 or burst_time <= 0:
+        raise ValueError("Arrival cannot be negative and Burst time must be greater than 0")
+    # Error: priority cannot be negative or zero
+    if priority is not None and priority <= 0:
+        raise ValueError("Priority must be greater than 0")
+
+
+def _resolve_columns(names):
+    """Map each canonical column name to the matching name used in the file."""
+    lowered = {name.strip().lower(): name for name in names}
+    columns = {}
+    for column, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in lowered:
+                columns[column] = lowered[alias]
+                break
+    for required in ("arrival_time", "burst_time"):
+        if required not in columns:
+            raise ValueError(f"Workload is missing the {required} column")
+    return columns
+
+
+def _parse_records(records, columns, with_priority):
+    """
+    Yield validated (pid, arrival_time, burst_time, priority) tuples from
+    records, dicts keyed by column name or lists indexed by column position.
+    """
+    pid_column = columns.get("pid")
+    priority_column = columns.get("priority")
+    arrival_column = columns["arrival_time"]
+    burst_column = columns["burst_time"]
+
+    for line, record in enumerate(records, start=1):
+        try:
+            pid = int(record[pid_column]) if pid_column is not None else line
+            arrival_time = int(record[arrival_column])
+            burst_time = int(record[burst_column])
+            priority = int(record[priority_column]) if priority_column is not None else None
+            if with_priority and priority is None:
+                raise ValueError("Priority is required")
+            check_process(arrival_time, burst_time, priority)
+        except (KeyError, TypeError, ValueError) as error:
+            raise ValueError(f"Invalid process #{line}: {error}") from None
+        yield pid, arrival_time, burst_time, priority or 0
+
+
+def _to_workload(parsed):
+    pids, arrival_times, burst_times, priorities = [], [], [], []
+    for pid, arrival_time, burst_time, priority in parsed:
+        pids.append(pid)
+        arrival_times.append(arrival_time)
+        burst_times.append(burst_time)
+        priorities.append(priority)
+    return Workload(pids, arrival_times, burst_times, priorities)
+
+
+def parse_csv(text, with_priority=False):
+    """Parse CSV text with a header row into a Workload."""
+    reader = csv.DictReader(text.splitlines())
+    columns = _resolve_columns(reader.fieldnames or ())
+    return _to_workload(_parse_records(reader, columns, with_priority))
+
+
+def parse_json(text, with_priority=False):
+    """Parse a JSON list of process objects into a Workload."""
+    records = json.loads(text)
+    if isinstance(records, dict):
+        records = records.get("processes")
+    return workload_from_records(records, with_priority)
+
+
+def workload_from_records(records, with_priority=False):
+    """Build a Workload from decoded JSON, a list of process objects."""
+    if not isinstance(records, list):
+        raise ValueError("JSON workload must be a list of processes")
+    if not records:
+        return Workload((), (), ())
+    if not isinstance(records[0], dict):
+        raise ValueError("JSON workload must be a list of processes")
+    columns = _resolve_columns(records[0].keys())
+    return _to_workload(_parse_records(records, columns, with_priority))
+
+
+def _is_integer(text):
+    try:
+        int(text)
+    except ValueError:
+        return False
+    return True
+
+
+def parse_text(text, with_priority=False):
+    """
+    Parse pasted text into a Workload: JSON, or rows separated by tabs
+    (as copied from a spreadsheet), commas, semicolons or whitespace.
+    Without a header row the columns are arrival time, burst time and,
+    optionally, priority.
+    """
+    if text.lstrip().startswith(("[", "{")):
+        return parse_json(text, with_priority)
+
+    lines = [line for line in text.splitlines() if line.strip()]
+    if not lines:
+        return Workload((), (), ())
+    delimiter = next((delimiter for delimiter in ("\t", ",", ";") if delimiter in lines[0]), None)
+    if delimiter is None:
+        rows = [line.split() for line in lines]
+    else:
+        rows = [[cell.strip() for cell in row] for row in csv.reader(lines, delimiter=delimiter)]
+
+    if not all(_is_integer(cell) for cell in rows[0]):
+        # Header row, resolved like a CSV header
+        header, rows = rows[0], rows[1:]
+        resolved = _resolve_columns(header)
+        columns = {column: header.index(name) for column, name in resolved.items()}
+    else:
+        columns = {"arrival_time": 0, "burst_time": 1}
+        if len(rows[0]) > 2:
+            columns["priority"] = 2
+    return _to_workload(_parse_records(rows, columns, with_priority))
+
+
+def read_workload(path, with_priority=False):
+    """
+    Read a workload file, choosing the format from its extension
+    (.json, .bin for columnar files, anything else is read as CSV).
+
+    Args:
+        path: Path of the workload file
+        with_priority: Require every process to have a priority
+    """
+    if os.path.splitext(path)[1].lower() == columnar.EXTENSION:
+        workload = columnar.load_workload(path)
+        # Missing priorities are stored as 0
+        if with_priority and min(workload.priority, default=1) <= 0:
+            raise ValueError("Priority is required")
+        return workload
+    with open(path, newline="") as file:
+        text = file.read()
+    if os.path.splitext(path)[1].lower() == ".json":
+        return parse_json(text, with_priority)
+    return parse_csv(text, with_priority)
+
+
+def _iter_json_lines(file):
+    for line in file:
+        if line.strip():
+            yield json.loads(line)
+
+
+def iter_trace(path, with_priority=False):
+    """
+    Lazily read a CSV, JSON Lines (.jsonl, .ndjson) or columnar (.bin)
+    trace, yielding validated (pid, arrival_time, burst_time, priority)
+    tuples one at a time. The file is never loaded into memory as a whole.
+
+    Args:
+        path: Path of the trace file
+        with_priority: Require every process to have a priority
+    """
+    if os.path.splitext(path)[1].lower() == columnar.EXTENSION:
+        workload = columnar.load_workload(path)
+        rows = zip(workload.pid, workload.arrival_time, workload.burst_time, workload.priority)
+        for line, (pid, arrival_time, burst_time, priority) in enumerate(rows, start=1):
+            if with_priority and priority <= 0:
+                raise ValueError(f"Invalid process #{line}: Priority is required")
+            yield pid, arrival_time, burst_time, priority
+        return
+    with open(path, newline="") as file:
+        if os.path.splitext(path)[1].lower() in (".jsonl", ".ndjson"):
+            records = _iter_json_lines(file)
+            first = next(records, None)
+            if first is None:
+                return
+            columns = _resolve_columns(first.keys())
+            yield from _parse_records(itertools.chain((first,), records), columns, with_priority)
+        else:
+            reader = csv.DictReader(file)
+            columns = _resolve_columns(reader.fieldnames or ())
+            yield from _parse_records(reader, columns, with_priority)
@@ -0,0 +1,43 @@
+"""
+Progress Reporter Test
+Cancels long runs before their first process completes.
+"""
+
+import threading
+import time
+
+import pytest
+
+from scheduling.algorithms import schedule
+from scheduling.observers import ProgressReporter, ScheduleCancelled
+from scheduling.process import Workload
+
+
+def long_workload(processes_count):
+    # Every process arrives at once, so no process completes before all of them ran for a while
+    return Workload(
+        range(1, processes_count + 1), [0] * processes_count, [20] * processes_count, [0] * processes_count
+    )
+
+
+@pytest.mark.parametrize("algorithm", ["rr", "cfs"])
+def test_cancel_before_first_completion(algorithm):
+    workload = long_workload(100000)
+    reports = []
+    cancel_event = threading.Event()
+    reporter = ProgressReporter(len(workload), lambda *report: reports.append(report), cancel_event)
+
+    timer = threading.Timer(0.3, cancel_event.set)
+    timer.start()
+    started = time.perf_counter()
+    try:
+        with pytest.raises(ScheduleCancelled):
+            schedule(workload, algorithm, 1, reporter)
+    finally:
+        timer.cancel()
+    elapsed = time.perf_counter() - started
+
+    assert reporter.completed == 0
+    assert elapsed < 1.5, elapsed
+    # Reports keep coming without completions
+    assert reports and reports[-1] == (0, len(workload))
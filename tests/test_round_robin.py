@@ -0,0 +1,146 @@
+"""
+Round Robin Regression Test
+Compares the deque-based Round Robin with the list-based implementation it
+replaced, kept below as the reference, on seeded random workloads.
+"""
+
+import random
+
+from scheduling.algorithms import round_robin, schedule
+from scheduling.gantt import IDLE
+from scheduling.process import Process, Workload
+
+METRIC_FIELDS = ("starting_time", "completion_time", "turnaround_time", "waiting_time", "response_time")
+
+
+def reference_round_robin(processes, processes_count, time_quantum):
+    """The list-based Round Robin that the deque-based one replaced."""
+    current_time = 0
+    completed_count = 0
+    gantt_chart = []
+    last_pid = -1
+
+    # Create ready queue - processes ordered by arrival, then PID
+    ready_queue = []
+    processes_copy = sorted(enumerate(processes), key=lambda x: (x[1].arrival_time, x[1].pid))
+    next_process_idx = 0
+
+    while completed_count < processes_count:
+        # Add newly arrived processes to ready queue
+        while next_process_idx < processes_count:
+            idx, process = processes_copy[next_process_idx]
+            if process.arrival_time <= current_time and not process.completed:
+                if idx not in [p[0] for p in ready_queue]:
+                    ready_queue.append((idx, process))
+                    next_process_idx += 1
+            else:
+                break
+
+        # No process in ready queue, advance time
+        if not ready_queue:
+            current_time += 1
+            continue
+
+        # Get process from front of queue
+        selected_index, process = ready_queue.pop(0)
+
+        # Set starting time on first execution
+        if process.starting_time == -1:
+            process.starting_time = current_time
+            process.response_time = current_time - process.arrival_time
+
+        # Add to gantt chart when process changes
+        if process.pid != last_pid:
+            gantt_chart.append((current_time, f"P{process.pid}"))
+            last_pid = process.pid
+
+        # Execute for time quantum or until completion
+        execution_time = min(time_quantum, process.remaining_time)
+        process.remaining_time -= execution_time
+        current_time += execution_time
+
+        # Add newly arrived processes to ready queue during execution
+        while next_process_idx < processes_count:
+            idx, proc = processes_copy[next_process_idx]
+            if proc.arrival_time <= current_time and not proc.completed:
+                if idx not in [p[0] for p in ready_queue] and idx != selected_index:
+                    ready_queue.append((idx, proc))
+                    next_process_idx += 1
+            else:
+                break
+
+        # Check if process completed
+        if process.remaining_time == 0:
+            process.completed = True
+            process.completion_time = current_time
+            process.turnaround_time = process.completion_time - process.arrival_time
+            process.waiting_time = process.turnaround_time - process.burst_time
+            completed_count += 1
+        else:
+            # Process not completed, add back to end of ready queue
+            ready_queue.append((selected_index, process))
+
+    gantt_chart.append((current_time, None))
+    return gantt_chart
+
+
+def without_idle(gantt_chart):
+    # The reference does not record idle time, the CPU just waits for the next arrival
+    return [entry for entry in gantt_chart if entry[1] != IDLE]
+
+
+def random_processes(rng):
+    """
+    Random processes with gaps between arrivals (idle CPU time), several
+    processes arriving at the same time and PIDs out of arrival order.
+    """
+    processes_count = rng.randint(1, 15)
+    arrival_times = [rng.choice((0, 0, 3, 3, 7)) + rng.randint(0, 20) for _ in range(processes_count)]
+    pids = rng.sample(range(1, 100), processes_count)
+    return [
+        (pid, arrival_time, rng.randint(1, 10), rng.randint(1, 5))
+        for pid, arrival_time in zip(pids, arrival_times)
+    ]
+
+
+def assert_matches_reference(specs, time_quantum):
+    expected_processes = [Process(*spec) for spec in specs]
+    expected = reference_round_robin(expected_processes, len(specs), time_quantum)
+
+    processes = [Process(*spec) for spec in specs]
+    assert without_idle(round_robin(processes, len(specs), time_quantum)) == expected
+    for process, expected_process in zip(processes, expected_processes):
+        for field in METRIC_FIELDS:
+            assert getattr(process, field) == getattr(expected_process, field), (field, specs, time_quantum)
+
+    result = schedule(Workload.from_processes([Process(*spec) for spec in specs]), "rr", time_quantum)
+    assert without_idle(result.gantt_chart) == expected
+    assert list(result.waiting_time) == [process.waiting_time for process in expected_processes]
+    assert list(result.response_time) == [process.response_time for process in expected_processes]
+
+
+def test_matches_reference_on_random_workloads():
+    for seed in range(500):
+        rng = random.Random(seed)
+        assert_matches_reference(random_processes(rng), rng.randint(1, 6))
+
+
+def test_idle_gap_between_arrivals():
+    specs = [(1, 0, 3, 1), (2, 10, 4, 1), (3, 10, 2, 1)]
+    assert_matches_reference(specs, 2)
+    result = schedule(Workload.from_processes([Process(*spec) for spec in specs]), "rr", 2)
+    assert (3, IDLE) in result.gantt_chart
+
+
+def test_simultaneous_arrivals_queue_by_pid():
+    # Processes arriving at the same time queue by PID, whatever their order in the input
+    specs = [(3, 0, 4, 1), (1, 0, 4, 1), (2, 0, 4, 1), (4, 2, 1, 1)]
+    assert_matches_reference(specs, 1)
+
+
+def test_arrival_queues_before_preempted_process():
+    # A process arriving at the end of a quantum runs before the process that used it up
+    specs = [(1, 0, 5, 1), (2, 2, 3, 1)]
+    assert_matches_reference(specs, 2)
+    result = schedule(Workload.from_processes([Process(*spec) for spec in specs]), "rr", 2)
+    assert result.gantt_chart[:3] == [(0, "P1"), (2, "P2"), (4, "P1")]
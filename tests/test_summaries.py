@@ -0,0 +1,57 @@
+"""
+Small Schedule Summaries Test
+Compares the plain Python summaries with the NumPy ones, and checks that
+a small CLI run does not import NumPy.
+"""
+
+import random
+import subprocess
+import sys
+
+import pytest
+
+from scheduling import metrics, summaries
+from scheduling.algorithms import ALGORITHMS, schedule
+from scheduling.process import Workload
+
+NO_NUMPY_RUN = """
+import sys
+from scheduling.cli import main
+main(["run", "fcfs", sys.argv[1]])
+assert "numpy" not in sys.modules, "numpy was imported"
+"""
+
+
+def random_workload(rng):
+    processes_count = rng.randint(1, 200)
+    return Workload(
+        range(1, processes_count + 1),
+        [rng.randint(0, 150) for _ in range(processes_count)],
+        [rng.randint(1, 20) for _ in range(processes_count)],
+        [rng.randint(1, 5) for _ in range(processes_count)]
+    )
+
+
+def test_matches_numpy_summaries():
+    rng = random.Random(0)
+    for _ in range(50):
+        workload = random_workload(rng)
+        for algorithm in ALGORITHMS:
+            for cpus in (1, 2) if algorithm not in ("cfs", "mlfq") else (1,):
+                columns = schedule(workload, algorithm, 3, cpus=cpus)._columns()
+                expected = metrics.summarize(*columns, cpus=cpus)
+                summary = summaries.summarize(*columns, cpus=cpus)
+                # Only the fairness index is not exact, its sums are added up in another order
+                assert summary["jain_fairness"] == pytest.approx(expected.pop("jain_fairness"), rel=1e-12)
+                del summary["jain_fairness"]
+                assert summary == expected
+
+
+def test_small_run_does_not_import_numpy(tmp_path):
+    path = tmp_path / "workload.csv"
+    path.write_text("pid,arrival_time,burst_time\n1,0,5\n2,1,3\n3,2,8\n")
+    completed = subprocess.run(
+        [sys.executable, "-c", NO_NUMPY_RUN, str(path)], capture_output=True, text=True
+    )
+    assert completed.returncode == 0, completed.stderr
+    assert '"summary"' in completed.stdout